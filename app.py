@@ -2,7 +2,8 @@
 
 import streamlit as st
 
-from etl.pipeline import extract_and_transform
+from components import load_breakdown
+from etl.pipeline import extract_and_transform, refresh_status
 from etl.cache import get_cache_info
 from views import overview, reservations, trends, expenses
 
@@ -36,10 +37,16 @@ if not check_password():
     st.stop()
 
 
-@st.cache_data(ttl=300)
+@st.cache_resource(ttl=300)
 def load_data(use_cache: bool = False):
-    """Load and cache all data from Google Sheets or local cache."""
-    return extract_and_transform(use_cache=use_cache)
+    """Load and cache all data from Google Sheets or local cache.
+
+    Cached loads return immediately and refresh stale entries in the
+    background, so the next load picks up any changes. Kept as a shared
+    resource rather than copied per rerun, so the result's group-by
+    indexes are built once.
+    """
+    return extract_and_transform(use_cache=use_cache, revalidate=use_cache)
 
 
 # Sidebar navigation
@@ -50,7 +57,19 @@ cache_info = get_cache_info()
 has_cache = cache_info["files"] > 0
 use_cached_data = st.sidebar.toggle("Use cached data", value=has_cache)
 if has_cache:
-    st.sidebar.caption(f"Cache: {cache_info['files']} files, from {cache_info['oldest']}")
+    notes = [f"{cache_info['files']} files"]
+    if cache_info["oldest"]:
+        notes.append(f"from {cache_info['oldest']}")
+    if cache_info["unknown"]:
+        notes.append(f"{cache_info['unknown']} of unknown age")
+    if cache_info["stale"]:
+        notes.append(f"{cache_info['stale']} stale")
+    refresh = refresh_status()
+    if refresh == "running":
+        notes.append("refreshing")
+    elif refresh == "failed":
+        notes.append("refresh failed")
+    st.sidebar.caption(f"Cache: {', '.join(notes)}")
 else:
     st.sidebar.caption("Cache: No cached data yet")
 
@@ -80,6 +99,9 @@ try:
 
     st.sidebar.divider()
     st.sidebar.caption(f"Data: {min(available_years)}-{max(available_years)}")
+    if data.report is not None:
+        with st.sidebar.expander("Load breakdown"):
+            load_breakdown(data.report)
 
     # Render selected page
     if page == "Overview":
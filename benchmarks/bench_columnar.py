@@ -0,0 +1,75 @@
+"""Compare model objects and RecordTables for memory and aggregation.
+
+Run with: python -m benchmarks.bench_columnar [reservations per year]
+"""
+
+from __future__ import annotations
+
+import gc
+import math
+import sys
+import timeit
+import tracemalloc
+
+from benchmarks.synthetic import workbook, workbook_records
+from etl.aggregates import MetricCube
+from etl.models import Expense, RecordTable, Reservation
+
+
+def revenue_by_year_platform_models(reservations: list[Reservation]) -> dict[tuple, float]:
+    totals: dict[tuple, float] = {}
+    for r in reservations:
+        key = (r.year, r.platform)
+        totals[key] = totals.get(key, 0.0) + r.total_revenue
+    return totals
+
+
+def revenue_by_year_platform_table(table: RecordTable[Reservation]) -> dict[tuple, float]:
+    frame = table.to_frame(["year", "platform", "total_revenue"])
+    return frame.groupby(["year", "platform"], observed=True, sort=False)["total_revenue"].sum().to_dict()
+
+
+def main(per_year: int = 100_000) -> None:
+    gc.collect()
+    tracemalloc.start()
+    reservations, expenses = workbook_records(workbook(per_year))
+    model_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    reservation_table = RecordTable.from_models(Reservation, reservations)
+    expense_table = RecordTable.from_models(Expense, expenses)
+    table_bytes = reservation_table.nbytes + expense_table.nbytes
+    rows = len(reservations) + len(expenses)
+
+    print(f"Memory ({len(reservations):,} reservations, {len(expenses):,} expenses)")
+    print(f"  {'models':16} {model_bytes / 2**20:8.1f} MiB  {model_bytes / rows:6.0f} B/record")
+    print(f"  {'RecordTable':16} {table_bytes / 2**20:8.1f} MiB  {table_bytes / rows:6.0f} B/record")
+
+    expected = revenue_by_year_platform_models(reservations)
+    totals = revenue_by_year_platform_table(reservation_table)
+    assert totals.keys() == expected.keys()
+    assert all(math.isclose(totals[key], expected[key]) for key in expected)
+    cases = {
+        "revenue by year and platform": (
+            lambda: revenue_by_year_platform_models(reservations),
+            lambda: revenue_by_year_platform_table(reservation_table),
+        ),
+        "MetricCube": (
+            lambda: MetricCube.from_records(reservations, expenses),
+            lambda: MetricCube.from_records(reservation_table, expense_table),
+        ),
+    }
+    print("Time")
+    for title, (models, table) in cases.items():
+        print(f"  {title}")
+        for name, fn in [("models", models), ("RecordTable", table)]:
+            seconds = min(timeit.repeat(fn, number=1, repeat=3))
+            print(f"    {name:14} {seconds * 1000:8.1f} ms")
+
+    # The price of going back to models, paid only where they are needed
+    seconds = min(timeit.repeat(reservation_table.to_models, number=1, repeat=3))
+    print(f"  materialize {len(reservation_table):,} reservations: {seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,43 @@
+"""Time transforms of many year shards in-process and across worker processes.
+
+Run with: python -m benchmarks.bench_parallel [shards] [rows per shard]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import timeit
+
+from benchmarks.bench_validation import YEAR
+from benchmarks.synthetic import expenses_sheet, rentals_sheet
+from etl.transform.parallel import TransformTask, run_transforms
+
+
+def make_tasks(shards: int, rows: int) -> list[TransformTask]:
+    """Alternating rentals and expense shards of the given size."""
+    tasks = []
+    for i in range(shards):
+        if i % 2:
+            tasks.append(TransformTask("expenses:pivot", YEAR, expenses_sheet(YEAR, rows, seed=i)))
+        else:
+            tasks.append(TransformTask("rentals", YEAR, rentals_sheet(YEAR, rows, seed=i)))
+    return tasks
+
+
+def main(shards: int = 32, rows: int = 20_000) -> None:
+    tasks = make_tasks(shards, rows)
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, cpus})
+    expected = run_transforms(tasks)
+
+    print(f"run_transforms ({shards} shards x {rows:,} rows, {cpus} CPUs)")
+    for processes in counts:
+        assert run_transforms(tasks, processes) == expected
+        seconds = min(timeit.repeat(lambda: run_transforms(tasks, processes), number=1, repeat=3))
+        print(f"  {processes:3} processes {seconds * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,129 @@
+"""Micro-benchmarks for the cell parsers.
+
+Run with: python -m benchmarks.bench_parsers [values]
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import sys
+import timeit
+from datetime import date, timedelta
+
+from etl.transform.parsers import (
+    _day_number,
+    _parse_date,
+    parse_currencies,
+    parse_currency,
+    parse_date,
+    parse_dates,
+)
+
+
+def legacy_parse_date(value: str, year_hint: int | None = None) -> date | None:
+    """parse_date as it was before the combined pattern and memo."""
+    if not value or not value.strip():
+        return None
+    cleaned = value.strip()
+    months = {
+        "jan": 1, "feb": 2, "mar": 3, "apr": 4,
+        "may": 5, "jun": 6, "jul": 7, "aug": 8,
+        "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+    }
+    for pattern in (r"(\d{1,2})-([A-Za-z]{3})-(\d{2,4})", r"(\d{1,2})/([A-Za-z]{3})/(\d{2,4})"):
+        match = re.match(pattern, cleaned)
+        if match:
+            month = months.get(match.group(2).lower())
+            if month is None:
+                return None
+            year = int(match.group(3))
+            if year < 100:
+                year = 2000 + year if year < 50 else 1900 + year
+            try:
+                return date(year, month, int(match.group(1)))
+            except ValueError:
+                return None
+    return None
+
+
+def legacy_parse_currency(value: str) -> float:
+    """parse_currency as it was before the translation table."""
+    if not value or not value.strip():
+        return 0.0
+    cleaned = value.strip()
+    negative = "-" in cleaned
+    cleaned = cleaned.replace("$", "").replace(",", "").replace("-", "").replace(" ", "")
+    try:
+        result = float(cleaned)
+        return -result if negative else result
+    except ValueError:
+        return 0.0
+
+
+def make_amounts(count: int, seed: int = 0) -> list[str]:
+    """Realistic revenue and expense cells."""
+    rng = random.Random(seed)
+    values = []
+    for _ in range(count):
+        amount = rng.randrange(100_000) / 100
+        values.append(rng.choice([f"${amount:,.2f}", f"${amount:,.0f}", f"-${amount:,.2f}", f"{amount}", ""]))
+    return values
+
+
+def time_cases(title: str, count: int, cases: dict) -> None:
+    print(title)
+    for name, fn in cases.items():
+        seconds = min(timeit.repeat(fn, number=1, repeat=5))
+        print(f"  {name:24} {seconds * 1000:8.1f} ms  {count / seconds / 1e6:6.2f} M/s")
+
+
+def make_dates(count: int, seed: int = 0) -> list[str]:
+    """Realistic check-in/check-out cells: a few years of days, both formats."""
+    rng = random.Random(seed)
+    values = []
+    for _ in range(count):
+        day = date(2017, 1, 1) + timedelta(days=rng.randrange(9 * 365))
+        if day.year < 2019:
+            values.append(f"{day.day}/{day:%b}/{day:%y}")
+        else:
+            values.append(f"{day.day}-{day:%b}-{day:%y}")
+    return values
+
+
+def main(count: int = 100_000) -> None:
+    values = make_dates(count)
+    assert [legacy_parse_date(v) for v in values] == [parse_date(v) for v in values]
+    assert parse_dates(values).astype(object).tolist() == [parse_date(v) for v in values]
+
+    def cold() -> list:
+        _parse_date.cache_clear()
+        _day_number.cache_clear()
+        return [parse_date(v) for v in values]
+
+    cases = {
+        "legacy parse_date": lambda: [legacy_parse_date(v) for v in values],
+        "parse_date (cold memo)": cold,
+        "parse_date (warm memo)": lambda: [parse_date(v) for v in values],
+        "parse_dates": lambda: parse_dates(values),
+    }
+    time_cases(f"{count:,} date strings, {len(set(values)):,} distinct", count, cases)
+
+    amounts = make_amounts(count)
+    assert [legacy_parse_currency(v) for v in amounts] == [parse_currency(v) for v in amounts]
+    time_cases(f"{count:,} currency strings, {len(set(amounts)):,} distinct", count, {
+        "legacy parse_currency": lambda: [legacy_parse_currency(v) for v in amounts],
+        "parse_currency": lambda: [parse_currency(v) for v in amounts],
+        "parse_currencies": lambda: parse_currencies(amounts),
+    })
+
+    # Cleaning fees and recurring bills: a handful of amounts, repeated
+    fees = [amounts[i % 20] for i in range(count)]
+    time_cases(f"{count:,} currency strings, {len(set(fees)):,} distinct", count, {
+        "parse_currency": lambda: [parse_currency(v) for v in fees],
+        "parse_currencies": lambda: parse_currencies(fees),
+    })
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
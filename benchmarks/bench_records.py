@@ -0,0 +1,88 @@
+"""Compare pydantic models and lightweight records for memory and build time.
+
+Memory is what each representation adds on top of the field values,
+which all of them share.
+
+Run with: python -m benchmarks.bench_records [rows]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import timeit
+import tracemalloc
+from dataclasses import astuple, dataclass
+from datetime import date
+
+from benchmarks.bench_validation import DATA_START, YEAR
+from benchmarks.synthetic import rentals_sheet
+from etl.models.bulk import build_models
+from etl.models.records import ReservationRecord, build_records, from_models, to_models
+from etl.models.reservation import Reservation
+from etl.transform.reservation import _reservation_fields
+
+
+@dataclass(frozen=True, slots=True)
+class SlottedReservation:
+    """A __slots__ dataclass alternative to ReservationRecord."""
+
+    year: int
+    platform: str
+    platform_raw: str
+    check_in: date
+    check_out: date
+    nights: int
+    guest_name: str
+    guest_count: int
+    total_revenue: float
+    cleaning_fee: float
+    is_rental: bool
+
+
+def retained_bytes(build) -> int:
+    """Memory still allocated after build() returns, while its result lives."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main(count: int = 200_000) -> None:
+    rows = rentals_sheet(YEAR, count)
+    records = [f for f in (_reservation_fields(r, YEAR) for r in rows[DATA_START:]) if f]
+    models = build_models(Reservation, records, "fast")
+    tuples = build_records(ReservationRecord, records, "fast")
+    assert tuples == from_models(ReservationRecord, models)
+    assert to_models(tuples) == models
+
+    cases = {
+        "pydantic, strict": lambda: build_models(Reservation, records, "strict"),
+        "pydantic, fast": lambda: build_models(Reservation, [dict(r) for r in records], "fast"),
+        "NamedTuple, strict": lambda: build_records(ReservationRecord, records, "strict"),
+        "NamedTuple, fast": lambda: build_records(ReservationRecord, records, "fast"),
+        "slots dataclass": lambda: [SlottedReservation(**r) for r in records],
+    }
+    assert [astuple(s) for s in cases["slots dataclass"]()] == tuples
+
+    print(f"Build {len(records):,} reservations from validated field values")
+    for name, fn in cases.items():
+        seconds = min(timeit.repeat(fn, number=1, repeat=3))
+        size = retained_bytes(fn)
+        print(f"  {name:20} {seconds * 1000:8.1f} ms  {size / len(records):6.0f} B/record")
+
+    conversions = {
+        "models -> records": lambda: from_models(ReservationRecord, models),
+        "records -> models": lambda: to_models(tuples),
+    }
+    print("Convert")
+    for name, fn in conversions.items():
+        seconds = min(timeit.repeat(fn, number=1, repeat=3))
+        print(f"  {name:20} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,64 @@
+"""Compare peak memory of the in-memory and streaming pipelines.
+
+A large synthetic rentals sheet is cached in a temporary directory,
+then aggregated into a MetricCube by extract_and_transform and by
+run_stream with an AggregateSink.
+
+Run with: python -m benchmarks.bench_stream [rows]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import etl.cache
+from benchmarks.synthetic import rentals_sheet
+from etl.cache import save_to_cache
+from etl.pipeline import extract_and_transform
+from etl.stream import AggregateSink, run_stream
+
+YEAR = 2025
+
+
+def measure(fn) -> tuple[float, float]:
+    """Run fn once; return (seconds, peak traced MiB)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak / 2**20
+
+
+def main(count: int = 200_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        etl.cache.CACHE_DIR = Path(tmp)
+        results = {}
+
+        def in_memory() -> None:
+            results["in memory"] = extract_and_transform([YEAR], use_cache=True).cube
+
+        def streaming() -> None:
+            sink = AggregateSink()
+            run_stream([YEAR], [sink], use_cache=True)
+            results["streaming"] = sink.cube
+
+        print(f"Aggregate {count:,} rental rows")
+        for name, fn in [("in memory", in_memory), ("streaming", streaming)]:
+            etl.cache.clear_cache()
+            save_to_cache(YEAR, "rentals", rentals_sheet(YEAR, count))
+            seconds, peak = measure(fn)
+            print(f"  {name:12} {seconds * 1000:8.0f} ms  peak {peak:8.1f} MiB")
+
+        assert results["streaming"].reservations(YEAR).count == results["in memory"].reservations(YEAR).count == count
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,40 @@
+"""Compare the transform engines on large rentals and expense sheets.
+
+Run with: python -m benchmarks.bench_transform [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from benchmarks.bench_validation import YEAR
+from benchmarks.synthetic import expenses_sheet, format_years, rentals_sheet
+from etl.transform.expense import transform_expenses
+from etl.transform.reservation import ENGINES, transform_rentals
+
+
+def report(title: str, count: int, run) -> None:
+    results = {engine: run(engine) for engine in ENGINES}
+    assert all(result == results["python"] for result in results.values())
+
+    print(f"{title} ({count:,} rows)")
+    for engine in ENGINES:
+        seconds = min(timeit.repeat(lambda: run(engine), number=1, repeat=3))
+        print(f"  {engine:8} {seconds:8.2f} s  {seconds / count * 1e6:6.2f} us/row")
+
+
+def main(count: int = 200_000) -> None:
+    rows = rentals_sheet(YEAR, count)
+    report("transform_rentals", count, lambda engine: transform_rentals(rows, YEAR, "fast", engine))
+
+    for format_type, year in format_years().items():
+        expense_rows = expenses_sheet(year, count)
+        report(
+            f"transform_expenses {format_type}", count,
+            lambda engine: transform_expenses(expense_rows, year, format_type, "fast", engine),
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,87 @@
+"""Time a full Trends page render on a large synthetic dataset.
+
+Compares the previous result, which regrouped records on every
+property access, with the frozen ETLResult and its cached indexes.
+Streamlit runs in bare mode, so charts are built but not displayed.
+
+Run with: python -m benchmarks.bench_trends [reservations per year]
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import timeit
+from dataclasses import dataclass
+
+from benchmarks.synthetic import workbook, workbook_records
+from etl.aggregates import MetricCube
+from etl.models.expense import Expense
+from etl.models.reservation import Reservation
+from etl.occupancy import OccupancyIndex
+from etl.pipeline import ETLResult
+from views import trends
+
+@dataclass
+class LegacyResult:
+    """The previous ETLResult: lists, regrouped on every property access."""
+
+    reservations: list[Reservation]
+    expenses: list[Expense]
+
+    @property
+    def reservations_by_year(self) -> dict[int, list[Reservation]]:
+        result: dict[int, list[Reservation]] = {}
+        for r in self.reservations:
+            result.setdefault(r.year, []).append(r)
+        return result
+
+    @property
+    def rentals_by_year(self) -> dict[int, list[Reservation]]:
+        return {y: [r for r in rs if r.is_rental] for y, rs in self.reservations_by_year.items()}
+
+    @property
+    def owner_stays_by_year(self) -> dict[int, list[Reservation]]:
+        return {y: [r for r in rs if not r.is_rental] for y, rs in self.reservations_by_year.items()}
+
+    @property
+    def expenses_by_year(self) -> dict[int, list[Expense]]:
+        result: dict[int, list[Expense]] = {}
+        for e in self.expenses:
+            result.setdefault(e.year, []).append(e)
+        return result
+
+    @property
+    def cube(self) -> MetricCube:
+        return MetricCube.from_records(self.reservations, self.expenses)
+
+    @property
+    def occupancy(self) -> OccupancyIndex:
+        return OccupancyIndex.from_reservations(self.reservations)
+
+
+def main(per_year: int = 20_000) -> None:
+    # Bare-mode Streamlit warns about the missing script run context on every call
+    logging.disable(logging.WARNING)
+
+    reservations, expenses = workbook_records(workbook(per_year))
+    legacy = LegacyResult(reservations, expenses)
+    indexed = ETLResult(reservations, expenses)
+
+    def cold() -> None:
+        trends.render(ETLResult(reservations, expenses))
+
+    cases = {
+        "legacy": lambda: trends.render(legacy),
+        "indexed, first": cold,
+        "indexed, rerun": lambda: trends.render(indexed),
+    }
+
+    print(f"Trends render ({len(reservations):,} reservations, {len(expenses):,} expenses)")
+    for name, fn in cases.items():
+        seconds = min(timeit.repeat(fn, number=1, repeat=3))
+        print(f"  {name:16} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
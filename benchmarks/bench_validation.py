@@ -0,0 +1,59 @@
+"""Compare per-row and bulk model validation on a large rentals sheet.
+
+Run with: python -m benchmarks.bench_validation [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from benchmarks.synthetic import rentals_sheet
+from etl.config.columns import get_column_map
+from etl.models.bulk import build_models
+from etl.models.reservation import Reservation
+from etl.transform.reservation import _reservation_fields, transform_rentals, transform_reservation
+
+YEAR = 2024
+
+# Rows before the first reservation in the YEAR layout
+DATA_START = get_column_map(YEAR).data_start_row
+
+
+def per_row(rows: list[list[str]]) -> list[Reservation]:
+    """The previous approach: one Reservation(**fields) call per row."""
+    result = []
+    for row in rows[DATA_START:]:
+        reservation = transform_reservation(row, YEAR)
+        if reservation is not None:
+            result.append(reservation)
+    return result
+
+
+def main(count: int = 100_000) -> None:
+    rows = rentals_sheet(YEAR, count)
+    records = [f for f in (_reservation_fields(r, YEAR) for r in rows[DATA_START:]) if f]
+
+    # Model construction alone, from already parsed field values
+    validate_cases = {
+        "per-row": lambda: [Reservation(**r) for r in records],
+        "bulk strict": lambda: build_models(Reservation, records, "strict"),
+        "bulk fast": lambda: build_models(Reservation, records, "fast"),
+    }
+    # The whole year transform, parsing included
+    transform_cases = {
+        "per-row": lambda: per_row(rows),
+        "bulk strict": lambda: transform_rentals(rows, YEAR, "strict"),
+        "bulk fast": lambda: transform_rentals(rows, YEAR, "fast"),
+    }
+    assert transform_cases["bulk fast"]() == transform_cases["bulk strict"]() == transform_cases["per-row"]()
+
+    for title, cases in [("validation", validate_cases), ("transform_rentals", transform_cases)]:
+        print(f"{title} ({count:,} rows)")
+        for name, fn in cases.items():
+            seconds = min(timeit.repeat(fn, number=1, repeat=3))
+            print(f"  {name:12} {seconds * 1000:8.1f} ms  {seconds / count * 1e6:6.2f} us/row")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,219 @@
+"""Benchmark suite over synthetic workbooks, with stored baselines.
+
+Times the parsers, the transforms for every rentals layout and expense
+format, ETLResult grouping, each view's render and a full cached load,
+then compares against baselines.json. Baselines are per machine, so
+the file is not checked in: save one on the machine you compare on.
+
+Run with: python -m benchmarks.suite [--rows N] [--filter TEXT] [--save]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+import etl.cache
+from benchmarks.synthetic import format_years, layout_years, rentals_sheet, save_workbook, workbook, workbook_records
+from etl.config.columns import get_column_map
+from etl.config.spreadsheets import SPREADSHEETS
+from etl.pipeline import ETLResult, _cache_entry, extract_and_transform
+from etl.transform.expense import transform_expenses
+from etl.transform.memo import clear_memo
+from etl.transform.parsers import _day_number, _parse_date, parse_currency, parse_date
+from etl.transform.reservation import transform_rentals
+from views import expenses, overview, reservations, trends
+
+BASELINES = Path(__file__).parent / "baselines.json"
+
+# A case is this much slower than its baseline before it counts as a regression
+DEFAULT_TOLERANCE = 0.25
+
+
+class Case(NamedTuple):
+    """A timed function and the number of rows or values it processes."""
+
+    fn: Callable[[], object]
+    rows: int
+
+
+def _cells(book: dict[tuple[int, str], list[list[str]]], field: str) -> list[str]:
+    """Every cell of a rentals field across a workbook's sheets."""
+    values = []
+    for (year, data_type), rows in book.items():
+        if data_type == "rentals":
+            col = get_column_map(year)
+            index = getattr(col, field)
+            values.extend(row[index] for row in rows[col.data_start_row:] if row[index])
+    return values
+
+
+def _uncached(fn: Callable[[], object]) -> Callable[[], object]:
+    """fn, run with the parsers' memos empty as on a fresh start."""
+    def run() -> object:
+        _parse_date.cache_clear()
+        _day_number.cache_clear()
+        return fn()
+    return run
+
+
+def build_cases(rows: int) -> dict[str, Case]:
+    """Every benchmark case, for sheets of the given number of rows."""
+    book = workbook(rows)
+    cases: dict[str, Case] = {}
+
+    dates = _cells(book, "check_in")
+    currencies = _cells(book, "total_revenue")
+    cases["parsers/parse_date"] = Case(_uncached(lambda: [parse_date(v) for v in dates]), len(dates))
+    cases["parsers/parse_currency"] = Case(lambda: [parse_currency(v) for v in currencies], len(currencies))
+
+    for layout, year in layout_years().items():
+        sheet = book.get((year, "rentals")) or rentals_sheet(year, rows)
+        for engine in ("python", "pandas"):
+            cases[f"transform_rentals/{layout}/{engine}"] = Case(
+                _uncached(lambda sheet=sheet, year=year, engine=engine: transform_rentals(sheet, year, "fast", engine)),
+                len(sheet),
+            )
+
+    for format_type, year in format_years().items():
+        sheet = book[_cache_entry(year, "expenses")]
+        for engine in ("python", "pandas"):
+            cases[f"transform_expenses/{format_type}/{engine}"] = Case(
+                lambda sheet=sheet, year=year, format_type=format_type, engine=engine: transform_expenses(
+                    sheet, year, format_type, "fast", engine,
+                ),
+                len(sheet),
+            )
+
+    all_reservations, all_expenses = workbook_records(book)
+    records = len(all_reservations) + len(all_expenses)
+
+    def grouping() -> None:
+        result = ETLResult(all_reservations, all_expenses)
+        for name in (
+            "reservations_by_year", "reservations_by_platform", "rentals_by_year",
+            "owner_stays_by_year", "expenses_by_year", "expenses_by_type",
+        ):
+            getattr(result, name)
+
+    cases["etl_result/grouping"] = Case(grouping, records)
+    cases["etl_result/cube"] = Case(lambda: ETLResult(all_reservations, all_expenses).cube, records)
+    cases["etl_result/occupancy"] = Case(lambda: ETLResult(all_reservations, all_expenses).occupancy, len(all_reservations))
+
+    # Views re-render on every interaction, against an already indexed result
+    data = ETLResult(all_reservations, all_expenses)
+    latest = max(SPREADSHEETS)
+    views = {
+        "overview": lambda: overview.render(data, latest),
+        "overview/all_time": lambda: overview.render(data, None),
+        "reservations": lambda: reservations.render(data, latest),
+        "trends": lambda: trends.render(data),
+        "expenses": lambda: expenses.render(data, latest),
+    }
+    for name, render in views.items():
+        cases[f"views/{name}"] = Case(render, records)
+
+    def cached_load() -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            previous, etl.cache.CACHE_DIR = etl.cache.CACHE_DIR, Path(tmp)
+            try:
+                save_workbook(book)
+                clear_memo()
+                extract_and_transform(use_cache=True)
+            finally:
+                etl.cache.CACHE_DIR = previous
+
+    cases["pipeline/cached_load"] = Case(_uncached(cached_load), sum(len(sheet) for sheet in book.values()))
+    return cases
+
+
+def run(cases: dict[str, Case], repeat: int = 3) -> dict[str, float]:
+    """Best time per call of each case over repeat runs, in seconds.
+
+    Short cases are called enough times per run to take at least 0.2s,
+    so their timings are not lost in noise.
+    """
+    results = {}
+    for name, case in cases.items():
+        timer = timeit.Timer(case.fn)
+        number, _ = timer.autorange()
+        results[name] = min(timer.repeat(repeat=repeat, number=number)) / number
+        print(f"  {name:40} {results[name] * 1000:10.2f} ms  {case.rows:>10,} rows", flush=True)
+    return results
+
+
+def load_baselines() -> dict:
+    """Saved baselines, keyed by rows per sheet."""
+    if not BASELINES.exists():
+        return {}
+    return json.loads(BASELINES.read_text())
+
+
+def save_baselines(rows: int, results: dict[str, float]) -> None:
+    """Save results as the baseline for this number of rows."""
+    baselines = load_baselines()
+    baselines[str(rows)] = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {name: round(seconds, 6) for name, seconds in sorted(results.items())},
+    }
+    BASELINES.write_text(json.dumps(baselines, indent=2) + "\n")
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], tolerance: float) -> list[str]:
+    """Print each case against its baseline; return the regressed cases."""
+    regressions = []
+    print(f"Against baseline (regression: more than {tolerance:.0%} slower)")
+    for name, seconds in results.items():
+        if name not in baseline:
+            print(f"  {name:40} {'new':>10}")
+            continue
+        ratio = seconds / baseline[name] if baseline[name] else float("inf")
+        flag = ""
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"  {name:40} {ratio:9.2f}x{flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000, help="reservation rows per rentals sheet (default: 2000)")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case; the best is kept (default: 3)")
+    parser.add_argument("--save", action="store_true", help="save the results as the baseline for --rows")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE,
+        help=f"slowdown over the baseline counted as a regression (default: {DEFAULT_TOLERANCE})",
+    )
+    args = parser.parse_args(argv)
+
+    # Bare-mode Streamlit warns about the missing script run context on every call
+    logging.disable(logging.WARNING)
+
+    cases = {name: case for name, case in build_cases(args.rows).items() if args.filter in name}
+    print(f"Benchmarks ({args.rows:,} rows per sheet)")
+    results = run(cases, args.repeat)
+
+    if args.save:
+        save_baselines(args.rows, results)
+        print(f"Saved baseline to {BASELINES.name}")
+        return 0
+
+    baseline = load_baselines().get(str(args.rows))
+    if baseline is None:
+        print(f"No baseline for --rows {args.rows}; run with --save to record one")
+        return 0
+    return 1 if compare(results, baseline["results"], args.tolerance) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""Synthetic raw spreadsheets in each year's real layout.
+
+Rows look like what Google Sheets returns for the real workbooks: every
+COLUMN_MAPS layout with its header rows, all three expense formats, the
+date and currency spellings seen in the source data, and the blank,
+blocked and total rows the transforms have to skip. Sizes scale from a
+handful of rows to millions.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+
+from etl.cache import save_to_cache
+from etl.config.categories import EXPENSE_MAP
+from etl.config.columns import COLUMN_MAPS, YEAR_LAYOUTS, get_column_map
+from etl.config.spreadsheets import SPREADSHEETS, first_year_for_sheet
+from etl.models.expense import Expense
+from etl.models.reservation import Reservation
+from etl.transform.expense import transform_expenses
+from etl.transform.reservation import transform_rentals
+
+# Raw platform spellings, weighted roughly as in the real sheets
+RAW_PLATFORMS = ["Airbnb"] * 5 + ["AirBnB", "VRBO", "VRBO", "HomeAway", "Offline", "Offline", "Self", "Friend"]
+
+# Raw expense types: mapped spellings plus types kept as they are
+RAW_EXPENSE_TYPES = list(EXPENSE_MAP) + [
+    "Electric", "Plumbing", "Water", "Windows", "Linens", "Repairs",
+    "Trash & recycling", "Septic pumping", "Pest control", "Other",
+]
+
+# Header text per rentals field
+_HEADERS = {
+    "platform": "Platform",
+    "check_in": "Check-in",
+    "check_out": "Check-out",
+    "nights": "# nights",
+    "guest_name": "Name",
+    "guest_count": "# guests",
+    "total_revenue": "Total",
+    "cleaning_fee": "Cleaning",
+}
+
+# One blank spacer row per this many reservations
+_BLANK_EVERY = 40
+
+
+def layout_years() -> dict[str, int]:
+    """A representative year for every COLUMN_MAPS layout."""
+    years: dict[str, int] = {}
+    for year, layout in sorted(YEAR_LAYOUTS.items(), reverse=True):
+        years.setdefault(layout, year)
+    return {layout: years[layout] for layout in COLUMN_MAPS}
+
+
+def format_years() -> dict[str, int]:
+    """A representative year for every expenses format."""
+    years: dict[str, int] = {}
+    for year in sorted(SPREADSHEETS, reverse=True):
+        years.setdefault(SPREADSHEETS[year].get("expenses_format", "pivot"), year)
+    return years
+
+
+def _date_cell(day: date, year: int, rng: random.Random) -> str:
+    """A date as the sheet for year spells it."""
+    if year <= 2017:
+        return f"{day.day}/{day:%b}/{day:%y}"
+    if rng.random() < 0.1:
+        return f"{day.day}-{day:%b}-{day.year}"
+    return f"{day.day}-{day:%b}-{day:%y}"
+
+
+def _currency_cell(amount: float, rng: random.Random) -> str:
+    if rng.random() < 0.3:
+        return f"${amount:,.2f}"
+    return f"${amount:,.0f}"
+
+
+def rentals_sheet(year: int, count: int, seed: int = 0) -> list[list[str]]:
+    """A year's rentals worksheet with count reservation rows.
+
+    Args:
+        year: Year whose layout (and sheet conventions) to use
+        count: Number of reservation rows, besides header, blank and
+            total rows
+        seed: Random seed; the same arguments give the same rows
+
+    Returns:
+        Rows padded to a rectangle, as Worksheet.get_all_values() gives
+    """
+    rng = random.Random(seed * 10_000 + year)
+    col = get_column_map(year)
+    fields = {name: getattr(col, name) for name in _HEADERS if getattr(col, name) is not None}
+    width = max(max(fields.values()) + 4, 20)
+
+    rows = [[""] * width for _ in range(col.data_start_row)]
+    for name, index in fields.items():
+        rows[col.header_row][index] = _HEADERS[name]
+    # The year labels the first column of the first row
+    rows[0][fields.get("platform", 0)] = str(year)
+
+    for i in range(count):
+        check_in = date(year, 1, 1) + timedelta(days=rng.randrange(365))
+        nights = rng.randrange(1, 8)
+        check_out = check_in + timedelta(days=nights)
+        platform = rng.choice(RAW_PLATFORMS)
+        guest = f"Blocked - {rng.choice(['repairs', 'cleaning'])}" if rng.random() < 0.03 else f"Guest {i}"
+        revenue = 0.0 if platform in ("Self", "Friend") else rng.uniform(150, 450) * nights
+
+        row = [""] * width
+        cells = {
+            "platform": platform,
+            "check_in": _date_cell(check_in, year, rng),
+            # Stays into January are written with the check-in's year
+            "check_out": _date_cell(check_out.replace(year=year) if check_out.year > year else check_out, year, rng),
+            "nights": str(nights),
+            "guest_name": guest,
+            "guest_count": str(rng.randrange(1, 9)),
+            "total_revenue": _currency_cell(revenue, rng),
+            "cleaning_fee": rng.choice(["", "$150", "$200", "$250"]),
+        }
+        for name, index in fields.items():
+            row[index] = cells[name]
+        rows.append(row)
+
+        if (i + 1) % _BLANK_EVERY == 0:
+            rows.append([""] * width)
+
+    total = [""] * width
+    total[fields["guest_name"]] = "Total"
+    rows.append(total)
+    return rows
+
+
+def expenses_sheet(year: int, count: int, seed: int = 0) -> list[list[str]]:
+    """A year's expenses worksheet with count expense rows.
+
+    The format follows the year's expenses_format. Multi-year sheets
+    spread their rows over every year that shares the sheet.
+
+    Args:
+        year: Year whose expenses format to use
+        count: Number of expense rows, besides header and total rows
+        seed: Random seed; the same arguments give the same rows
+
+    Returns:
+        Rows padded to a rectangle, as Worksheet.get_all_values() gives
+    """
+    rng = random.Random(seed * 10_000 + year + 1)
+    format_type = SPREADSHEETS[year].get("expenses_format", "pivot")
+
+    if format_type == "expenses_19":
+        rows = [["Category", "Type", "Description", "Amount", "Month"]]
+        for _ in range(count):
+            month = date(rng.choice([2019, 2020]), rng.randrange(1, 13), 1)
+            amount = _currency_cell(rng.uniform(10, 3000), rng)
+            rows.append(["Running cost", rng.choice(RAW_EXPENSE_TYPES), "Invoice", amount, f"{month:%b %Y}"])
+        return rows
+
+    if format_type == "multi_year":
+        years = [y for y in SPREADSHEETS if first_year_for_sheet(y, "expenses") == first_year_for_sheet(year, "expenses")]
+        categories = sorted(set(EXPENSE_MAP.values()) | {"repairs", "supplies", "other"})
+        rows = [["year", "date", "category", "description", "amount"]]
+        for _ in range(count):
+            day = date(rng.choice(years), 1, 1) + timedelta(days=rng.randrange(365))
+            rows.append([str(day.year), day.isoformat(), rng.choice(categories), "Invoice", str(rng.randrange(10, 9000))])
+        return rows
+
+    rows = [["Type", "Amount"]]
+    total = 0.0
+    for _ in range(count):
+        amount = rng.uniform(10, 3000)
+        total += amount
+        rows.append([rng.choice(RAW_EXPENSE_TYPES), _currency_cell(amount, rng)])
+    rows.append(["Grand Total", _currency_cell(total, rng)])
+    return rows
+
+
+def workbook(
+    rows_per_sheet: int,
+    years: list[int] | None = None,
+    seed: int = 0,
+) -> dict[tuple[int, str], list[list[str]]]:
+    """Every worksheet the pipeline reads for some years.
+
+    Args:
+        rows_per_sheet: Reservation rows per rentals sheet; expense
+            sheets get a tenth as many rows
+        years: Years to generate (default: all configured)
+        seed: Random seed
+
+    Returns:
+        Raw rows per cache entry, (first year, data_type), so worksheets
+        shared by several years appear once
+    """
+    if years is None:
+        years = list(SPREADSHEETS)
+    book = {}
+    for year in years:
+        if SPREADSHEETS[year].get("rentals_sheet"):
+            book[(year, "rentals")] = rentals_sheet(year, rows_per_sheet, seed)
+        entry = (first_year_for_sheet(year, "expenses"), "expenses")
+        if entry not in book:
+            book[entry] = expenses_sheet(year, max(rows_per_sheet // 10, 1), seed)
+    return book
+
+
+def save_workbook(book: dict[tuple[int, str], list[list[str]]]) -> None:
+    """Save a workbook to the local cache, as a live load would."""
+    for (year, data_type), rows in book.items():
+        save_to_cache(year, data_type, rows)
+
+
+def workbook_records(
+    book: dict[tuple[int, str], list[list[str]]],
+) -> tuple[list[Reservation], list[Expense]]:
+    """Transform a workbook as the pipeline would, in its output order."""
+    reservations: list[Reservation] = []
+    expenses: list[Expense] = []
+    for year in SPREADSHEETS:
+        if (year, "rentals") in book:
+            reservations.extend(transform_rentals(book[(year, "rentals")], year, "fast"))
+        entry = (first_year_for_sheet(year, "expenses"), "expenses")
+        if entry in book:
+            format_type = SPREADSHEETS[year].get("expenses_format", "pivot")
+            expenses.extend(transform_expenses(book[entry], year, format_type, "fast"))
+    return reservations, expenses
@@ -1,6 +1,6 @@
 """Reusable dashboard components."""
 
-from components.metrics import metric_card, metric_row
+from components.metrics import load_breakdown, metric_card, metric_row
 from components.charts import (
     income_expense_chart,
     nights_pie_chart,
@@ -13,6 +13,7 @@ from components.filters import year_filter, platform_filter
 __all__ = [
     "metric_card",
     "metric_row",
+    "load_breakdown",
     "income_expense_chart",
     "nights_pie_chart",
     "platform_bar_chart",
@@ -7,8 +7,6 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
-from etl.models import Reservation, Expense
-
 
 def income_expense_chart(income: float, expenses: float):
     """Bar chart comparing income and expenses."""
@@ -55,13 +53,8 @@ def nights_pie_chart(rented: int, owner: int, unoccupied: int):
     st.plotly_chart(fig, use_container_width=True)
 
 
-def platform_bar_chart(reservations: list[Reservation]):
-    """Bar chart showing nights by platform."""
-    platform_nights = {}
-    for r in reservations:
-        if r.is_rental:
-            platform_nights[r.platform] = platform_nights.get(r.platform, 0) + r.nights
-
+def platform_bar_chart(platform_nights: dict[str, int]):
+    """Bar chart showing rental nights by platform."""
     if not platform_nights:
         st.info("No rental data")
         return
@@ -77,17 +70,12 @@ def platform_bar_chart(reservations: list[Reservation]):
     st.plotly_chart(fig, use_container_width=True)
 
 
-def expense_pie_chart(expenses: list[Expense], top_n: int = 6):
-    """Pie chart showing expense breakdown."""
-    if not expenses:
+def expense_pie_chart(by_type: dict[str, float], top_n: int = 6):
+    """Pie chart showing expense breakdown by type."""
+    if not by_type:
         st.info("No expense data")
         return
 
-    # Aggregate by type
-    by_type = {}
-    for e in expenses:
-        by_type[e.expense_type] = by_type.get(e.expense_type, 0) + e.amount
-
     # Sort and get top N
     sorted_expenses = sorted(by_type.items(), key=lambda x: -x[1])
     top = sorted_expenses[:top_n]
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import pandas as pd
 import streamlit as st
 
+from etl.profiling import LoadReport
+
 
 def metric_card(label: str, value: float | int, prefix: str = "$", is_currency: bool = True):
     """Display a single metric.
@@ -33,3 +36,31 @@ def metric_row(metrics: list[tuple[str, float, bool]]):
     for col, (label, value, is_currency) in zip(cols, metrics):
         with col:
             metric_card(label, value, is_currency=is_currency)
+
+
+def load_breakdown(report: LoadReport):
+    """Display where a data load's time went, for operators.
+
+    Args:
+        report: Stage timings of the load
+    """
+    st.caption(f"Loaded in {report.total_seconds * 1000:,.0f} ms")
+
+    table_data = []
+    for stage, totals in report.by_stage().items():
+        lookups = totals["hits"] + totals["misses"]
+        table_data.append({
+            "Stage": stage.replace("_", " "),
+            "ms": round(totals["seconds"] * 1000, 1),
+            "Rows": totals["rows"] or None,
+            "KB": round(totals["bytes"] / 1024, 1) if totals["bytes"] else None,
+            "Cache": f"{totals['hits']}/{lookups} hit" if lookups else None,
+        })
+    st.dataframe(pd.DataFrame(table_data), use_container_width=True, hide_index=True)
+
+    by_year = sorted(report.by_year().items(), key=lambda item: -item[1])[:3]
+    if by_year:
+        slowest = ", ".join(f"{year} ({seconds * 1000:,.0f} ms)" for year, seconds in by_year)
+        st.caption(f"Slowest years: {slowest}")
+    if report.profile_path is not None:
+        st.caption(f"Profile: {report.profile_path}")
@@ -0,0 +1,122 @@
+"""Command-line entry point: python -m etl.
+
+Runs the pipeline outside the app, e.g. from cron, leaving a warm cache
+(raw sheets plus the transformed result) that the app loads at startup.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import etl.cache
+from etl.cache import CACHE_FORMATS, get_cache_info, migrate_cache
+from etl.config.spreadsheets import SPREADSHEETS
+from etl.models.bulk import VALIDATION_MODES
+from etl.pipeline import DEFAULT_MAX_WORKERS, extract_and_transform
+from etl.transform.reservation import ENGINES
+
+logger = logging.getLogger("etl")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m etl",
+        description="Fetch and transform the Mermaid Digs sheets into the local cache.",
+    )
+    parser.add_argument(
+        "--years", type=int, nargs="+", metavar="YEAR",
+        help="years to process (default: all; the app loads the all-years result)",
+    )
+    parser.add_argument(
+        "--cache-only", action="store_true",
+        help="transform cached sheets without contacting Google Sheets",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_MAX_WORKERS, metavar="N",
+        help=f"spreadsheets to fetch in parallel (default: {DEFAULT_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--processes", type=int, default=1, metavar="N",
+        help="worker processes for transforms (default: 1, in-process)",
+    )
+    parser.add_argument("--timeout", type=float, metavar="SECONDS", help="per-request timeout")
+    parser.add_argument(
+        "--cache-dir", type=Path, metavar="DIR",
+        help="cache location (default: ETL_CACHE_DIR or .cache); point the app at it with ETL_CACHE_DIR",
+    )
+    parser.add_argument("--engine", choices=ENGINES, default="python", help="transform engine")
+    parser.add_argument("--validation", choices=VALIDATION_MODES, default="fast", help="model validation mode")
+    parser.add_argument(
+        "--migrate", choices=sorted(CACHE_FORMATS), metavar="FORMAT",
+        help="convert cache files to FORMAT and report sizes and load times, then exit",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="log progress and print a breakdown of the load time")
+    return parser
+
+
+def _print_migration(report: list[dict[str, float | str]]) -> None:
+    if not report:
+        print("Nothing to migrate")
+        return
+    for row in report:
+        print(
+            f"{row['file']}: {row['old_bytes']:,} -> {row['new_bytes']:,} bytes, "
+            f"load {row['old_load_ms']:.1f} -> {row['new_load_ms']:.1f} ms"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    if args.cache_dir is not None:
+        etl.cache.CACHE_DIR = args.cache_dir
+
+    if args.migrate:
+        _print_migration(migrate_cache(args.migrate))
+        return 0
+
+    unknown = sorted(set(args.years or ()) - set(SPREADSHEETS))
+    if unknown:
+        print(f"Unknown years: {', '.join(map(str, unknown))}", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    try:
+        result = extract_and_transform(
+            years=args.years,
+            use_cache=args.cache_only,
+            max_workers=args.workers,
+            timeout=args.timeout,
+            validation=args.validation,
+            engine=args.engine,
+            processes=args.processes,
+        )
+    except Exception:
+        logger.exception("ETL run failed")
+        return 1
+    elapsed = time.perf_counter() - start
+
+    for year in sorted(set(result.reservations_by_year) | set(result.expenses_by_year)):
+        reservations = len(result.reservations_by_year.get(year, ()))
+        expenses = len(result.expenses_by_year.get(year, ()))
+        print(f"{year}: {reservations} reservations, {expenses} expenses")
+
+    if args.verbose:
+        for stage, totals in result.report.by_stage().items():
+            print(f"  {stage:14} {totals['seconds'] * 1000:9.1f} ms  {totals['rows']:8} rows")
+
+    info = get_cache_info()
+    print(f"Done in {elapsed:.1f}s; cache at {etl.cache.CACHE_DIR} ({info['files']} files)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
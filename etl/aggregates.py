@@ -0,0 +1,168 @@
+"""Precomputed sums and counts behind the dashboard metrics."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import product
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+from etl.models import Expense, RecordTable, Reservation
+
+
+@dataclass(frozen=True)
+class ReservationTotals:
+    """Count, nights and revenue of a group of reservations."""
+
+    count: int = 0
+    nights: int = 0
+    revenue: float = 0.0
+
+
+@dataclass(frozen=True)
+class ExpenseTotals:
+    """Count and amount of a group of expenses."""
+
+    count: int = 0
+    amount: float = 0.0
+
+
+_NO_RESERVATIONS = ReservationTotals()
+_NO_EXPENSES = ExpenseTotals()
+
+
+@dataclass(frozen=True)
+class MetricCube:
+    """Reservation totals by (year, platform, is_rental) and expense
+    totals by (year, expense_type).
+
+    Every rollup is stored too, with None standing for "all values" of a
+    dimension, so each query is a single dictionary lookup.
+    """
+
+    reservation_cells: Mapping[tuple, ReservationTotals]
+    expense_cells: Mapping[tuple, ExpenseTotals]
+    reservation_years: tuple[int, ...]
+    expense_years: tuple[int, ...]
+    platforms: tuple[str, ...]
+    expense_types: tuple[str, ...]
+
+    @classmethod
+    def from_records(cls, reservations: Iterable[Reservation], expenses: Iterable[Expense]) -> MetricCube:
+        """Aggregate records into every cell and rollup of the cube.
+
+        RecordTables are aggregated column-wise, without building models.
+        """
+        builder = CubeBuilder()
+        builder.add_reservations(reservations)
+        builder.add_expenses(expenses)
+        return builder.build()
+
+    def reservations(
+        self,
+        year: int | None = None,
+        platform: str | None = None,
+        is_rental: bool | None = None,
+    ) -> ReservationTotals:
+        """Totals of the reservations matching every given dimension."""
+        return self.reservation_cells.get((year, platform, is_rental), _NO_RESERVATIONS)
+
+    def expenses(self, year: int | None = None, expense_type: str | None = None) -> ExpenseTotals:
+        """Totals of the expenses matching every given dimension."""
+        return self.expense_cells.get((year, expense_type), _NO_EXPENSES)
+
+    def nights_by_platform(self, year: int | None = None, is_rental: bool | None = True) -> dict[str, int]:
+        """Nights per platform, for platforms with matching reservations."""
+        totals = {platform: self.reservations(year, platform, is_rental) for platform in self.platforms}
+        return {platform: t.nights for platform, t in totals.items() if t.count}
+
+    def amount_by_type(self, year: int | None = None) -> dict[str, float]:
+        """Expense amount per type, for types with expenses in the year."""
+        totals = {expense_type: self.expenses(year, expense_type) for expense_type in self.expense_types}
+        return {expense_type: t.amount for expense_type, t in totals.items() if t.count}
+
+
+class CubeBuilder:
+    """Build a MetricCube from records arriving a batch at a time.
+
+    Only the per-cell sums are kept between batches, so records can be
+    dropped as soon as they have been added.
+    """
+
+    def __init__(self) -> None:
+        self._reservation_sums: dict[tuple, list] = {}
+        self._expense_sums: dict[tuple, list] = {}
+
+    def add_reservations(self, reservations: Iterable[Reservation]) -> None:
+        """Add a batch of reservations, or a RecordTable of them."""
+        cells = self._reservation_sums
+        if isinstance(reservations, RecordTable):
+            _merge(cells, _table_sums(reservations, ("year", "platform", "is_rental"), ("nights", "total_revenue")))
+            return
+        for r in reservations:
+            sums = cells.setdefault((r.year, r.platform, r.is_rental), [0, 0, 0.0])
+            sums[0] += 1
+            sums[1] += r.nights
+            sums[2] += r.total_revenue
+
+    def add_expenses(self, expenses: Iterable[Expense]) -> None:
+        """Add a batch of expenses, or a RecordTable of them."""
+        cells = self._expense_sums
+        if isinstance(expenses, RecordTable):
+            _merge(cells, _table_sums(expenses, ("year", "expense_type"), ("amount",)))
+            return
+        for e in expenses:
+            sums = cells.setdefault((e.year, e.expense_type), [0, 0.0])
+            sums[0] += 1
+            sums[1] += e.amount
+
+    def build(self) -> MetricCube:
+        """The cube of every record added so far."""
+        reservation_sums = self._reservation_sums
+        expense_sums = self._expense_sums
+        return MetricCube(
+            reservation_cells=MappingProxyType({
+                key: ReservationTotals(*sums) for key, sums in _rollup(reservation_sums).items()
+            }),
+            expense_cells=MappingProxyType({
+                key: ExpenseTotals(*sums) for key, sums in _rollup(expense_sums).items()
+            }),
+            reservation_years=tuple(sorted({year for year, _, _ in reservation_sums})),
+            expense_years=tuple(sorted({year for year, _ in expense_sums})),
+            platforms=tuple(dict.fromkeys(platform for _, platform, _ in reservation_sums)),
+            expense_types=tuple(dict.fromkeys(expense_type for _, expense_type in expense_sums)),
+        )
+
+
+def _merge(cells: dict[tuple, list], sums: dict[tuple, list]) -> None:
+    """Add per-cell sums into running totals."""
+    for key, values in sums.items():
+        total = cells.get(key)
+        if total is None:
+            cells[key] = list(values)
+        else:
+            for i, value in enumerate(values):
+                total[i] += value
+
+
+def _table_sums(table: RecordTable, keys: tuple[str, ...], values: tuple[str, ...]) -> dict[tuple, list]:
+    """Row count and column sums per distinct key, keys in first-seen order."""
+    frame = table.to_frame(keys + values)
+    grouped = frame.groupby(list(keys), observed=True, sort=False)
+    sums = grouped[list(values)].sum()
+    columns = [grouped.size().tolist()] + [sums[name].tolist() for name in values]
+    return {key: list(row) for key, row in zip(sums.index.tolist(), zip(*columns))}
+
+
+def _rollup(cells: dict[tuple, list]) -> dict[tuple, list]:
+    """Add every cell into each of its rollups, None marking a summed dimension."""
+    result: dict[tuple, list] = {}
+    for key, sums in cells.items():
+        for rollup_key in product(*((value, None) for value in key)):
+            total = result.get(rollup_key)
+            if total is None:
+                result[rollup_key] = list(sums)
+            else:
+                for i, value in enumerate(sums):
+                    total[i] += value
+    return result
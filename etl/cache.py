@@ -2,39 +2,429 @@
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
+import logging
+import os
+import pickle
+import tempfile
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
+from typing import Callable, Iterator
 
-CACHE_DIR = Path(__file__).parent.parent / ".cache"
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to unlocked (still atomic) writes
+    fcntl = None
+
+from etl.config import cache as cache_config
+from etl.config.spreadsheets import first_year_for_sheet
+from etl.profiling import stage
+
+logger = logging.getLogger(__name__)
+
+# Override with ETL_CACHE_DIR to share one cache between the app and `python -m etl`
+CACHE_DIR = Path(os.environ.get("ETL_CACHE_DIR") or Path(__file__).parent.parent / ".cache")
+
+# Errors raised when decoding a truncated or otherwise corrupt cache file.
+# Other OSErrors (permissions, EIO, EMFILE) say nothing about the file's
+# contents, so they propagate instead of getting the entry discarded.
+_DECODE_ERRORS = (EOFError, ValueError, zlib.error, gzip.BadGzipFile)
+
+
+@dataclass(frozen=True)
+class CacheFormat:
+    """Serialization of raw sheet data to cache file bytes."""
+
+    suffix: str
+    encode: Callable[[list[list[str]]], bytes]
+    decode: Callable[[bytes], list[list[str]]]
+
+
+def _encode_json(data: list[list[str]]) -> bytes:
+    return json.dumps(data, indent=2).encode()
+
+
+def _decode_json(payload: bytes) -> list[list[str]]:
+    return json.loads(payload)
+
+
+def _encode_group(rows: list[list[str]]) -> str:
+    """Encode a row group as column arrays with trailing empties trimmed."""
+    widths = [len(row) for row in rows]
+    ncols = max(widths, default=0)
+    ragged = any(width != ncols for width in widths)
+    if ragged:
+        rows = [row + [""] * (ncols - len(row)) for row in rows]
+
+    columns = []
+    for column in zip(*rows):
+        column = list(column)
+        while column and column[-1] == "":
+            column.pop()
+        columns.append(column)
+    while columns and not columns[-1]:
+        columns.pop()
+
+    group: dict = {"nrows": len(rows), "ncols": ncols, "columns": columns}
+    if ragged:
+        group["widths"] = widths
+    return json.dumps(group, separators=(",", ":"), ensure_ascii=False)
+
+
+def _decode_group(group: dict, ncols: int) -> list[list[str]]:
+    """Decode a row group back into padded rows."""
+    nrows = group["nrows"]
+    columns = [column + [""] * (nrows - len(column)) for column in group["columns"]]
+    columns += [[""] * nrows] * (ncols - len(columns))
+
+    if ncols:
+        rows = [list(row) for row in zip(*columns)]
+    else:
+        rows = [[] for _ in range(nrows)]
+
+    if "widths" in group:
+        rows = [row[:width] for row, width in zip(rows, group["widths"])]
+    return rows
+
+
+def _encode_columnar(data: list[list[str]]) -> bytes:
+    """Encode rows as gzipped JSON lines: a header, then one line per row group.
+
+    Sheets are wide and mostly empty, so storing columns with trailing
+    empty cells trimmed is far smaller than a list of padded rows. Each
+    group records its own width, so groups can be appended one at a
+    time (see CacheWriter).
+    """
+    size = cache_config.ROW_GROUP_SIZE
+    lines = [_COLUMNAR_HEADER]
+    for start in range(0, len(data), size):
+        lines.append(_encode_group(data[start:start + size]))
+    return gzip.compress("\n".join(lines).encode(), compresslevel=6)
+
+
+def _iter_columnar(lines: Iterator[str]) -> Iterator[list[list[str]]]:
+    """Decode the lines of a columnar file, one row group at a time."""
+    header = json.loads(next(lines, "{}"))
+    if header.get("format") != "columnar" or header.get("version") not in (1, 2):
+        raise ValueError(f"Unsupported cache format header: {header}")
+
+    for line in lines:
+        group = json.loads(line)
+        # Version 1 files share one width, given in the header
+        yield _decode_group(group, group.get("ncols", header.get("ncols", 0)))
+
+
+def _decode_columnar(payload: bytes) -> list[list[str]]:
+    rows: list[list[str]] = []
+    for group in _iter_columnar(iter(gzip.decompress(payload).decode().split("\n"))):
+        rows.extend(group)
+    return rows
+
+
+_COLUMNAR_HEADER = json.dumps({"format": "columnar", "version": 2})
+
+
+CACHE_FORMATS = {
+    "json": CacheFormat(".json", _encode_json, _decode_json),
+    "columnar": CacheFormat(".cols.gz", _encode_columnar, _decode_columnar),
+}
+
+
+def rows_digest(rows: list[list[str]]) -> str:
+    """Content hash of raw sheet rows."""
+    payload = json.dumps(rows, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
 
 
 def _ensure_cache_dir() -> None:
     """Ensure cache directory exists."""
-    CACHE_DIR.mkdir(exist_ok=True)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def _atomic_write(path: Path, payload: bytes) -> None:
+    """Write a file via a temp file and rename, so readers never see a partial file."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def _locked(name: str) -> Iterator[None]:
+    """Hold an exclusive advisory lock for a cache key across processes."""
+    _ensure_cache_dir()
+    with open(CACHE_DIR / f"{name}.lock", "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _cache_stem(year: int, data_type: str) -> str:
+    """Get the cache file name, without suffix, for a year and data type.
+
+    Years that share a worksheet share a single cache file.
+    """
+    return f"{data_type}_{first_year_for_sheet(year, data_type)}"
+
+
+def _cache_path(year: int, data_type: str, format_name: str | None = None) -> Path:
+    """Get cache file path for a given year, data type and format."""
+    cache_format = CACHE_FORMATS[format_name or cache_config.CACHE_FORMAT]
+    return CACHE_DIR / f"{_cache_stem(year, data_type)}{cache_format.suffix}"
 
 
-def _cache_path(year: int, data_type: str) -> Path:
-    """Get cache file path for a given year and data type."""
-    return CACHE_DIR / f"{data_type}_{year}.json"
+def _find_cache_file(year: int, data_type: str) -> tuple[Path, CacheFormat] | None:
+    """Find an existing cache file in any format, preferring the configured one."""
+    names = [cache_config.CACHE_FORMAT] + [n for n in CACHE_FORMATS if n != cache_config.CACHE_FORMAT]
+    for name in names:
+        path = _cache_path(year, data_type, name)
+        if path.exists():
+            return path, CACHE_FORMATS[name]
+    return None
 
 
-def save_to_cache(year: int, data_type: str, data: list[list[str]]) -> None:
+def _meta_path(year: int, data_type: str) -> Path:
+    """Get the metadata file path that sits next to a cache file."""
+    return CACHE_DIR / f"{_cache_stem(year, data_type)}.meta.json"
+
+
+def _data_files() -> list[Path]:
+    """List cached data files in any format, excluding metadata files."""
+    files = []
+    for cache_format in CACHE_FORMATS.values():
+        files.extend(
+            f for f in CACHE_DIR.glob(f"*{cache_format.suffix}")
+            if not f.name.endswith(".meta.json")
+        )
+    return sorted(files)
+
+
+def _cache_meta(year: int, digest: str, modified_time: str | None) -> dict:
+    """Metadata for a freshly saved cache entry."""
+    meta = {
+        "digest": digest,
+        "fetched_at": time.time(),
+        "ttl": cache_config.cache_ttl(year),
+    }
+    if modified_time is not None:
+        meta["modified_time"] = modified_time
+    return meta
+
+
+def _publish(year: int, data_type: str, write: Callable[[Path], None], meta: dict) -> None:
+    """Replace a cache entry's data file and metadata.
+
+    Args:
+        year: The year of the data
+        data_type: Either 'rentals' or 'expenses'
+        write: Puts the new data file in place at the given path
+        meta: Metadata describing the new data file
+    """
+    cache_file = _cache_path(year, data_type)
+    with _locked(_cache_stem(year, data_type)):
+        # Metadata is removed first and written last, so it never describes
+        # a data file other than the one next to it
+        _meta_path(year, data_type).unlink(missing_ok=True)
+        write(cache_file)
+
+        # Drop copies in other formats so they cannot go stale
+        for name in CACHE_FORMATS:
+            other = _cache_path(year, data_type, name)
+            if other != cache_file:
+                other.unlink(missing_ok=True)
+
+        _atomic_write(_meta_path(year, data_type), json.dumps(meta, indent=2).encode())
+
+
+def save_to_cache(
+    year: int,
+    data_type: str,
+    data: list[list[str]],
+    modified_time: str | None = None,
+) -> str:
     """Save raw data to cache file.
 
+    A metadata file is written next to it recording the content digest,
+    fetch time, TTL and (if known) the source modifiedTime.
+
     Args:
         year: The year of the data
         data_type: Either 'rentals' or 'expenses'
         data: Raw data as list of lists
+        modified_time: Drive modifiedTime of the source spreadsheet
+
+    Returns:
+        Content digest of the saved data
     """
-    _ensure_cache_dir()
-    cache_file = _cache_path(year, data_type)
-    cache_file.write_text(json.dumps(data, indent=2))
+    payload = CACHE_FORMATS[cache_config.CACHE_FORMAT].encode(data)
+    digest = rows_digest(data)
+    _publish(year, data_type, lambda path: _atomic_write(path, payload), _cache_meta(year, digest, modified_time))
+    return digest
+
+
+class CacheWriter:
+    """Save raw data to a cache entry a chunk of rows at a time.
+
+    Rows are written to a temporary file in the columnar format (the
+    JSON format cannot be appended to) as each row group fills, so
+    memory stays bounded by ROW_GROUP_SIZE however large the sheet.
+    Nothing is visible to readers until close() publishes the file.
+
+    Example:
+        writer = CacheWriter(2020, "rentals")
+        for chunk in chunks:
+            writer.append(chunk)
+        digest = writer.close()
+    """
+
+    def __init__(self, year: int, data_type: str, modified_time: str | None = None):
+        self.year = year
+        self.data_type = data_type
+        self.modified_time = modified_time
+        _ensure_cache_dir()
+        fd, self._tmp_name = tempfile.mkstemp(dir=CACHE_DIR, prefix=f".{_cache_stem(year, data_type)}.", suffix=".tmp")
+        self._file = os.fdopen(fd, "wb")
+        self._gzip = gzip.GzipFile(fileobj=self._file, mode="wb", compresslevel=6)
+        self._gzip.write(_COLUMNAR_HEADER.encode())
+        self._pending: list[list[str]] = []
+        # The digest is rows_digest of all rows, hashed as they go by
+        self._hash = hashlib.sha256(b"[")
+        self._rows = 0
+
+    def append(self, rows: list[list[str]]) -> None:
+        """Add rows to the end of the entry."""
+        for row in rows:
+            separator = b"," if self._rows else b""
+            self._hash.update(separator + json.dumps(row, separators=(",", ":"), ensure_ascii=False).encode())
+            self._rows += 1
+        self._pending.extend(rows)
+        size = cache_config.ROW_GROUP_SIZE
+        while len(self._pending) >= size:
+            self._write_group(self._pending[:size])
+            del self._pending[:size]
+
+    def _write_group(self, rows: list[list[str]]) -> None:
+        self._gzip.write(b"\n" + _encode_group(rows).encode())
+
+    def close(self) -> str:
+        """Publish the entry, replacing any older one.
+
+        Returns:
+            Content digest of the saved data, as rows_digest would give
+        """
+        try:
+            if self._pending:
+                self._write_group(self._pending)
+                self._pending = []
+            self._gzip.close()
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+        except BaseException:
+            self.abort()
+            raise
+
+        self._hash.update(b"]")
+        digest = self._hash.hexdigest()
+        meta = _cache_meta(self.year, digest, self.modified_time)
+        _publish(self.year, self.data_type, lambda path: os.replace(self._tmp_name, path), meta)
+        return digest
+
+    def abort(self) -> None:
+        """Discard the rows written so far, leaving the current entry as is."""
+        self._gzip.close()
+        self._file.close()
+        Path(self._tmp_name).unlink(missing_ok=True)
+
+
+def touch_cache_entry(year: int, data_type: str) -> None:
+    """Mark a cache entry as freshly checked against its source.
+
+    Args:
+        year: The year of the data
+        data_type: Either 'rentals' or 'expenses'
+    """
+    with _locked(_cache_stem(year, data_type)):
+        meta = load_cache_meta(year, data_type)
+        if meta is None:
+            return
+        meta["fetched_at"] = time.time()
+        meta["ttl"] = cache_config.cache_ttl(year)
+        _atomic_write(_meta_path(year, data_type), json.dumps(meta, indent=2).encode())
+
+
+def is_stale(year: int, data_type: str, now: float | None = None) -> bool:
+    """Check whether a cache entry is missing or older than its TTL.
+
+    Args:
+        year: The year of the data
+        data_type: Either 'rentals' or 'expenses'
+        now: Current time as a Unix timestamp (default: now)
+
+    Returns:
+        True if the entry should be refreshed
+    """
+    meta = load_cache_meta(year, data_type)
+    if meta is None or "fetched_at" not in meta:
+        return True
+    ttl = meta.get("ttl", cache_config.cache_ttl(year))
+    return (now or time.time()) - meta["fetched_at"] > ttl
+
+
+def _remove_entry(year: int, data_type: str) -> None:
+    """Remove a corrupt cache entry; the caller holds its lock."""
+    logger.warning("Discarding corrupt cache entry %s", _cache_stem(year, data_type))
+    _meta_path(year, data_type).unlink(missing_ok=True)
+    for name in CACHE_FORMATS:
+        _cache_path(year, data_type, name).unlink(missing_ok=True)
+
+
+def _discard_entry(year: int, data_type: str) -> None:
+    """Remove a corrupt cache entry so that it gets fetched again."""
+    with _locked(_cache_stem(year, data_type)):
+        _remove_entry(year, data_type)
+
+
+def _read_entry(year: int, data_type: str) -> list[list[str]] | None:
+    """Read and decode a cache file, raising _DECODE_ERRORS if it is corrupt."""
+    found = _find_cache_file(year, data_type)
+    if found is None:
+        return None
+    cache_file, cache_format = found
+    try:
+        with stage("cache_read", year, data_type) as details:
+            payload = cache_file.read_bytes()
+            data = cache_format.decode(payload)
+            details["rows"] = len(data)
+            details["bytes"] = len(payload)
+        return data
+    except FileNotFoundError:
+        return None
 
 
 def load_from_cache(year: int, data_type: str) -> list[list[str]] | None:
     """Load raw data from cache file.
 
+    Files in any supported format are read, whatever CACHE_FORMAT is.
+    A corrupt file (e.g. truncated by a crash) is removed and treated as
+    missing; errors reading the file are raised.
+
     Args:
         year: The year of the data
         data_type: Either 'rentals' or 'expenses'
@@ -42,42 +432,266 @@ def load_from_cache(year: int, data_type: str) -> list[list[str]] | None:
     Returns:
         Raw data as list of lists, or None if cache doesn't exist
     """
-    cache_file = _cache_path(year, data_type)
-    if not cache_file.exists():
+    try:
+        return _read_entry(year, data_type)
+    except _DECODE_ERRORS:
+        _discard_entry(year, data_type)
+        return None
+
+
+def iter_cache_chunks(year: int, data_type: str) -> Iterator[list[list[str]]] | None:
+    """Load raw data from cache file one chunk of rows at a time.
+
+    Columnar files are decoded a row group at a time, so at most one
+    group is held in memory; JSON files come back as a single chunk.
+
+    Args:
+        year: The year of the data
+        data_type: Either 'rentals' or 'expenses'
+
+    Returns:
+        Iterator over row chunks, or None if cache doesn't exist. If the
+        file turns out to be corrupt part way through, it is removed and
+        the iterator raises ValueError.
+    """
+    found = _find_cache_file(year, data_type)
+    if found is None:
+        return None
+    cache_file, cache_format = found
+    if cache_format is not CACHE_FORMATS["columnar"]:
+        data = load_from_cache(year, data_type)
+        return None if data is None else iter([data])
+
+    def chunks() -> Iterator[list[list[str]]]:
+        try:
+            with gzip.open(cache_file, "rt", encoding="utf-8") as f:
+                yield from _iter_columnar(line.rstrip("\n") for line in f)
+        except _DECODE_ERRORS as e:
+            _discard_entry(year, data_type)
+            raise ValueError(f"Corrupt cache entry {_cache_stem(year, data_type)}") from e
+
+    return chunks()
+
+
+def load_cache_meta(year: int, data_type: str) -> dict[str, str] | None:
+    """Load metadata recorded alongside a cache file.
+
+    Args:
+        year: The year of the data
+        data_type: Either 'rentals' or 'expenses'
+
+    Returns:
+        Metadata dictionary, or None if no metadata was recorded
+    """
+    meta_file = _meta_path(year, data_type)
+    try:
+        meta = json.loads(meta_file.read_bytes())
+    except FileNotFoundError:
+        return None
+    except _DECODE_ERRORS:
+        meta = None
+    if not isinstance(meta, dict):
+        meta_file.unlink(missing_ok=True)
+        return None
+    return meta
+
+
+def cache_digest(year: int, data_type: str) -> str | None:
+    """Get the content digest of a cache entry without decoding it.
+
+    Entries cached before digests were recorded are hashed once and their
+    metadata updated. The hashing happens under the entry's lock, so a
+    writer publishing meanwhile cannot have its metadata overwritten with
+    the digest of the file it replaced.
+
+    Args:
+        year: The year of the data
+        data_type: Either 'rentals' or 'expenses'
+
+    Returns:
+        Content digest, or None if cache doesn't exist
+    """
+    meta = load_cache_meta(year, data_type)
+    if meta is not None and "digest" in meta and cache_exists(year, data_type):
+        return meta["digest"]
+
+    with _locked(_cache_stem(year, data_type)):
+        # A writer may have published a new entry while we waited
+        meta = load_cache_meta(year, data_type)
+        if meta is not None and "digest" in meta and cache_exists(year, data_type):
+            return meta["digest"]
+
+        try:
+            data = _read_entry(year, data_type)
+        except _DECODE_ERRORS:
+            _remove_entry(year, data_type)
+            return None
+        if data is None:
+            return None
+
+        meta = {**(meta or {}), "digest": rows_digest(data)}
+        _atomic_write(_meta_path(year, data_type), json.dumps(meta, indent=2).encode())
+    return meta["digest"]
+
+
+def _result_path(key: str, group: str) -> Path:
+    """Get the transformed-result cache path for a key."""
+    return CACHE_DIR / f"etl_result_{group}_{key}.pkl"
+
+
+def save_result_cache(key: str, value: object, group: str) -> None:
+    """Save a transformed pipeline result, replacing older results in its group.
+
+    Args:
+        key: Hash identifying the raw inputs and transform version
+        value: Picklable result
+        group: Hash identifying which results supersede each other (e.g.
+            the set of sheets loaded); results in other groups are kept
+    """
+    payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    with _locked("etl_result"):
+        for old in CACHE_DIR.glob(f"etl_result_{group}_*.pkl"):
+            old.unlink(missing_ok=True)
+        _atomic_write(_result_path(key, group), payload)
+
+
+def load_result_cache(key: str, group: str) -> object | None:
+    """Load a transformed pipeline result.
+
+    The file is a pickle written by save_result_cache into the local cache
+    directory, which is trusted like the rest of the project.
+
+    Args:
+        key: Hash identifying the raw inputs and transform version
+        group: Group the result was saved in
+
+    Returns:
+        The saved result, or None if there is none for this key (or the
+        file is unreadable, in which case it is removed)
+    """
+    path = _result_path(key, group)
+    try:
+        return pickle.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning("Discarding unreadable result cache %s", path.name)
+        path.unlink(missing_ok=True)
         return None
-    return json.loads(cache_file.read_text())
 
 
 def cache_exists(year: int, data_type: str) -> bool:
     """Check if cache file exists for a given year and data type."""
-    return _cache_path(year, data_type).exists()
+    return _find_cache_file(year, data_type) is not None
 
 
 def get_cache_info() -> dict[str, str]:
     """Get information about cached files.
 
+    Entries with no recorded fetch time (e.g. checked in with the repo)
+    are counted as of unknown age rather than stale.
+
     Returns:
-        Dictionary with cache status information
+        Dictionary with cache status information: the number of files,
+        when the oldest known entry was fetched (None if none is known),
+        and how many entries are stale or of unknown age
     """
     if not CACHE_DIR.exists():
         return {"status": "No cache", "files": 0}
 
-    cache_files = list(CACHE_DIR.glob("*.json"))
+    cache_files = _data_files()
     if not cache_files:
         return {"status": "No cache", "files": 0}
 
-    oldest = min(f.stat().st_mtime for f in cache_files)
-    oldest_dt = datetime.fromtimestamp(oldest)
+    now = time.time()
+    fetched_times = []
+    stale = unknown = 0
+    for f in cache_files:
+        data_type, year = f.name.split(".")[0].rsplit("_", 1)
+        meta = load_cache_meta(int(year), data_type) or {}
+        if "fetched_at" not in meta:
+            unknown += 1
+            continue
+        fetched_times.append(meta["fetched_at"])
+        if is_stale(int(year), data_type, now):
+            stale += 1
+
+    oldest = datetime.fromtimestamp(min(fetched_times)).strftime("%Y-%m-%d %H:%M") if fetched_times else None
 
     return {
         "status": "Cached",
         "files": len(cache_files),
-        "oldest": oldest_dt.strftime("%Y-%m-%d %H:%M"),
+        "oldest": oldest,
+        "stale": stale,
+        "unknown": unknown,
     }
 
 
 def clear_cache() -> None:
-    """Delete all cached files."""
+    """Delete all cached files and their metadata."""
     if CACHE_DIR.exists():
-        for f in CACHE_DIR.glob("*.json"):
-            f.unlink()
+        for f in _data_files() + list(CACHE_DIR.glob("*.meta.json")) + list(CACHE_DIR.glob("etl_result_*.pkl")):
+            f.unlink(missing_ok=True)
+
+
+def migrate_cache(format_name: str | None = None) -> list[dict[str, float | str]]:
+    """Convert every cache file to one format.
+
+    Files are also renamed to their entry's current name: legacy
+    per-year copies of a shared worksheet move to the first year's
+    entry, or are dropped if that entry already exists.
+
+    Args:
+        format_name: Target format (default: CACHE_FORMAT)
+
+    Returns:
+        One report row per converted file with sizes in bytes and load
+        times in milliseconds before and after conversion
+    """
+    target_name = format_name or cache_config.CACHE_FORMAT
+    target = CACHE_FORMATS[target_name]
+    if not CACHE_DIR.exists():
+        return []
+
+    report = []
+    for path in _data_files():
+        source = next(f for f in CACHE_FORMATS.values() if path.name.endswith(f.suffix))
+        stem = path.name[: -len(source.suffix)]
+        data_type, year = stem.rsplit("_", 1)
+        canonical = _cache_stem(int(year), data_type)
+        new_path = CACHE_DIR / f"{canonical}{target.suffix}"
+        if path == new_path:
+            continue
+
+        with _locked(canonical):
+            meta_path = CACHE_DIR / f"{stem}.meta.json"
+            if stem != canonical and _find_cache_file(int(year), data_type) is not None:
+                # The shared worksheet is already cached under its first year
+                path.unlink()
+                meta_path.unlink(missing_ok=True)
+                continue
+
+            old_bytes = path.stat().st_size
+            start = time.perf_counter()
+            data = source.decode(path.read_bytes())
+            old_ms = (time.perf_counter() - start) * 1000
+
+            _atomic_write(new_path, target.encode(data))
+            path.unlink()
+            if stem != canonical and meta_path.exists():
+                meta_path.replace(CACHE_DIR / f"{canonical}.meta.json")
+
+        start = time.perf_counter()
+        target.decode(new_path.read_bytes())
+        new_ms = (time.perf_counter() - start) * 1000
+
+        report.append({
+            "file": new_path.name,
+            "old_bytes": old_bytes,
+            "new_bytes": new_path.stat().st_size,
+            "old_load_ms": old_ms,
+            "new_load_ms": new_ms,
+        })
+
+    return report
+
@@ -0,0 +1,25 @@
+"""Local cache settings."""
+
+from datetime import date
+
+from etl.config.spreadsheets import SPREADSHEETS
+
+# On-disk format for raw sheet data: "columnar" (compact, gzipped column
+# arrays) or "json" (plain list of rows, easy to inspect by hand).
+# Either format is readable regardless of this setting.
+CACHE_FORMAT = "columnar"
+
+# Rows per row group in the columnar format
+ROW_GROUP_SIZE = 10_000
+
+# Seconds a cache entry stays fresh. Closed years never change, so they only
+# need an occasional check; the open year is still being edited.
+OPEN_YEAR_TTL = 10 * 60
+CLOSED_YEAR_TTL = 7 * 24 * 60 * 60
+
+
+def cache_ttl(year: int) -> int:
+    """Get how long cached data for a year stays fresh, in seconds."""
+    if year >= max(SPREADSHEETS) or year >= date.today().year:
+        return OPEN_YEAR_TTL
+    return CLOSED_YEAR_TTL
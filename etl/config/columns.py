@@ -89,19 +89,24 @@ COLUMN_MAPS = {
 }
 
 
+# Layout of each year's rentals sheet. Adding a year that reuses an
+# existing layout is a one-line change here.
+YEAR_LAYOUTS = {
+    2017: "2017",
+    2018: "2018",
+    2019: "2019-2020",
+    2020: "2019-2020",
+    2021: "2021",
+    2022: "2022-2023",
+    2023: "2022-2023",
+    2024: "2024-2025",
+    2025: "2024-2025",
+}
+
+
 def get_column_map(year: int) -> ColumnMap:
     """Get the column mapping for a specific year."""
-    if year in (2024, 2025):
-        return COLUMN_MAPS["2024-2025"]
-    elif year in (2022, 2023):
-        return COLUMN_MAPS["2022-2023"]
-    elif year == 2021:
-        return COLUMN_MAPS["2021"]
-    elif year in (2019, 2020):
-        return COLUMN_MAPS["2019-2020"]
-    elif year == 2018:
-        return COLUMN_MAPS["2018"]
-    elif year == 2017:
-        return COLUMN_MAPS["2017"]
-    else:
+    layout = YEAR_LAYOUTS.get(year)
+    if layout is None:
         raise ValueError(f"No column mapping for year {year}")
+    return COLUMN_MAPS[layout]
@@ -56,3 +56,27 @@ SPREADSHEETS = {
         "expenses_format": "multi_year",
     },
 }
+
+
+def first_year_for_sheet(year: int, data_type: str) -> int:
+    """Get the earliest year that reads the same worksheet as year.
+
+    Several legacy years share one worksheet (e.g. "Expenses 2016-2018"),
+    so their raw data only needs to be stored once.
+
+    Args:
+        year: The year of the data
+        data_type: Either 'rentals' or 'expenses'
+
+    Returns:
+        Earliest year sharing the worksheet, or year itself if unshared
+    """
+    config = SPREADSHEETS.get(year)
+    sheet_field = f"{data_type}_sheet"
+    if config is None or config.get(sheet_field) is None:
+        return year
+
+    return min(
+        y for y, c in SPREADSHEETS.items()
+        if c["id"] == config["id"] and c.get(sheet_field) == config[sheet_field]
+    )
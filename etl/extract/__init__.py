@@ -1,11 +1,15 @@
 """Data extraction from Google Sheets."""
 
 from etl.extract.client import get_client
+from etl.extract.batch import batch_get_worksheets, iter_worksheet_rows, worksheet_row_count
 from etl.extract.rentals import extract_rentals, extract_all_rentals
 from etl.extract.expenses import extract_expenses, extract_all_expenses
 
 __all__ = [
     "get_client",
+    "batch_get_worksheets",
+    "iter_worksheet_rows",
+    "worksheet_row_count",
     "extract_rentals",
     "extract_all_rentals",
     "extract_expenses",
@@ -0,0 +1,96 @@
+"""Batched worksheet reads from Google Sheets."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import gspread
+from gspread.utils import absolute_range_name, fill_gaps
+
+
+def batch_get_worksheets(
+    client: gspread.Client,
+    spreadsheet_id: str,
+    worksheets: list[str],
+) -> dict[str, list[list[str]]]:
+    """Read several worksheets of one spreadsheet in a single request.
+
+    Uses the values:batchGet endpoint directly, which also skips the
+    spreadsheet metadata calls made by open_by_key/worksheet.
+
+    Args:
+        client: gspread client
+        spreadsheet_id: Spreadsheet to read from
+        worksheets: Worksheet names to read in full
+
+    Returns:
+        Dictionary mapping worksheet name to list of rows, padded to a
+        rectangle like Worksheet.get_all_values()
+    """
+    if not worksheets:
+        return {}
+
+    ranges = [absolute_range_name(name) for name in worksheets]
+    response = client.http_client.values_batch_get(spreadsheet_id, ranges)
+
+    return {
+        name: fill_gaps(value_range.get("values", [[]]))
+        for name, value_range in zip(worksheets, response.get("valueRanges", []))
+    }
+
+
+def worksheet_row_count(client: gspread.Client, spreadsheet_id: str, worksheet: str) -> int:
+    """Get the number of rows in a worksheet's grid, blank or not.
+
+    Raises:
+        gspread.WorksheetNotFound: If the spreadsheet has no such worksheet
+    """
+    metadata = client.http_client.fetch_sheet_metadata(
+        spreadsheet_id, params={"fields": "sheets.properties(title,gridProperties.rowCount)"},
+    )
+    for sheet in metadata.get("sheets", []):
+        properties = sheet["properties"]
+        if properties["title"] == worksheet:
+            return properties["gridProperties"]["rowCount"]
+    raise gspread.WorksheetNotFound(worksheet)
+
+
+def iter_worksheet_rows(
+    client: gspread.Client,
+    spreadsheet_id: str,
+    worksheet: str,
+    chunk_size: int = 5000,
+) -> Iterator[list[list[str]]]:
+    """Read a worksheet as a series of row windows.
+
+    Each window is one request for chunk_size rows, so only one window
+    is held at a time. Windows cover the worksheet's whole grid (see
+    worksheet_row_count), so runs of blank rows of any length are
+    read past.
+
+    Args:
+        client: gspread client
+        spreadsheet_id: Spreadsheet to read from
+        worksheet: Worksheet name
+        chunk_size: Rows per request
+
+    Yields:
+        Lists of rows, each padded to a rectangle on its own, that
+        together are the worksheet's rows in order
+    """
+    row_count = worksheet_row_count(client, spreadsheet_id, worksheet)
+    blank = 0
+    for start in range(1, row_count + 1, chunk_size):
+        end = min(start + chunk_size - 1, row_count)
+        range_name = absolute_range_name(worksheet, f"{start}:{end}")
+        response = client.http_client.values_batch_get(spreadsheet_id, [range_name])
+        value_ranges = response.get("valueRanges", [])
+        rows = value_ranges[0].get("values") if value_ranges else None
+        if not rows:
+            blank += end - start + 1
+            continue
+
+        # The API leaves out trailing empty rows; they are only passed on
+        # once a later window shows they are not the end of the sheet
+        yield fill_gaps([[] for _ in range(blank)] + rows)
+        blank = end - start + 1 - len(rows)
@@ -1,5 +1,7 @@
 """Google Sheets client."""
 
+from __future__ import annotations
+
 from pathlib import Path
 
 import gspread
@@ -13,13 +15,19 @@ SCOPES = [
 ]
 
 
-def get_client() -> gspread.Client:
+def get_client(timeout: float | None = None) -> gspread.Client:
     """Get authenticated gspread client.
 
+    Args:
+        timeout: Optional per-request timeout in seconds
+
     Returns:
         Authenticated gspread client
     """
     credentials = Credentials.from_service_account_file(
         CREDENTIALS_FILE, scopes=SCOPES
     )
-    return gspread.authorize(credentials)
+    client = gspread.authorize(credentials)
+    if timeout is not None:
+        client.set_timeout(timeout)
+    return client
@@ -5,6 +5,7 @@ from __future__ import annotations
 import gspread
 
 from etl.config.spreadsheets import SPREADSHEETS
+from etl.extract.batch import batch_get_worksheets
 from etl.extract.client import get_client
 
 
@@ -29,10 +30,8 @@ def extract_expenses(year: int, client: gspread.Client | None = None) -> list[li
     if client is None:
         client = get_client()
 
-    spreadsheet = client.open_by_key(config["id"])
-    worksheet = spreadsheet.worksheet(config["expenses_sheet"])
-
-    return worksheet.get_all_values()
+    sheet = config["expenses_sheet"]
+    return batch_get_worksheets(client, config["id"], [sheet])[sheet]
 
 
 def extract_all_expenses(
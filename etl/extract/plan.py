@@ -0,0 +1,131 @@
+"""Fetch planning to avoid re-downloading shared worksheets."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+import gspread
+
+from etl.config.spreadsheets import SPREADSHEETS
+from etl.extract.batch import batch_get_worksheets
+from etl.profiling import stage
+
+# (spreadsheet id, worksheet name)
+SheetKey = tuple[str, str]
+
+
+def sheet_key(year: int, data_type: str) -> SheetKey | None:
+    """Get the (spreadsheet id, worksheet name) a year's data lives in.
+
+    Args:
+        year: The year of the data
+        data_type: Either 'rentals' or 'expenses'
+
+    Returns:
+        Sheet key, or None if there is no sheet of that type for the year
+    """
+    if year not in SPREADSHEETS:
+        raise ValueError(f"No spreadsheet configured for year {year}")
+
+    config = SPREADSHEETS[year]
+    worksheet = config.get(f"{data_type}_sheet")
+    if worksheet is None:
+        return None
+    return (config["id"], worksheet)
+
+
+def build_fetch_plan(jobs: list[tuple[int, str]]) -> dict[SheetKey, list[tuple[int, str]]]:
+    """Group (year, data_type) jobs by the worksheet they read.
+
+    Years 2016-2018 share the "Expenses 2016-2018" worksheet, so the plan
+    downloads it once and fans the rows out to every year that needs it.
+
+    Args:
+        jobs: (year, data_type) pairs to load
+
+    Returns:
+        Ordered mapping of sheet key to the jobs it serves. Jobs without a
+        sheet are left out.
+    """
+    plan: dict[SheetKey, list[tuple[int, str]]] = {}
+    for year, data_type in jobs:
+        key = sheet_key(year, data_type)
+        if key is not None:
+            plan.setdefault(key, []).append((year, data_type))
+    return plan
+
+
+def _run_parallel(fn, items: list, max_workers: int) -> list:
+    """Apply fn to items, in parallel when max_workers > 1, keeping order."""
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    # Each call runs in a copy of this context, so its stages are timed
+    contexts = [copy_context() for _ in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(lambda context, item: context.run(fn, item), contexts, items))
+
+
+def fetch_modified_times(
+    spreadsheet_ids: list[str],
+    client: gspread.Client,
+    max_workers: int = 1,
+) -> dict[str, str]:
+    """Get the Drive modifiedTime of each spreadsheet.
+
+    This is one small metadata request per spreadsheet, much cheaper than
+    downloading its worksheets.
+
+    Args:
+        spreadsheet_ids: Spreadsheets to check
+        client: gspread client
+        max_workers: Number of requests to run in parallel (1 = serial)
+
+    Returns:
+        Dictionary mapping spreadsheet id to modifiedTime
+    """
+    def modified_time(spreadsheet_id: str) -> str:
+        with stage("metadata"):
+            return client.get_file_drive_metadata(spreadsheet_id)["modifiedTime"]
+
+    return dict(zip(spreadsheet_ids, _run_parallel(modified_time, spreadsheet_ids, max_workers)))
+
+
+def fetch_plan(
+    plan: dict[SheetKey, list[tuple[int, str]]],
+    client: gspread.Client,
+    max_workers: int = 1,
+) -> dict[SheetKey, list[list[str]]]:
+    """Download every worksheet in a fetch plan.
+
+    All worksheets of a spreadsheet are read in one batch request, and
+    different spreadsheets are read in parallel.
+
+    Args:
+        plan: Fetch plan from build_fetch_plan
+        client: gspread client
+        max_workers: Number of spreadsheets to read in parallel (1 = serial)
+
+    Returns:
+        Mapping of sheet key to raw rows
+    """
+    by_spreadsheet: dict[str, list[str]] = {}
+    years: dict[str, int] = {}
+    for (spreadsheet_id, worksheet), key_jobs in plan.items():
+        by_spreadsheet.setdefault(spreadsheet_id, []).append(worksheet)
+        years.setdefault(spreadsheet_id, key_jobs[0][0])
+
+    def fetch(spreadsheet_id: str) -> dict[str, list[list[str]]]:
+        with stage("extract", years[spreadsheet_id]) as details:
+            values = batch_get_worksheets(client, spreadsheet_id, by_spreadsheet[spreadsheet_id])
+            rows = [row for worksheet_rows in values.values() for row in worksheet_rows]
+            details["rows"] = len(rows)
+            # Cell text, as an estimate of the response size
+            details["bytes"] = sum(len(cell) for row in rows for cell in row)
+        return values
+
+    spreadsheet_ids = list(by_spreadsheet)
+    batches = _run_parallel(fetch, spreadsheet_ids, max_workers)
+
+    values = dict(zip(spreadsheet_ids, batches))
+    return {key: values[key[0]][key[1]] for key in plan}
@@ -6,6 +6,7 @@ import gspread
 
 from etl.config.spreadsheets import SPREADSHEETS
 from etl.config.columns import get_column_map
+from etl.extract.batch import batch_get_worksheets
 from etl.extract.client import get_client
 
 
@@ -26,10 +27,8 @@ def extract_rentals(year: int, client: gspread.Client | None = None) -> list[lis
         client = get_client()
 
     config = SPREADSHEETS[year]
-    spreadsheet = client.open_by_key(config["id"])
-    worksheet = spreadsheet.worksheet(config["rentals_sheet"])
-
-    return worksheet.get_all_values()
+    sheet = config["rentals_sheet"]
+    return batch_get_worksheets(client, config["id"], [sheet])[sheet]
 
 
 def extract_all_rentals(
@@ -2,5 +2,7 @@
 
 from etl.models.reservation import Reservation
 from etl.models.expense import Expense
+from etl.models.records import ExpenseRecord, ReservationRecord
+from etl.models.table import RecordTable
 
-__all__ = ["Reservation", "Expense"]
+__all__ = ["Reservation", "Expense", "ReservationRecord", "ExpenseRecord", "RecordTable"]
@@ -0,0 +1,119 @@
+"""Bulk construction of models for a whole year's rows at once."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+from etl.models.reservation import Reservation
+from etl.profiling import stage
+
+M = TypeVar("M", bound=BaseModel)
+
+VALIDATION_MODES = ("strict", "fast")
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def _check_reservation_rows(records: list[dict[str, Any]]) -> bool:
+    """Cross-field rule mirroring Reservation.check_out_after_check_in."""
+    return all(r["check_out"] >= r["check_in"] for r in records)
+
+
+# Model validators that are not expressed as field constraints
+_ROW_CHECKS = {Reservation: _check_reservation_rows}
+
+
+def check_columns(model: type[BaseModel], records: list[dict[str, Any]]) -> bool:
+    """Check records against a model's field types and constraints.
+
+    Each field is checked as one column: exact types, then ge/le bounds
+    on every value (a NaN fails both, as it does in pydantic) and
+    patterns on the column's distinct values.
+
+    Args:
+        model: Pydantic model class
+        records: Field values per record
+
+    Returns:
+        True if every record would pass validation unchanged
+    """
+    if not records:
+        return True
+
+    for name, field in model.model_fields.items():
+        column = [r[name] for r in records]
+        expected = field.annotation
+        if any(type(value) is not expected for value in column):
+            return False
+
+        for constraint in field.metadata:
+            ge = getattr(constraint, "ge", None)
+            le = getattr(constraint, "le", None)
+            pattern = getattr(constraint, "pattern", None)
+            if ge is not None and not all(value >= ge for value in column):
+                return False
+            if le is not None and not all(value <= le for value in column):
+                return False
+            if pattern is not None:
+                regex = re.compile(pattern)
+                if not all(regex.match(value) for value in set(column)):
+                    return False
+
+    row_check = _ROW_CHECKS.get(model)
+    return row_check is None or row_check(records)
+
+
+def construct_unchecked(model: type[M], records: list[dict[str, Any]]) -> list[M]:
+    """Build model instances from already-valid values, skipping validation.
+
+    Equivalent to model(**record) for records that pass check_columns,
+    at a fraction of the cost.
+    """
+    new = model.__new__
+    set_attr = object.__setattr__
+    fields_set = set(model.model_fields)
+
+    result = []
+    for record in records:
+        instance = new(model)
+        set_attr(instance, "__dict__", record)
+        set_attr(instance, "__pydantic_fields_set__", fields_set)
+        set_attr(instance, "__pydantic_extra__", None)
+        set_attr(instance, "__pydantic_private__", None)
+        result.append(instance)
+    return result
+
+
+def build_models(
+    model: type[M],
+    records: list[dict[str, Any]],
+    validation: str = "strict",
+) -> list[M]:
+    """Build model instances for many records at once.
+
+    Args:
+        model: Pydantic model class
+        records: Field values per record
+        validation: "strict" validates all records in one pydantic call;
+            "fast" checks constraints column by column and then builds
+            models without re-validating, falling back to strict
+            validation (and its errors) if any check fails
+
+    Returns:
+        List of model instances
+    """
+    if validation not in VALIDATION_MODES:
+        raise ValueError(f"Unknown validation mode: {validation}")
+
+    with stage("models") as details:
+        details["rows"] = len(records)
+        if validation == "fast" and check_columns(model, records):
+            return construct_unchecked(model, records)
+        return _list_adapter(model).validate_python(records)
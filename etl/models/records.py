@@ -0,0 +1,115 @@
+"""Lightweight tuple records mirroring the pydantic models.
+
+A record holds the same fields as its model at a fraction of the memory
+and construction cost, but does no validation of its own: build records
+with build_records, which validates once at ingest, and convert to
+models with to_models where the full model API is needed.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from operator import itemgetter
+from typing import Any, NamedTuple, TypeVar, Union
+
+from pydantic import BaseModel
+
+from etl.models.bulk import VALIDATION_MODES, build_models, check_columns, construct_unchecked
+from etl.models.expense import Expense
+from etl.models.reservation import Reservation
+
+
+class ReservationRecord(NamedTuple):
+    """A normalized reservation, as a plain tuple."""
+
+    year: int
+    platform: str
+    platform_raw: str
+    check_in: date
+    check_out: date
+    nights: int
+    guest_name: str
+    guest_count: int
+    total_revenue: float
+    cleaning_fee: float
+    is_rental: bool
+
+    model = Reservation
+
+    @classmethod
+    def from_model(cls, instance: Reservation) -> ReservationRecord:
+        return cls._make(map(instance.__dict__.__getitem__, cls._fields))
+
+    def to_model(self) -> Reservation:
+        return construct_unchecked(Reservation, [dict(zip(self._fields, self))])[0]
+
+
+class ExpenseRecord(NamedTuple):
+    """A normalized expense, as a plain tuple."""
+
+    year: int
+    expense_type: str
+    expense_type_raw: str
+    amount: float
+
+    model = Expense
+
+    @classmethod
+    def from_model(cls, instance: Expense) -> ExpenseRecord:
+        return cls._make(map(instance.__dict__.__getitem__, cls._fields))
+
+    def to_model(self) -> Expense:
+        return construct_unchecked(Expense, [dict(zip(self._fields, self))])[0]
+
+
+Record = Union[ReservationRecord, ExpenseRecord]
+R = TypeVar("R", ReservationRecord, ExpenseRecord)
+
+# Record type per model
+RECORD_TYPES: dict[type[BaseModel], type] = {
+    Reservation: ReservationRecord,
+    Expense: ExpenseRecord,
+}
+
+# Representations the pipeline can return records in
+RECORD_MODES = ("model", "tuple")
+
+
+def build_records(
+    record_type: type[R],
+    records: list[dict[str, Any]],
+    validation: str = "strict",
+) -> list[R]:
+    """Validate field values once and build lightweight records.
+
+    Args:
+        record_type: ReservationRecord or ExpenseRecord
+        records: Field values per record
+        validation: As for build_models; values that "fast" checks
+            cannot pass unchanged are validated (and coerced) by pydantic
+
+    Returns:
+        List of records, equal field for field to build_models' models
+    """
+    if validation not in VALIDATION_MODES:
+        raise ValueError(f"Unknown validation mode: {validation}")
+
+    model = record_type.model
+    if validation == "fast" and check_columns(model, records):
+        values = itemgetter(*record_type._fields)
+        return [record_type._make(values(r)) for r in records]
+    return from_models(record_type, build_models(model, records, "strict"))
+
+
+def from_models(record_type: type[R], instances: list[BaseModel]) -> list[R]:
+    """Convert model instances to records."""
+    return [record_type.from_model(instance) for instance in instances]
+
+
+def to_models(records: list[Record]) -> list[BaseModel]:
+    """Convert records to model instances, without re-validating."""
+    if not records:
+        return []
+    record_type = type(records[0])
+    fields = record_type._fields
+    return construct_unchecked(record_type.model, [dict(zip(fields, r)) for r in records])
@@ -0,0 +1,141 @@
+"""Columnar storage for many records of one model."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import date
+from typing import Any, Generic, Iterator, TypeVar, overload
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from etl.models.bulk import construct_unchecked
+from etl.models.expense import Expense
+from etl.models.reservation import Reservation
+
+M = TypeVar("M", bound=BaseModel)
+
+# NumPy dtype per field annotation; other fields (str) are object arrays
+_DTYPES = {int: np.int64, float: np.float64, bool: np.bool_, date: "datetime64[D]"}
+
+# Low-cardinality string fields, stored as pandas Categoricals
+CATEGORICAL_FIELDS = {
+    Reservation: ("platform", "platform_raw"),
+    Expense: ("expense_type", "expense_type_raw"),
+}
+
+# Rows materialized per batch when iterating
+_BATCH_SIZE = 4096
+
+
+def _to_column(values: list, annotation: type, categorical: bool) -> Any:
+    if categorical:
+        return pd.Categorical(values)
+    dtype = _DTYPES.get(annotation, object)
+    try:
+        return np.array(values, dtype=dtype)
+    except OverflowError:
+        return np.array(values, dtype=object)
+
+
+def _to_values(column: Any) -> list:
+    """A column as a list of plain Python values (date, int, str, ...)."""
+    if isinstance(column, pd.Categorical):
+        return column.categories.to_numpy(dtype=object)[column.codes].tolist()
+    return column.tolist()
+
+
+class RecordTable(Sequence, Generic[M]):
+    """An immutable sequence of model instances, stored column by column.
+
+    Each field is one NumPy array (or pandas Categorical), which takes a
+    fraction of the memory of the equivalent model objects and can be
+    aggregated without a Python loop. Model instances are built only
+    when indexed or iterated, and are not kept.
+    """
+
+    def __init__(self, model: type[M], columns: dict[str, Any]):
+        self.model = model
+        self.columns = columns
+        self._length = len(next(iter(columns.values()))) if columns else 0
+
+    @classmethod
+    def from_records(cls, model: type[M], records: Sequence[dict[str, Any]]) -> RecordTable[M]:
+        """Build a table from already-valid field values, one dict per record."""
+        categorical = CATEGORICAL_FIELDS.get(model, ())
+        return cls(model, {
+            name: _to_column([r[name] for r in records], field.annotation, name in categorical)
+            for name, field in model.model_fields.items()
+        })
+
+    @classmethod
+    def from_models(cls, model: type[M], instances: Sequence[M]) -> RecordTable[M]:
+        """Build a table from model instances, or their tuple records."""
+        return cls.from_records(model, [
+            instance._asdict() if isinstance(instance, tuple) else instance.__dict__
+            for instance in instances
+        ])
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> RecordTable[M]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RecordTable(self.model, {name: column[index] for name, column in self.columns.items()})
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("RecordTable index out of range")
+        return self[index:index + 1].to_models()[0]
+
+    def __iter__(self) -> Iterator[M]:
+        for start in range(0, self._length, _BATCH_SIZE):
+            yield from self[start:start + _BATCH_SIZE].to_models()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(other) == len(self) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RecordTable({self.model.__name__}, {self._length} rows)"
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Field values of every row, one dict per record."""
+        names = list(self.columns)
+        values = [_to_values(column) for column in self.columns.values()]
+        return [dict(zip(names, row)) for row in zip(*values)]
+
+    def to_models(self) -> list[M]:
+        """Materialize every row as a model instance."""
+        return construct_unchecked(self.model, self.to_records())
+
+    def to_frame(self, columns: Sequence[str] | None = None) -> pd.DataFrame:
+        """The table, or some of its columns, as a DataFrame.
+
+        String fields stay categorical.
+        """
+        names = list(self.columns) if columns is None else columns
+        return pd.DataFrame({name: self.columns[name] for name in names}, copy=False)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the columns, including string objects."""
+        total = 0
+        for column in self.columns.values():
+            if isinstance(column, pd.Categorical):
+                total += column.codes.nbytes + int(column.categories.memory_usage(deep=True))
+            elif column.dtype == object:
+                total += int(pd.Series(column, copy=False).memory_usage(deep=True, index=False))
+            else:
+                total += column.nbytes
+        return total
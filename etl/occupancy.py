@@ -0,0 +1,183 @@
+"""Per-night occupancy calendar built from reservation dates."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import NamedTuple, Sequence
+
+import numpy as np
+
+from etl.models import RecordTable, Reservation
+
+
+class NightsBreakdown(NamedTuple):
+    """How the nights of a date range were used."""
+
+    rented: int
+    owner: int
+    unoccupied: int
+
+
+def year_range(year: int) -> tuple[date, date]:
+    """First night of a year and the first night after it."""
+    return date(year, 1, 1), date(year + 1, 1, 1)
+
+
+def _day_numbers(reservations: Sequence[Reservation]) -> tuple[np.ndarray, np.ndarray]:
+    """check_in and check_out of every reservation as day ordinals."""
+    if isinstance(reservations, RecordTable):
+        epoch = np.datetime64(date(1, 1, 1), "D")
+        return tuple(
+            (reservations.columns[name] - epoch).astype(np.int64) + 1
+            for name in ("check_in", "check_out")
+        )
+    return (
+        np.fromiter((r.check_in.toordinal() for r in reservations), dtype=np.int64, count=len(reservations)),
+        np.fromiter((r.check_out.toordinal() for r in reservations), dtype=np.int64, count=len(reservations)),
+    )
+
+
+@dataclass(frozen=True, eq=False)
+class OccupancyIndex:
+    """Which nights were booked, by platform and rental/owner use.
+
+    A night is booked by a reservation if it falls in [check_in,
+    check_out). Nights are counted on one continuous calendar, so stays
+    running from December into January (check_out already moved to the
+    next year by the transform) land in both years. Each (platform,
+    is_rental) pair has an array with the number of bookings per night;
+    nights with more than one booking are double bookings.
+    """
+
+    reservations: Sequence[Reservation]
+    first_day: int
+    counts: dict[tuple[str, bool], np.ndarray]
+    check_in: np.ndarray
+    check_out: np.ndarray
+
+    @classmethod
+    def from_reservations(cls, reservations: Sequence[Reservation]) -> OccupancyIndex:
+        """Build the calendar from reservations or a RecordTable of them."""
+        check_in, check_out = _day_numbers(reservations)
+        if isinstance(reservations, RecordTable):
+            platforms = np.asarray(reservations.columns["platform"], dtype=object)
+            is_rental = reservations.columns["is_rental"]
+        else:
+            platforms = np.array([r.platform for r in reservations], dtype=object)
+            is_rental = np.array([r.is_rental for r in reservations], dtype=bool)
+
+        first_day = int(check_in.min()) if len(check_in) else 0
+        length = int(check_out.max()) - first_day + 1 if len(check_out) else 0
+
+        counts = {}
+        for platform in dict.fromkeys(platforms.tolist()):
+            for rental in (True, False):
+                selected = (platforms == platform) & (is_rental == rental)
+                if not selected.any():
+                    continue
+                # +1 on each check-in night, -1 on each check-out day, then a
+                # running total gives the bookings per night
+                changes = np.bincount(check_in[selected] - first_day, minlength=length + 1)
+                changes -= np.bincount(check_out[selected] - first_day, minlength=length + 1)
+                counts[(platform, rental)] = np.cumsum(changes[:length])
+
+        return cls(reservations, first_day, counts, check_in, check_out)
+
+    def bookings(
+        self,
+        start: date,
+        end: date,
+        platform: str | None = None,
+        is_rental: bool | None = None,
+    ) -> np.ndarray:
+        """Number of matching bookings on each night in [start, end)."""
+        lo = start.toordinal() - self.first_day
+        hi = end.toordinal() - self.first_day
+        result = np.zeros(max(hi - lo, 0), dtype=np.int64)
+        for (key_platform, key_rental), counts in self.counts.items():
+            if platform not in (None, key_platform) or is_rental not in (None, key_rental):
+                continue
+            # Clip the range to the calendar's span
+            a, b = max(lo, 0), min(hi, len(counts))
+            if a < b:
+                result[a - lo:b - lo] += counts[a:b]
+        return result
+
+    def booked(self, start: date, end: date, platform: str | None = None, is_rental: bool | None = None) -> np.ndarray:
+        """Per-night bitmap of [start, end): True where any matching booking."""
+        return self.bookings(start, end, platform, is_rental) > 0
+
+    def booked_nights(
+        self,
+        start: date,
+        end: date,
+        platform: str | None = None,
+        is_rental: bool | None = None,
+    ) -> int:
+        """Nights in [start, end) with at least one matching booking."""
+        return int(np.count_nonzero(self.booked(start, end, platform, is_rental)))
+
+    def occupancy_rate(
+        self,
+        start: date,
+        end: date,
+        platform: str | None = None,
+        is_rental: bool | None = None,
+    ) -> float:
+        """Share of the nights in [start, end) with a matching booking."""
+        days = (end - start).days
+        return self.booked_nights(start, end, platform, is_rental) / days if days > 0 else 0.0
+
+    def breakdown(self, start: date, end: date) -> NightsBreakdown:
+        """Nights of [start, end) that were rented, owner use only, or empty."""
+        rented = self.booked(start, end, is_rental=True)
+        owner = self.booked(start, end, is_rental=False) & ~rented
+        rented_nights = int(np.count_nonzero(rented))
+        owner_nights = int(np.count_nonzero(owner))
+        return NightsBreakdown(rented_nights, owner_nights, len(rented) - rented_nights - owner_nights)
+
+    def gaps(
+        self,
+        start: date,
+        end: date,
+        min_nights: int = 1,
+        platform: str | None = None,
+        is_rental: bool | None = None,
+    ) -> list[tuple[date, date]]:
+        """Runs of at least min_nights unbooked nights, as [first, end) dates."""
+        free = ~self.booked(start, end, platform, is_rental)
+        # Run boundaries are where the bitmap changes value
+        edges = np.flatnonzero(np.diff(np.concatenate(([False], free, [False])).astype(np.int8)))
+        return [
+            (start + timedelta(days=int(a)), start + timedelta(days=int(b)))
+            for a, b in zip(edges[::2], edges[1::2])
+            if b - a >= min_nights
+        ]
+
+    def conflicts(self, start: date | None = None, end: date | None = None) -> list[tuple[Reservation, Reservation]]:
+        """Pairs of reservations sharing at least one night.
+
+        Args:
+            start: Only pairs overlapping on or after this night
+            end: Only pairs overlapping before this night
+
+        Returns:
+            (earlier, later) pairs, ordered by the earlier one's check_in
+        """
+        lo = start.toordinal() if start else -np.inf
+        hi = end.toordinal() if end else np.inf
+        order = np.argsort(self.check_in, kind="stable")
+        check_in = self.check_in[order].tolist()
+        check_out = self.check_out[order].tolist()
+
+        pairs = []
+        for i, first in enumerate(order.tolist()):
+            for j in range(i + 1, len(check_in)):
+                if check_in[j] >= check_out[i]:
+                    break
+                # Shared nights are [check_in[j], min(check_out)); skip empty stays
+                shared_end = min(check_out[i], check_out[j])
+                if check_in[j] < shared_end and check_in[j] < hi and shared_end > lo:
+                    pairs.append((self.reservations[first], self.reservations[int(order[j])]))
+        return pairs
@@ -2,53 +2,347 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from functools import cached_property
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Sequence, TypeVar
 
 import gspread
 
-from etl.config.spreadsheets import SPREADSHEETS
+from etl.aggregates import MetricCube
+from etl.config.spreadsheets import SPREADSHEETS, first_year_for_sheet
 from etl.extract.client import get_client
-from etl.extract.rentals import extract_rentals
-from etl.extract.expenses import extract_expenses
+from etl.extract.plan import build_fetch_plan, fetch_modified_times, fetch_plan
 from etl.models.reservation import Reservation
 from etl.models.expense import Expense
-from etl.transform.reservation import transform_rentals
-from etl.transform.expense import transform_expenses
-from etl.cache import load_from_cache, save_to_cache
+from etl.models.records import RECORD_MODES, ExpenseRecord, ReservationRecord, from_models
+from etl.models.table import RecordTable
+from etl.occupancy import OccupancyIndex
+from etl.profiling import LoadReport, profiled, stage
+from etl.transform import memo
+from etl.transform.memo import config_version
+from etl.transform.parallel import TransformTask, run_transforms
+from etl.cache import (
+    cache_digest,
+    cache_exists,
+    is_stale,
+    load_cache_meta,
+    load_from_cache,
+    load_result_cache,
+    save_result_cache,
+    save_to_cache,
+    touch_cache_entry,
+)
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+T = TypeVar("T")
+
+# Number of spreadsheets fetched from Google Sheets in parallel
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
 class ETLResult:
-    """Result of ETL pipeline."""
+    """Result of ETL pipeline.
+
+    Immutable, so the group-by indexes below are built once, on first
+    access, and can never go stale. Records are either tuples of models
+    (or of their lightweight tuple records, see etl.models.records) or
+    RecordTables, which store them column by column and build models
+    only when they are iterated. report holds the stage timings of the
+    load that produced the result, if it was timed.
+    """
+
+    reservations: Sequence[Reservation]
+    expenses: Sequence[Expense]
+    report: LoadReport | None = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for name in ("reservations", "expenses"):
+            records = getattr(self, name)
+            if not isinstance(records, RecordTable):
+                object.__setattr__(self, name, tuple(records))
 
-    reservations: list[Reservation]
-    expenses: list[Expense]
+    def __getstate__(self) -> dict:
+        # Pickle only the records; indexes are rebuilt on demand
+        return {"reservations": self.reservations, "expenses": self.expenses}
 
-    @property
-    def reservations_by_year(self) -> dict[int, list[Reservation]]:
+    @cached_property
+    def reservation_table(self) -> RecordTable[Reservation]:
+        """Reservations stored column by column."""
+        if isinstance(self.reservations, RecordTable):
+            return self.reservations
+        return RecordTable.from_models(Reservation, self.reservations)
+
+    @cached_property
+    def expense_table(self) -> RecordTable[Expense]:
+        """Expenses stored column by column."""
+        if isinstance(self.expenses, RecordTable):
+            return self.expenses
+        return RecordTable.from_models(Expense, self.expenses)
+
+    @cached_property
+    def reservations_by_year(self) -> Mapping[int, tuple[Reservation, ...]]:
         """Group reservations by year."""
-        result: dict[int, list[Reservation]] = {}
-        for r in self.reservations:
-            if r.year not in result:
-                result[r.year] = []
-            result[r.year].append(r)
-        return result
-
-    @property
-    def expenses_by_year(self) -> dict[int, list[Expense]]:
+        return _group(self.reservations, "year")
+
+    @cached_property
+    def reservations_by_platform(self) -> Mapping[str, tuple[Reservation, ...]]:
+        """Group reservations by normalized platform."""
+        return _group(self.reservations, "platform")
+
+    @cached_property
+    def reservations_by_rental(self) -> Mapping[bool, tuple[Reservation, ...]]:
+        """Split reservations into rentals (True) and owner stays (False)."""
+        return _group(self.reservations, "is_rental")
+
+    @cached_property
+    def rentals_by_year(self) -> Mapping[int, tuple[Reservation, ...]]:
+        """Group rentals (excluding owner stays) by year."""
+        return _group(self.reservations_by_rental.get(True, ()), "year")
+
+    @cached_property
+    def owner_stays_by_year(self) -> Mapping[int, tuple[Reservation, ...]]:
+        """Group owner stays by year."""
+        return _group(self.reservations_by_rental.get(False, ()), "year")
+
+    @cached_property
+    def expenses_by_year(self) -> Mapping[int, tuple[Expense, ...]]:
         """Group expenses by year."""
-        result: dict[int, list[Expense]] = {}
-        for e in self.expenses:
-            if e.year not in result:
-                result[e.year] = []
-            result[e.year].append(e)
-        return result
+        return _group(self.expenses, "year")
+
+    @cached_property
+    def expenses_by_type(self) -> Mapping[str, tuple[Expense, ...]]:
+        """Group expenses by normalized expense type."""
+        return _group(self.expenses, "expense_type")
+
+    @cached_property
+    def cube(self) -> MetricCube:
+        """Precomputed totals for the dashboard metrics."""
+        return MetricCube.from_records(self.reservations, self.expenses)
+
+    @cached_property
+    def occupancy(self) -> OccupancyIndex:
+        """Per-night booking calendar of the reservations."""
+        return OccupancyIndex.from_reservations(self.reservations)
+
+
+def _group(records: Iterable[T], attribute: str) -> Mapping[Any, tuple[T, ...]]:
+    """Read-only index of records by an attribute, keys in first-seen order."""
+    groups: dict[Any, list[T]] = {}
+    key = attrgetter(attribute)
+    for record in records:
+        groups.setdefault(key(record), []).append(record)
+    return MappingProxyType({value: tuple(group) for value, group in groups.items()})
+
+
+def _result_key(jobs: list[tuple[int, str]], digests: dict[tuple[int, str], str | None]) -> str:
+    """Hash identifying a pipeline result by its raw inputs and transform version."""
+    payload = json.dumps({
+        "jobs": jobs,
+        "digests": [digests.get(_cache_entry(*job)) for job in jobs],
+        "config_version": config_version(),
+    })
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def _result_group(jobs: list[tuple[int, str]]) -> str:
+    """Hash identifying a set of jobs, whatever their order.
+
+    Each set of jobs keeps its own cached result, so a partial load
+    (e.g. `python -m etl --years 2024`) leaves the full one in place.
+    """
+    payload = json.dumps(sorted(jobs))
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def _cache_entry(year: int, data_type: str) -> tuple[int, str]:
+    """Cache entry holding a year's raw data (shared worksheets share one)."""
+    return (first_year_for_sheet(year, data_type), data_type)
+
+
+def _download(
+    plan: dict[tuple[str, str], list[tuple[int, str]]],
+    client: gspread.Client,
+    max_workers: int,
+    modified_times: dict[str, str] | None = None,
+) -> dict[tuple[int, str], tuple[str, list[list[str]]]]:
+    """Download planned worksheets and save each to its cache entry.
+
+    Returns:
+        Dictionary mapping cache entry to (content digest, raw rows)
+    """
+    if modified_times is None:
+        spreadsheet_ids = list(dict.fromkeys(spreadsheet_id for spreadsheet_id, _ in plan))
+        modified_times = fetch_modified_times(spreadsheet_ids, client, max_workers)
+
+    result = {}
+    for key, data in fetch_plan(plan, client, max_workers).items():
+        entry = _cache_entry(*plan[key][0])
+        with stage("cache_write", *entry) as details:
+            digest = save_to_cache(*entry, data, modified_time=modified_times.get(key[0]))
+            details["rows"] = len(data)
+        result[entry] = (digest, data)
+    return result
+
+
+def _jobs_for(years: list[int]) -> list[tuple[int, str]]:
+    """List the (year, data_type) sheets to load, in output order."""
+    jobs: list[tuple[int, str]] = []
+    for year in years:
+        config = SPREADSHEETS.get(year, {})
+        if config.get("rentals_sheet"):
+            jobs.append((year, "rentals"))
+        jobs.append((year, "expenses"))
+    return jobs
+
+
+def _sync(
+    jobs: list[tuple[int, str]],
+    client: gspread.Client,
+    max_workers: int,
+    stale_only: bool = False,
+) -> tuple[dict[tuple[int, str], str], dict[tuple[int, str], list[list[str]]]]:
+    """Bring cache entries up to date with Google Sheets.
+
+    Worksheets whose spreadsheet modifiedTime matches the cached one are
+    only marked as checked; the rest are downloaded once each and saved.
+
+    Args:
+        jobs: (year, data_type) sheets to sync
+        client: gspread client
+        max_workers: Number of spreadsheets to fetch in parallel
+        stale_only: Skip entries that are still within their TTL
+
+    Returns:
+        Tuple of (digest per synced cache entry, raw rows per downloaded entry)
+    """
+    plan = build_fetch_plan(jobs)
+    if stale_only:
+        plan = {key: key_jobs for key, key_jobs in plan.items() if is_stale(*_cache_entry(*key_jobs[0]))}
+
+    spreadsheet_ids = list(dict.fromkeys(spreadsheet_id for spreadsheet_id, _ in plan))
+    modified_times = fetch_modified_times(spreadsheet_ids, client, max_workers)
+
+    digests: dict[tuple[int, str], str] = {}
+    stale_plan = {}
+    for key, key_jobs in plan.items():
+        entry = _cache_entry(*key_jobs[0])
+        with stage("cache_check", *entry) as details:
+            meta = load_cache_meta(*entry)
+            digest = None
+            if meta is not None and meta.get("modified_time") == modified_times[key[0]]:
+                digest = cache_digest(*entry)
+            details["cache"] = "miss" if digest is None else "hit"
+        if digest is None:
+            stale_plan[key] = key_jobs
+        else:
+            digests[entry] = digest
+            touch_cache_entry(*entry)
+
+    # Download each changed worksheet once and fan rows out to its years
+    raw = {}
+    for entry, (digest, data) in _download(stale_plan, client, max_workers, modified_times).items():
+        digests[entry] = digest
+        raw[entry] = data
+    return digests, raw
+
+
+def refresh_cache(
+    years: list[int] | None = None,
+    client: gspread.Client | None = None,
+    stale_only: bool = True,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: float | None = None,
+) -> list[tuple[int, str]]:
+    """Update raw cache entries from Google Sheets without transforming.
+
+    Args:
+        years: List of years to refresh (default: all available)
+        client: Optional gspread client
+        stale_only: Only check entries that are past their TTL
+        max_workers: Number of spreadsheets to fetch in parallel (1 = serial)
+        timeout: Per-request timeout in seconds for a client created here
+
+    Returns:
+        Cache entries (first year, data_type) that were re-downloaded
+    """
+    if client is None:
+        client = get_client(timeout=timeout)
+    if years is None:
+        years = list(SPREADSHEETS.keys())
+
+    _, raw = _sync(_jobs_for(years), client, max_workers, stale_only=stale_only)
+    return list(raw)
+
+
+# Held while a background refresh is running, so at most one runs at a time
+_refresh_lock = threading.Lock()
+
+# Set when the latest background refresh failed
+_refresh_failed = threading.Event()
+
+
+def _refresh_in_background(
+    years: list[int],
+    client: gspread.Client | None,
+    max_workers: int,
+    timeout: float | None,
+) -> bool:
+    """Start refreshing stale cache entries on a daemon thread.
+
+    Returns:
+        True if a refresh was started, False if one is already running
+    """
+    if not _refresh_lock.acquire(blocking=False):
+        return False
+
+    def run() -> None:
+        try:
+            refresh_cache(years, client, stale_only=True, max_workers=max_workers, timeout=timeout)
+        except Exception:
+            logger.exception("Background cache refresh failed")
+            _refresh_failed.set()
+        finally:
+            _refresh_lock.release()
+
+    _refresh_failed.clear()
+    threading.Thread(target=run, name="etl-cache-refresh", daemon=True).start()
+    return True
+
+
+def refresh_status() -> str | None:
+    """Get the state of the latest background cache refresh.
+
+    Returns:
+        "running", "failed" (the error is logged), or None if no refresh
+        has been started or the latest one succeeded
+    """
+    if _refresh_lock.locked():
+        return "running"
+    if _refresh_failed.is_set():
+        return "failed"
+    return None
 
 
 def extract_and_transform(
     years: list[int] | None = None,
     client: gspread.Client | None = None,
     use_cache: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: float | None = None,
+    revalidate: bool = False,
+    validation: str = "fast",
+    engine: str = "python",
+    columnar: bool = False,
+    processes: int = 1,
+    records: str = "model",
 ) -> ETLResult:
     """Run the full ETL pipeline.
 
@@ -56,53 +350,182 @@ def extract_and_transform(
         years: List of years to process (default: all available)
         client: Optional gspread client
         use_cache: If True, load from local cache instead of Google Sheets
+        max_workers: Number of spreadsheets to fetch in parallel (1 = serial)
+        timeout: Per-request timeout in seconds for a client created here
+        revalidate: With use_cache, return cached data immediately and
+            refresh entries past their TTL on a background thread
+        validation: Model validation mode, "fast" or "strict" (see
+            etl.models.bulk.build_models); both give identical results
+        engine: Transform engine, "python" or "pandas" (see
+            etl.transform.reservation.transform_rentals)
+        columnar: If True, hold the records in RecordTables rather than
+            as model objects
+        processes: Number of worker processes to transform changed
+            sheets in, one (year, sheet) shard each (1 = in this process)
+        records: Record representation, "model" for pydantic models or
+            "tuple" for ReservationRecord/ExpenseRecord tuples, which
+            take a fraction of the memory; ignored if columnar
 
     Returns:
-        ETLResult with all reservations and expenses
+        ETLResult with all reservations and expenses, and a report of
+        where the load time went (see etl.profiling)
     """
+    if records not in RECORD_MODES:
+        raise ValueError(f"Unknown record mode: {records}")
+
+    report = LoadReport()
+    with report.activate(), profiled("extract_and_transform", report):
+        reservations, expenses = _extract_and_transform(
+            years, client, use_cache, max_workers, timeout, revalidate, validation, engine, processes,
+        )
+        if records == "tuple" and not columnar:
+            # Models were validated by the transforms; records just copy their fields
+            with stage("records"):
+                reservations = from_models(ReservationRecord, reservations)
+                expenses = from_models(ExpenseRecord, expenses)
+        return _result(reservations, expenses, columnar, report)
+
+
+def _extract_and_transform(
+    years: list[int] | None,
+    client: gspread.Client | None,
+    use_cache: bool,
+    max_workers: int,
+    timeout: float | None,
+    revalidate: bool,
+    validation: str,
+    engine: str,
+    processes: int,
+) -> tuple[list[Reservation], list[Expense]]:
+    """Load all reservations and expenses; see extract_and_transform."""
     if not use_cache and client is None:
-        client = get_client()
+        client = get_client(timeout=timeout)
 
     if years is None:
         years = list(SPREADSHEETS.keys())
 
-    all_reservations: list[Reservation] = []
-    all_expenses: list[Expense] = []
+    jobs = _jobs_for(years)
 
-    for year in years:
-        config = SPREADSHEETS.get(year, {})
+    # Content digest and (once loaded) raw rows of each cache entry
+    digests: dict[tuple[int, str], str | None] = {}
+    raw: dict[tuple[int, str], list[list[str]]] = {}
 
-        # Extract and transform rentals (if available)
-        if config.get("rentals_sheet"):
-            if use_cache:
-                raw_rentals = load_from_cache(year, "rentals")
-                if raw_rentals is None:
-                    raise ValueError(f"No cached rentals data for {year}. Fetch live data first.")
+    def repair(entries: list[tuple[int, str]]) -> None:
+        """Refetch cache entries that turned out to be corrupt."""
+        nonlocal client
+        if client is None:
+            client = get_client(timeout=timeout)
+        fresh = _download(build_fetch_plan(entries), client, max_workers)
+        for entry, (digest, data) in fresh.items():
+            digests[entry] = digest
+            raw[entry] = data
+
+    if use_cache:
+        corrupt = []
+        for year, data_type in jobs:
+            entry = _cache_entry(year, data_type)
+            if entry not in digests:
+                with stage("cache_check", *entry) as details:
+                    existed = cache_exists(*entry)
+                    digests[entry] = cache_digest(*entry)
+                    details["cache"] = "miss" if digests[entry] is None else "hit"
+                if digests[entry] is None and existed:
+                    corrupt.append(entry)
+        if corrupt:
+            repair(corrupt)
+
+        for year, data_type in jobs:
+            if digests[_cache_entry(year, data_type)] is None and data_type == "rentals":
+                raise ValueError(f"No cached rentals data for {year}. Fetch live data first.")
+
+        known_years = [year for year in years if year in SPREADSHEETS]
+        if revalidate and any(is_stale(*_cache_entry(*job)) for job in _jobs_for(known_years)):
+            _refresh_in_background(known_years, client, max_workers, timeout)
+    else:
+        synced_digests, synced_raw = _sync(jobs, client, max_workers)
+        digests.update(synced_digests)
+        raw.update(synced_raw)
+
+    # Unchanged inputs: reuse the transformed result without any row parsing
+    with stage("result_cache") as details:
+        cached = load_result_cache(_result_key(jobs, digests), _result_group(jobs))
+        details["cache"] = "miss" if cached is None else "hit"
+    if cached is not None:
+        return cached
+
+    def rows_for(entry: tuple[int, str]) -> list[list[str]]:
+        if entry not in raw:
+            data = load_from_cache(*entry)
+            if data is None:
+                repair([entry])
             else:
-                raw_rentals = extract_rentals(year, client)
-                save_to_cache(year, "rentals", raw_rentals)
-            reservations = transform_rentals(raw_rentals, year)
-            all_reservations.extend(reservations)
-
-        # Extract and transform expenses (if available)
-        if use_cache:
-            raw_expenses = load_from_cache(year, "expenses")
-            if raw_expenses is None:
-                raw_expenses = []
+                raw[entry] = data
+        return raw[entry]
+
+    # Re-transform only years whose rows or transform config changed;
+    # the memo is keyed by digest, so rows are loaded only for misses
+    results: dict[tuple[int, str], list] = {}
+    pending: dict[tuple[int, str], tuple[str, TransformTask]] = {}
+
+    for year, data_type in jobs:
+        entry = _cache_entry(year, data_type)
+        if digests.get(entry) is None:
+            continue  # no cached expenses for this year
+
+        if data_type == "rentals":
+            kind = "rentals"
         else:
-            raw_expenses = extract_expenses(year, client)
-            if raw_expenses:
-                save_to_cache(year, "expenses", raw_expenses)
-
-        if raw_expenses:
-            format_type = config.get("expenses_format", "pivot")
-            expenses = transform_expenses(raw_expenses, year, format_type)
-            all_expenses.extend(expenses)
-
-    return ETLResult(
-        reservations=all_reservations,
-        expenses=all_expenses,
-    )
+            kind = f"expenses:{SPREADSHEETS.get(year, {}).get('expenses_format', 'pivot')}"
+
+        with stage("memo", year, data_type) as details:
+            cached = memo.lookup(kind, year, digests[entry])
+            details["cache"] = "miss" if cached is None else "hit"
+        if cached is not None:
+            results[(year, data_type)] = cached
+            continue
+
+        rows = rows_for(entry)
+        if not rows and data_type != "rentals":
+            continue
+        # Stamp after loading: a repair may have replaced the digest
+        pending[(year, data_type)] = (memo.stamp(digests[entry]), TransformTask(kind, year, rows))
+
+    tasks = [task for _, task in pending.values()]
+    with stage("transform"):
+        # Transforms run here are timed per year; a pool's only as a whole
+        transformed = run_transforms(tasks, processes, validation, engine)
+    for (job, (stamp, task)), records in zip(pending.items(), transformed):
+        memo.store(task.kind, task.year, stamp, records)
+        results[job] = records
+
+    # Merge in job order, however the transforms were scheduled
+    all_reservations: list[Reservation] = []
+    all_expenses: list[Expense] = []
+    for job in jobs:
+        target = all_reservations if job[1] == "rentals" else all_expenses
+        target.extend(results.get(job, ()))
+
+    # Key again: repairs may have replaced some digests
+    with stage("result_save"):
+        save_result_cache(_result_key(jobs, digests), (all_reservations, all_expenses), _result_group(jobs))
+
+    return all_reservations, all_expenses
+
+
+def _result(
+    reservations: list[Reservation],
+    expenses: list[Expense],
+    columnar: bool,
+    report: LoadReport | None = None,
+) -> ETLResult:
+    if columnar:
+        with stage("columnar"):
+            return ETLResult(
+                reservations=RecordTable.from_models(Reservation, reservations),
+                expenses=RecordTable.from_models(Expense, expenses),
+                report=report,
+            )
+    return ETLResult(reservations=reservations, expenses=expenses, report=report)
 
 
 def extract_and_transform_year(
@@ -0,0 +1,218 @@
+"""Stage timings and optional profiler dumps for pipeline runs.
+
+Code anywhere in the pipeline marks its work with stage(); the timing
+is recorded only while a LoadReport is active (see LoadReport.activate)
+and costs next to nothing otherwise. Stages may nest: a stage's seconds
+exclude the stages inside it, so the seconds of every stage run on one
+thread add up to that thread's time in the pipeline.
+
+Set ETL_PROFILE to "cprofile" or "pyinstrument" to also profile each
+pipeline run; dumps are written to ETL_PROFILE_DIR (default: a profiles
+directory in the cache directory).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Profilers accepted in ETL_PROFILE
+PROFILERS = ("cprofile", "pyinstrument")
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """One timed piece of pipeline work.
+
+    cache is "hit" or "miss" for stages that consult a cache, else None.
+    bytes is the size of the data read or fetched, where known.
+    """
+
+    stage: str
+    year: int | None
+    data_type: str | None
+    seconds: float
+    rows: int = 0
+    bytes: int = 0
+    cache: str | None = None
+
+
+@dataclass
+class _Frame:
+    """A stage in progress."""
+
+    report: LoadReport
+    year: int | None
+    data_type: str | None
+    nested_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add_nested(self, seconds: float) -> None:
+        """Count time spent in a nested stage, which may run on another thread."""
+        with self._lock:
+            self.nested_seconds += seconds
+
+
+_frame: ContextVar[_Frame | None] = ContextVar("etl_profiling_frame", default=None)
+
+
+@dataclass
+class LoadReport:
+    """Stage timings of one pipeline run."""
+
+    timings: list[StageTiming] = field(default_factory=list)
+    total_seconds: float = 0.0
+    profile_path: Path | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, timing: StageTiming) -> None:
+        """Record a timing; safe to call from worker threads."""
+        with self._lock:
+            self.timings.append(timing)
+
+    @contextmanager
+    def activate(self) -> Iterator[LoadReport]:
+        """Record stages run in this context, timing the whole block."""
+        token = _frame.set(_Frame(self, None, None))
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.total_seconds += time.perf_counter() - start
+            _frame.reset(token)
+
+    def by_stage(self) -> dict[str, dict[str, Any]]:
+        """Totals per stage, in the order stages first ran."""
+        totals: dict[str, dict[str, Any]] = {}
+        for t in self.timings:
+            total = totals.setdefault(t.stage, {"seconds": 0.0, "rows": 0, "bytes": 0, "hits": 0, "misses": 0})
+            total["seconds"] += t.seconds
+            total["rows"] += t.rows
+            total["bytes"] += t.bytes
+            if t.cache == "hit":
+                total["hits"] += 1
+            elif t.cache == "miss":
+                total["misses"] += 1
+        return totals
+
+    def by_year(self) -> dict[int, float]:
+        """Seconds spent on each year's data, for stages tied to a year."""
+        totals: dict[int, float] = {}
+        for t in self.timings:
+            if t.year is not None:
+                totals[t.year] = totals.get(t.year, 0.0) + t.seconds
+        return totals
+
+
+@contextmanager
+def stage(name: str, year: int | None = None, data_type: str | None = None) -> Iterator[dict[str, Any]]:
+    """Time a stage of work for the active LoadReport, if any.
+
+    A stage without a year takes the year and data type of the stage it
+    runs in. Fill in the yielded dict with "rows", "bytes" or "cache" to
+    record them.
+
+    Example:
+        with stage("cache_read", 2024, "rentals") as details:
+            rows = load_from_cache(2024, "rentals")
+            details["rows"] = len(rows)
+    """
+    parent = _frame.get()
+    details: dict[str, Any] = {}
+    if parent is None:
+        yield details
+        return
+
+    if year is None:
+        year, data_type = parent.year, parent.data_type
+    frame = _Frame(parent.report, year, data_type)
+    token = _frame.set(frame)
+    start = time.perf_counter()
+    try:
+        yield details
+    finally:
+        elapsed = time.perf_counter() - start
+        _frame.reset(token)
+        parent.add_nested(elapsed)
+        parent.report.add(StageTiming(
+            stage=name,
+            year=year,
+            data_type=data_type,
+            seconds=elapsed - frame.nested_seconds,
+            rows=details.get("rows", 0),
+            bytes=details.get("bytes", 0),
+            cache=details.get("cache"),
+        ))
+
+
+def _profile_dir() -> Path:
+    configured = os.environ.get("ETL_PROFILE_DIR")
+    if configured:
+        return Path(configured)
+    from etl.cache import CACHE_DIR
+
+    return CACHE_DIR / "profiles"
+
+
+@contextmanager
+def profiled(name: str, report: LoadReport | None = None) -> Iterator[None]:
+    """Profile the block if ETL_PROFILE is set, dumping the result to a file.
+
+    cprofile writes a .prof file for pstats or snakeviz; pyinstrument (if
+    installed) writes an HTML report. The path is kept on the report.
+    """
+    profiler_name = os.environ.get("ETL_PROFILE", "").lower()
+    if not profiler_name:
+        yield
+        return
+    if profiler_name not in PROFILERS:
+        logger.warning("Unknown ETL_PROFILE %r, expected one of %s", profiler_name, ", ".join(PROFILERS))
+        yield
+        return
+
+    if profiler_name == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            logger.warning("pyinstrument is not installed; profiling with cProfile instead")
+            profiler_name = "cprofile"
+
+    if profiler_name == "pyinstrument":
+        profiler = Profiler()
+        suffix = ".html"
+    else:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        suffix = ".prof"
+
+    directory = _profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}-{datetime.now():%Y%m%d-%H%M%S-%f}{suffix}"
+
+    if profiler_name == "pyinstrument":
+        profiler.start()
+    else:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler_name == "pyinstrument":
+            profiler.stop()
+            path.write_text(profiler.output_html())
+        else:
+            profiler.disable()
+            profiler.dump_stats(path)
+        logger.info("Wrote profile %s", path)
+        if report is not None:
+            report.profile_path = path
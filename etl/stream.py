@@ -0,0 +1,286 @@
+"""Streaming pipeline: raw rows flow through the transforms in chunks.
+
+extract_and_transform holds every sheet's rows and every record in
+memory at once. run_stream instead reads each worksheet (or cache
+entry) a chunk of rows at a time, transforms each chunk as it arrives
+and hands the rows and records to sinks, which write, aggregate or
+export them. Nothing outlives its chunk unless a sink keeps it, so peak
+memory is bounded by the chunk size rather than the size of the sheets.
+
+Example:
+    cube = AggregateSink()
+    run_stream([2024, 2025], [CacheSink(), cube])
+    cube.cube.reservations(2025).revenue
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator
+
+import gspread
+from pydantic import BaseModel
+
+from etl.aggregates import CubeBuilder, MetricCube
+from etl.cache import CacheWriter, iter_cache_chunks
+from etl.config.columns import COLUMN_MAPS
+from etl.config.spreadsheets import SPREADSHEETS
+from etl.extract.batch import iter_worksheet_rows
+from etl.extract.client import get_client
+from etl.extract.plan import build_fetch_plan, fetch_modified_times
+from etl.models.expense import Expense
+from etl.models.reservation import Reservation
+from etl.pipeline import ETLResult, _cache_entry, _jobs_for
+from etl.transform.expense import transform_expenses
+from etl.transform.reservation import transform_rentals
+
+logger = logging.getLogger(__name__)
+
+# Rows read from Google Sheets per request
+DEFAULT_CHUNK_SIZE = 5000
+
+# Every header row has to arrive in a sheet's first chunk
+MIN_CHUNK_SIZE = max(col.data_start_row for col in COLUMN_MAPS.values())
+
+
+class Sink:
+    """Consumer of a streaming run; subclasses override the hooks they need.
+
+    Raw-row hooks are called only for rows read from Google Sheets, once
+    per cache entry (worksheets shared by several years are read once).
+    records is called for every chunk of every (year, data_type) job,
+    possibly with an empty batch.
+    """
+
+    def start(self, jobs: list[tuple[int, str]]) -> None:
+        """The run is about to stream these (year, data_type) jobs, in output order."""
+
+    def start_entry(self, entry: tuple[int, str], modified_time: str | None) -> None:
+        """A cache entry's rows are about to be streamed."""
+
+    def rows(self, entry: tuple[int, str], chunk: list[list[str]]) -> None:
+        """The next chunk of a cache entry's raw rows."""
+
+    def end_entry(self, entry: tuple[int, str]) -> None:
+        """All of a cache entry's rows have been streamed."""
+
+    def records(self, job: tuple[int, str], batch: list[BaseModel]) -> None:
+        """The records transformed from one chunk, for a (year, data_type) job."""
+
+    def close(self) -> None:
+        """The run finished; flush and publish any output."""
+
+    def abort(self) -> None:
+        """The run failed; discard any partial output."""
+
+
+class CacheSink(Sink):
+    """Save raw rows to the local cache as they stream in."""
+
+    def __init__(self) -> None:
+        self._writers: dict[tuple[int, str], CacheWriter] = {}
+        self.digests: dict[tuple[int, str], str] = {}
+
+    def start_entry(self, entry: tuple[int, str], modified_time: str | None) -> None:
+        self._writers[entry] = CacheWriter(*entry, modified_time=modified_time)
+
+    def rows(self, entry: tuple[int, str], chunk: list[list[str]]) -> None:
+        self._writers[entry].append(chunk)
+
+    def end_entry(self, entry: tuple[int, str]) -> None:
+        self.digests[entry] = self._writers.pop(entry).close()
+
+    def abort(self) -> None:
+        for writer in self._writers.values():
+            writer.abort()
+        self._writers.clear()
+
+
+class AggregateSink(Sink):
+    """Aggregate records into a MetricCube without keeping them."""
+
+    def __init__(self) -> None:
+        self._builder = CubeBuilder()
+        self.cube: MetricCube | None = None
+
+    def records(self, job: tuple[int, str], batch: list[BaseModel]) -> None:
+        if job[1] == "rentals":
+            self._builder.add_reservations(batch)
+        else:
+            self._builder.add_expenses(batch)
+
+    def close(self) -> None:
+        self.cube = self._builder.build()
+
+
+class ExportSink(Sink):
+    """Write records to reservations.csv and expenses.csv in a directory."""
+
+    def __init__(self, directory: Path | str):
+        self.directory = Path(directory)
+        self._files: dict[str, tuple[IO[str], Any]] = {}
+
+    def _writer(self, model: type[BaseModel], name: str) -> Any:
+        if name not in self._files:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            f = open(self.directory / f"{name}.csv", "w", newline="", encoding="utf-8")
+            writer = csv.writer(f)
+            writer.writerow(model.model_fields)
+            self._files[name] = (f, writer)
+        return self._files[name][1]
+
+    def records(self, job: tuple[int, str], batch: list[BaseModel]) -> None:
+        if job[1] == "rentals":
+            writer = self._writer(Reservation, "reservations")
+        else:
+            writer = self._writer(Expense, "expenses")
+        writer.writerows([list(record.__dict__.values()) for record in batch])
+
+    def close(self) -> None:
+        for f, _ in self._files.values():
+            f.close()
+        self._files.clear()
+
+    def abort(self) -> None:
+        for f, _ in self._files.values():
+            f.close()
+            Path(f.name).unlink(missing_ok=True)
+        self._files.clear()
+
+
+class CollectSink(Sink):
+    """Keep every record, ordered as extract_and_transform orders them.
+
+    Holds the whole result in memory, so it is mainly for small runs and
+    for checking the stream against the in-memory pipeline.
+    """
+
+    def __init__(self) -> None:
+        self._batches: dict[tuple[int, str], list[BaseModel]] = {}
+        self.result: ETLResult | None = None
+
+    def start(self, jobs: list[tuple[int, str]]) -> None:
+        self._batches = {job: [] for job in jobs}
+
+    def records(self, job: tuple[int, str], batch: list[BaseModel]) -> None:
+        self._batches.setdefault(job, []).extend(batch)
+
+    def close(self) -> None:
+        # Jobs arrive grouped by worksheet; records are merged in job order
+        batches = self._batches.items()
+        self.result = ETLResult(
+            reservations=[r for job, batch in batches if job[1] == "rentals" for r in batch],
+            expenses=[e for job, batch in batches if job[1] == "expenses" for e in batch],
+        )
+
+
+def _transform_chunk(
+    job: tuple[int, str],
+    chunk: list[list[str]],
+    header: bool,
+    validation: str,
+    engine: str,
+) -> list[BaseModel]:
+    year, data_type = job
+    if data_type == "rentals":
+        return transform_rentals(chunk, year, validation, engine, header=header)
+    format_type = SPREADSHEETS.get(year, {}).get("expenses_format", "pivot")
+    return transform_expenses(chunk, year, format_type, validation, engine, header=header)
+
+
+def _cached_chunks(entry: tuple[int, str], chunk_size: int) -> Iterator[list[list[str]]] | None:
+    """A cache entry's rows in chunks of at most chunk_size rows."""
+    groups = iter_cache_chunks(*entry)
+    if groups is None:
+        return None
+    return (group[start:start + chunk_size] for group in groups for start in range(0, len(group), chunk_size))
+
+
+def run_stream(
+    years: list[int] | None = None,
+    sinks: Iterable[Sink] = (),
+    client: gspread.Client | None = None,
+    use_cache: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    validation: str = "fast",
+    engine: str = "python",
+    timeout: float | None = None,
+) -> None:
+    """Stream raw rows and transformed records through sinks.
+
+    Each worksheet is read once, a chunk at a time, and every chunk is
+    transformed for each year that reads the worksheet before the next
+    chunk is read. Unlike extract_and_transform, the transform memo and
+    result cache are not used: both need a sheet's rows all at once. A
+    corrupt cache entry is removed and raises ValueError rather than
+    being refetched.
+
+    Args:
+        years: List of years to process (default: all available)
+        sinks: Consumers of the rows and records; closed when the run
+            finishes, or aborted if it fails
+        client: Optional gspread client
+        use_cache: If True, read the local cache instead of Google
+            Sheets (raw-row hooks are then not called)
+        chunk_size: Rows per chunk
+        validation: Model validation mode, see build_models
+        engine: Transform engine, "python" or "pandas"
+        timeout: Per-request timeout in seconds for a client created here
+    """
+    if chunk_size < MIN_CHUNK_SIZE:
+        raise ValueError(f"chunk_size must be at least {MIN_CHUNK_SIZE}")
+    if years is None:
+        years = list(SPREADSHEETS.keys())
+    if not use_cache and client is None:
+        client = get_client(timeout=timeout)
+
+    sinks = list(sinks)
+    jobs = _jobs_for(years)
+    plan = build_fetch_plan(jobs)
+
+    modified_times: dict[str, str] = {}
+    if not use_cache:
+        spreadsheet_ids = list(dict.fromkeys(spreadsheet_id for spreadsheet_id, _ in plan))
+        modified_times = fetch_modified_times(spreadsheet_ids, client)
+
+    try:
+        for sink in sinks:
+            sink.start(jobs)
+
+        for (spreadsheet_id, worksheet), sheet_jobs in plan.items():
+            entry = _cache_entry(*sheet_jobs[0])
+            if use_cache:
+                chunks = _cached_chunks(entry, chunk_size)
+                if chunks is None:
+                    if entry[1] == "rentals":
+                        raise ValueError(f"No cached rentals data for {entry[0]}. Fetch live data first.")
+                    continue
+            else:
+                chunks = iter_worksheet_rows(client, spreadsheet_id, worksheet, chunk_size)
+                for sink in sinks:
+                    sink.start_entry(entry, modified_times.get(spreadsheet_id))
+
+            logger.info("Streaming %s for %s", worksheet, ", ".join(str(year) for year, _ in sheet_jobs))
+            header = True
+            for chunk in chunks:
+                if not use_cache:
+                    for sink in sinks:
+                        sink.rows(entry, chunk)
+                for job in sheet_jobs:
+                    batch = _transform_chunk(job, chunk, header, validation, engine)
+                    for sink in sinks:
+                        sink.records(job, batch)
+                header = False
+
+            if not use_cache:
+                for sink in sinks:
+                    sink.end_entry(entry)
+    except BaseException:
+        for sink in sinks:
+            sink.abort()
+        raise
+
+    for sink in sinks:
+        sink.close()
@@ -3,23 +3,28 @@
 from __future__ import annotations
 
 import re
+from itertools import islice
 
 from etl.config.expenses import normalize_expense_type
+from etl.models.bulk import build_models
 from etl.models.expense import Expense
-from etl.transform.parsers import parse_currency
+from etl.transform.parsers import parse_currency, parse_currency_fields
+from etl.transform.reservation import ENGINES
 
 
-def transform_expense_pivot(row: list[str], year: int) -> Expense | None:
-    """Transform a pivot format row into an Expense.
+def _pivot_fields(row: list[str], year: int, parse_amounts: bool = True) -> dict | None:
+    """Parse a pivot format row into Expense field values.
 
     Format: [Type, Amount]
 
     Args:
         row: List of cell values [Type, Amount]
         year: The year this data is from
+        parse_amounts: False to leave the amount as the raw cell, for
+            parse_currency_fields to parse in bulk
 
     Returns:
-        Expense object, or None if row should be skipped
+        Dictionary of Expense fields, or None if row should be skipped
     """
     if len(row) < 2:
         return None
@@ -32,25 +37,29 @@ def transform_expense_pivot(row: list[str], year: int) -> Expense | None:
     if expense_type_raw.lower() in ("grand total", "total", "type"):
         return None
 
-    amount = parse_currency(row[1])
+    amount = parse_currency(row[1]) if parse_amounts else row[1]
     expense_type = normalize_expense_type(expense_type_raw)
 
-    return Expense(
-        year=year,
-        expense_type=expense_type,
-        expense_type_raw=expense_type_raw,
-        amount=amount,
-    )
+    return {
+        "year": year,
+        "expense_type": expense_type,
+        "expense_type_raw": expense_type_raw,
+        "amount": amount,
+    }
 
 
-def transform_expense_19(row: list[str]) -> Expense | None:
-    """Transform Expenses 19 format row into an Expense.
+def _expenses_19_fields(row: list[str], parse_amounts: bool = True) -> dict | None:
+    """Parse an Expenses 19 format row into Expense field values.
 
     Format: [Category, Type, Description, Amount, Month]
     Example: ['Running cost', 'Heat & hot water', 'Oil', '$340.26', 'Feb 2019']
 
+    Args:
+        row: List of cell values
+        parse_amounts: As for _pivot_fields
+
     Returns:
-        Expense object, or None if row should be skipped
+        Dictionary of Expense fields, or None if row should be skipped
     """
     if len(row) < 5:
         return None
@@ -63,7 +72,7 @@ def transform_expense_19(row: list[str]) -> Expense | None:
     if expense_type_raw.lower() in ("type", "category"):
         return None
 
-    amount = parse_currency(row[3])  # Amount column
+    amount = parse_currency(row[3]) if parse_amounts else row[3]  # Amount column
     expense_type = normalize_expense_type(expense_type_raw)
 
     # Extract year from Month column (e.g., "Feb 2019" → 2019)
@@ -71,28 +80,29 @@ def transform_expense_19(row: list[str]) -> Expense | None:
     year_match = re.search(r"(\d{4})", month_col)
     year = int(year_match.group(1)) if year_match else 2019
 
-    return Expense(
-        year=year,
-        expense_type=expense_type,
-        expense_type_raw=expense_type_raw,
-        amount=amount,
-    )
+    return {
+        "year": year,
+        "expense_type": expense_type,
+        "expense_type_raw": expense_type_raw,
+        "amount": amount,
+    }
 
 
-def transform_expense_multi_year(row: list[str], target_year: int) -> Expense | None:
-    """Transform multi-year format row into an Expense.
+def _multi_year_fields(row: list[str], target_year: int, parse_amounts: bool = True) -> dict | None:
+    """Parse a multi-year format row into Expense field values.
 
     Format: [year, date, category, description, amount]
     Example: ['2017', '2017-01-01', 'repairs', 'Roof - Paul Johnson', '9000']
 
-    Only returns expense if row's year matches target_year.
+    Only returns fields if row's year matches target_year.
 
     Args:
         row: List of cell values
         target_year: Only return expense if row year matches
+        parse_amounts: As for _pivot_fields
 
     Returns:
-        Expense object, or None if row should be skipped
+        Dictionary of Expense fields, or None if row should be skipped
     """
     if len(row) < 5:
         return None
@@ -117,16 +127,48 @@ def transform_expense_multi_year(row: list[str], target_year: int) -> Expense |
         return None
 
     # Amount is already numeric (no $ sign) but parse_currency handles both
-    amount = parse_currency(row[4])
+    amount = parse_currency(row[4]) if parse_amounts else row[4]
     # Category is already normalized, but run through normalizer for consistency
     expense_type = normalize_expense_type(expense_type_raw)
 
-    return Expense(
-        year=year,
-        expense_type=expense_type,
-        expense_type_raw=expense_type_raw,
-        amount=amount,
-    )
+    return {
+        "year": year,
+        "expense_type": expense_type,
+        "expense_type_raw": expense_type_raw,
+        "amount": amount,
+    }
+
+
+def transform_expense_pivot(row: list[str], year: int) -> Expense | None:
+    """Transform a pivot format row into an Expense.
+
+    Returns:
+        Expense object, or None if row should be skipped
+    """
+    fields = _pivot_fields(row, year)
+    return Expense(**fields) if fields is not None else None
+
+
+def transform_expense_19(row: list[str]) -> Expense | None:
+    """Transform Expenses 19 format row into an Expense.
+
+    Returns:
+        Expense object, or None if row should be skipped
+    """
+    fields = _expenses_19_fields(row)
+    return Expense(**fields) if fields is not None else None
+
+
+def transform_expense_multi_year(row: list[str], target_year: int) -> Expense | None:
+    """Transform multi-year format row into an Expense.
+
+    Only returns expense if row's year matches target_year.
+
+    Returns:
+        Expense object, or None if row should be skipped
+    """
+    fields = _multi_year_fields(row, target_year)
+    return Expense(**fields) if fields is not None else None
 
 
 # Keep old name for backwards compatibility
@@ -134,7 +176,12 @@ transform_expense = transform_expense_pivot
 
 
 def transform_expenses(
-    raw_data: list[list[str]], year: int, format_type: str = "pivot"
+    raw_data: list[list[str]],
+    year: int,
+    format_type: str = "pivot",
+    validation: str = "strict",
+    engine: str = "python",
+    header: bool = True,
 ) -> list[Expense]:
     """Transform all expense rows for a year.
 
@@ -142,25 +189,39 @@ def transform_expenses(
         raw_data: Raw data from spreadsheet (including header row)
         year: The year this data is from
         format_type: One of "pivot", "expenses_19", or "multi_year"
+        validation: "strict" or "fast", see etl.models.bulk.build_models
+        engine: "python" parses row by row; "pandas" parses whole columns
+            at once (see etl.transform.vectorized) with identical results
+        header: False if raw_data is a later chunk of the sheet, with
+            no header row to skip
 
     Returns:
         List of Expense objects
     """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown transform engine: {engine}")
+
     # Skip header row
-    data_rows = raw_data[1:]
-
-    expenses = []
-    for row in data_rows:
-        if format_type == "pivot":
-            expense = transform_expense_pivot(row, year)
-        elif format_type == "expenses_19":
-            expense = transform_expense_19(row)
-        elif format_type == "multi_year":
-            expense = transform_expense_multi_year(row, year)
-        else:
-            expense = transform_expense_pivot(row, year)
-
-        if expense is not None:
-            expenses.append(expense)
-
-    return expenses
+    start = 1 if header else 0
+
+    if engine == "pandas":
+        from etl.transform.vectorized import expense_records
+
+        records = expense_records(raw_data[start:] if start else raw_data, year, format_type)
+    else:
+        records = []
+        for row in islice(raw_data, start, None):
+            if format_type == "pivot":
+                fields = _pivot_fields(row, year, parse_amounts=False)
+            elif format_type == "expenses_19":
+                fields = _expenses_19_fields(row, parse_amounts=False)
+            elif format_type == "multi_year":
+                fields = _multi_year_fields(row, year, parse_amounts=False)
+            else:
+                fields = _pivot_fields(row, year, parse_amounts=False)
+
+            if fields is not None:
+                records.append(fields)
+        parse_currency_fields(records, "amount")
+
+    return build_models(Expense, records, validation)
@@ -0,0 +1,68 @@
+"""Per-year memoization of transform results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict
+
+from etl.config.categories import EXPENSE_MAP
+from etl.config.columns import COLUMN_MAPS, YEAR_LAYOUTS
+from etl.config.platforms import PLATFORM_MAP
+
+# Bump when transform code changes in a way that alters its output
+TRANSFORM_VERSION = 2
+
+# (kind, year) -> (stamp, results)
+_store: dict[tuple[str, int], tuple[str, tuple]] = {}
+
+
+def config_version() -> str:
+    """Version stamp of the transform code and its mapping config."""
+    config = {
+        "transform_version": TRANSFORM_VERSION,
+        "column_maps": {name: asdict(col) for name, col in COLUMN_MAPS.items()},
+        "year_layouts": YEAR_LAYOUTS,
+        "platform_map": PLATFORM_MAP,
+        "expense_map": EXPENSE_MAP,
+    }
+    payload = json.dumps(config, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def stamp(digest: str) -> str:
+    """Stamp of a transform's input: its rows' digest and the config version."""
+    return f"{digest}:{config_version()}"
+
+
+def lookup(kind: str, year: int, digest: str) -> list | None:
+    """Find the memoized result for a year's transform.
+
+    Only the rows' digest is needed, so a hit costs no row loading.
+    Results are keyed by (kind, year) and reused only while both the raw
+    rows and the transform config are unchanged. One result is kept per
+    key, so memory stays bounded by the number of years.
+
+    Args:
+        kind: Transform identifier, e.g. "rentals" or "expenses:pivot"
+        year: The year being transformed
+        digest: rows_digest of the rows the transform would read
+
+    Returns:
+        A copy of the memoized result, or None if there is none for
+        these rows and config
+    """
+    entry = _store.get((kind, year))
+    if entry is not None and entry[0] == stamp(digest):
+        return list(entry[1])
+    return None
+
+
+def store(kind: str, year: int, stamp: str, result: list) -> None:
+    """Memoize a transform result under its input's stamp()."""
+    _store[(kind, year)] = (stamp, tuple(result))
+
+
+def clear_memo() -> None:
+    """Drop all memoized transform results."""
+    _store.clear()
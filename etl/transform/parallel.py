@@ -0,0 +1,73 @@
+"""Run independent per-sheet transforms in worker processes."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from pydantic import BaseModel
+
+from etl.models.expense import Expense
+from etl.models.reservation import Reservation
+from etl.models.table import RecordTable
+from etl.profiling import stage
+from etl.transform.expense import transform_expenses
+from etl.transform.reservation import transform_rentals
+
+
+class TransformTask(NamedTuple):
+    """One shard of transform work: a sheet's rows for one year.
+
+    kind is "rentals" or "expenses:<format>", as used by the memo.
+    """
+
+    kind: str
+    year: int
+    rows: list[list[str]]
+
+
+def run_transform(task: TransformTask, validation: str = "fast", engine: str = "python") -> list[BaseModel]:
+    """Transform one task's rows in this process."""
+    data_type = "rentals" if task.kind == "rentals" else "expenses"
+    with stage("transform", task.year, data_type) as details:
+        details["rows"] = len(task.rows)
+        if task.kind == "rentals":
+            return transform_rentals(task.rows, task.year, validation, engine)
+        _, format_type = task.kind.split(":", 1)
+        return transform_expenses(task.rows, task.year, format_type, validation, engine)
+
+
+def _run_in_worker(task: TransformTask, validation: str, engine: str) -> RecordTable:
+    # Validated in the worker; a RecordTable pickles as a few arrays
+    # rather than one object graph per model
+    model = Reservation if task.kind == "rentals" else Expense
+    return RecordTable.from_models(model, run_transform(task, validation, engine))
+
+
+def run_transforms(
+    tasks: list[TransformTask],
+    processes: int = 1,
+    validation: str = "fast",
+    engine: str = "python",
+) -> list[list[BaseModel]]:
+    """Transform many tasks, in worker processes when processes > 1.
+
+    Largest tasks are submitted first so workers finish close together.
+    Results come back in task order whatever order workers finish in.
+
+    Args:
+        tasks: Independent transform tasks
+        processes: Number of worker processes (1 = run in this process)
+        validation: Model validation mode, see build_models
+        engine: Transform engine, "python" or "pandas"
+
+    Returns:
+        Transformed models per task, in task order
+    """
+    if processes <= 1 or len(tasks) <= 1:
+        return [run_transform(task, validation, engine) for task in tasks]
+
+    order = sorted(range(len(tasks)), key=lambda i: -len(tasks[i].rows))
+    with ProcessPoolExecutor(max_workers=min(processes, len(tasks))) as executor:
+        futures = {i: executor.submit(_run_in_worker, tasks[i], validation, engine) for i in order}
+        return [futures[i].result().to_models() for i in range(len(tasks))]
@@ -4,31 +4,114 @@ from __future__ import annotations
 
 import re
 from datetime import date
+from functools import lru_cache
+from typing import Iterable
+
+import numpy as np
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4,
+    "may": 5, "jun": 6, "jul": 7, "aug": 8,
+    "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# "1-Jan-25", "1-Jan-2025", "9/Jun/17" or "9/Jun/2017"
+_DATE_PATTERN = re.compile(r"(\d{1,2})([-/])([A-Za-z]{3})\2(\d{2,4})")
+
+# Distinct date strings remembered by parse_date
+DATE_MEMO_SIZE = 65536
+
+# Average uses of each distinct string at which parse_currencies parses
+# through a lookup table
+TABLE_MIN_REPEATS = 3
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_NAT = np.datetime64("NaT").astype(np.int64)
 
 
 def parse_currency(value: str) -> float:
     """Parse a currency string to float.
 
+    A minus sign anywhere, or accounting-style parentheses, make the
+    amount negative.
+
     Args:
-        value: Currency string like "$1,234.56", "-$500", or ""
+        value: Currency string like "$1,234.56", "-$500", "($500)", or ""
 
     Returns:
         Float value, or 0.0 for empty/invalid strings
     """
-    if not value or not value.strip():
+    if not value:
         return 0.0
 
-    # Remove $ and commas, handle negative
-    cleaned = value.strip()
-    negative = "-" in cleaned
-    cleaned = cleaned.replace("$", "").replace(",", "").replace("-", "").replace(" ", "")
+    # float() itself ignores surrounding whitespace
+    cleaned = (
+        value.replace("$", "").replace(",", "").replace("-", "").replace(" ", "")
+        .replace("(", "").replace(")", "")
+    )
+    if not cleaned:
+        return 0.0
 
     try:
         result = float(cleaned)
-        return -result if negative else result
     except ValueError:
         return 0.0
 
+    negative = "-" in value or ("(" in value and ")" in value)
+    return -result if negative else result
+
+
+def parse_currencies(values: Iterable[str]) -> np.ndarray:
+    """Parse many currency strings at once.
+
+    When amounts repeat heavily (cleaning fees, recurring bills), each
+    distinct string is parsed once and the rest cost a dictionary
+    lookup. Mostly distinct amounts are parsed one by one, as building
+    the table would cost more than it saves.
+
+    Args:
+        values: Currency strings
+
+    Returns:
+        float64 array of parse_currency results
+    """
+    values = list(values)
+    distinct = set(values)
+    if len(distinct) * TABLE_MIN_REPEATS > len(values):
+        return np.fromiter(map(parse_currency, values), dtype=np.float64, count=len(values))
+    parsed = {value: parse_currency(value) for value in distinct}
+    return np.fromiter(map(parsed.__getitem__, values), dtype=np.float64, count=len(values))
+
+
+def parse_currency_fields(records: list[dict], *names: str) -> None:
+    """Parse currency strings held in records' fields, in place.
+
+    Each named field is parsed as one column with parse_currencies.
+
+    Args:
+        records: Field values per record
+        names: Fields holding unparsed currency strings
+    """
+    for name in names:
+        amounts = parse_currencies([record[name] for record in records]).tolist()
+        for record, amount in zip(records, amounts):
+            record[name] = amount
+
+
+def parse_count(value: str) -> int:
+    """Parse a whole-number cell such as nights or guest count.
+
+    Args:
+        value: Number string like "4", " 12 ", or ""
+
+    Returns:
+        Integer value, or 0 for empty/invalid strings
+    """
+    try:
+        return int(value) if value.strip() else 0
+    except ValueError:
+        return 0
+
 
 def parse_date(value: str, year_hint: int | None = None) -> date | None:
     """Parse a date string to date object.
@@ -37,6 +120,9 @@ def parse_date(value: str, year_hint: int | None = None) -> date | None:
     - "1-Jan-25" or "1-Jan-2025"
     - "9/Jun/17" or "9/Jun/2017"
 
+    Sheets repeat the same dates heavily, so results are memoized per
+    distinct string.
+
     Args:
         value: Date string
         year_hint: Optional year to use for 2-digit year interpretation
@@ -44,56 +130,50 @@ def parse_date(value: str, year_hint: int | None = None) -> date | None:
     Returns:
         date object, or None if parsing fails
     """
-    if not value or not value.strip():
+    if not value:
+        return None
+    return _parse_date(value)
+
+
+@lru_cache(maxsize=DATE_MEMO_SIZE)
+def _parse_date(value: str) -> date | None:
+    match = _DATE_PATTERN.match(value.strip())
+    if match is None:
+        return None
+
+    day, _, month_str, year_str = match.groups()
+    month = MONTHS.get(month_str.lower())
+    if month is None:
+        return None
+
+    year = int(year_str)
+    if year < 100:
+        year = 2000 + year if year < 50 else 1900 + year
+
+    try:
+        return date(year, month, int(day))
+    except ValueError:
         return None
 
-    cleaned = value.strip()
-
-    # Month name mapping
-    months = {
-        "jan": 1, "feb": 2, "mar": 3, "apr": 4,
-        "may": 5, "jun": 6, "jul": 7, "aug": 8,
-        "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-    }
-
-    # Try format: "1-Jan-25" or "1-Jan-2025"
-    match = re.match(r"(\d{1,2})-([A-Za-z]{3})-(\d{2,4})", cleaned)
-    if match:
-        day = int(match.group(1))
-        month_str = match.group(2).lower()
-        year_str = match.group(3)
-
-        month = months.get(month_str)
-        if month is None:
-            return None
-
-        year = int(year_str)
-        if year < 100:
-            year = 2000 + year if year < 50 else 1900 + year
-
-        try:
-            return date(year, month, day)
-        except ValueError:
-            return None
-
-    # Try format: "9/Jun/17" or "9/Jun/2017"
-    match = re.match(r"(\d{1,2})/([A-Za-z]{3})/(\d{2,4})", cleaned)
-    if match:
-        day = int(match.group(1))
-        month_str = match.group(2).lower()
-        year_str = match.group(3)
-
-        month = months.get(month_str)
-        if month is None:
-            return None
-
-        year = int(year_str)
-        if year < 100:
-            year = 2000 + year if year < 50 else 1900 + year
-
-        try:
-            return date(year, month, day)
-        except ValueError:
-            return None
-
-    return None
+
+def parse_dates(values: Iterable[str], year_hint: int | None = None) -> np.ndarray:
+    """Parse many date strings at once.
+
+    Args:
+        values: Date strings
+        year_hint: Optional year to use for 2-digit year interpretation
+
+    Returns:
+        datetime64[D] array, NaT where parse_date returns None
+    """
+    days = np.fromiter(map(_day_number, values), dtype=np.int64)
+    return days.view("datetime64[D]")
+
+
+@lru_cache(maxsize=DATE_MEMO_SIZE)
+def _day_number(value: str) -> int:
+    """Days since 1970-01-01 of a date string, or the NaT value."""
+    parsed = parse_date(value)
+    if parsed is None:
+        return _NAT
+    return parsed.toordinal() - _EPOCH_ORDINAL
@@ -3,20 +3,72 @@
 from __future__ import annotations
 
 from datetime import date
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import Callable
 
 from etl.config.columns import get_column_map
 from etl.config.platforms import normalize_platform
+from etl.models.bulk import build_models
 from etl.models.reservation import Reservation
-from etl.transform.parsers import parse_currency, parse_date
+from etl.transform.parsers import parse_count, parse_currency, parse_currency_fields, parse_date
 
+# Transform engines accepted by transform_rentals
+ENGINES = ("python", "pandas")
 
-def _get_cell(row: list[str], index: int | None, default: str = "") -> str:
-    """Safely get a cell value from a row."""
-    if index is None:
-        return default
-    if index >= len(row):
-        return default
-    return row[index]
+# Guest names marking summary/header rows
+SKIP_NAMES = ("name", "total", "grand total", "")
+
+
+# Cells the row decoders return, in order
+ROW_FIELDS = (
+    "platform", "check_in", "check_out", "nights",
+    "guest_name", "guest_count", "total_revenue", "cleaning_fee",
+)
+
+
+def row_decoder(year: int) -> Callable[[list[str]], tuple[str, ...]]:
+    """Get the compiled row decoder for a year's rentals layout.
+
+    The decoder returns a row's ROW_FIELDS cells, with "" for cells past
+    the end of the row and "offline" as the platform of layouts without a
+    platform column (2017).
+
+    Args:
+        year: The year of the rentals sheet
+
+    Returns:
+        Function mapping a row to its cells
+    """
+    col = get_column_map(year)
+    return _compile_decoder(tuple(getattr(col, name) for name in ROW_FIELDS))
+
+
+@lru_cache(maxsize=None)
+def _compile_decoder(indices: tuple[int | None, ...]) -> Callable[[list[str]], tuple[str, ...]]:
+    """Build one itemgetter-based decoder per distinct column layout."""
+    width = max(index for index in indices if index is not None) + 1
+
+    # Missing columns read from slots appended after the row's own cells
+    extras = ["", "offline"]
+    positions = [width if index is None else index for index in indices]
+    if indices[0] is None:
+        positions[0] = width + 1
+    needs_extras = None in indices
+
+    getter = itemgetter(*positions)
+    pads = [[""] * (width - n) + extras for n in range(width)]
+
+    def decode(row: list[str]) -> tuple[str, ...]:
+        n = len(row)
+        if n < width:
+            return getter(row + pads[n])
+        if needs_extras:
+            return getter(row[:width] + extras)
+        return getter(row)
+
+    return decode
 
 
 def _is_rental(platform: str, guest_name: str) -> bool:
@@ -28,40 +80,47 @@ def _is_rental(platform: str, guest_name: str) -> bool:
     return True
 
 
-def transform_reservation(row: list[str], year: int) -> Reservation | None:
-    """Transform a single row into a Reservation.
+def _reservation_fields(
+    row: list[str],
+    year: int,
+    decode: Callable[[list[str]], tuple[str, ...]] | None = None,
+    parse_amounts: bool = True,
+) -> dict | None:
+    """Parse a single row into Reservation field values.
 
     Args:
         row: List of cell values from the spreadsheet
         year: The year this data is from
+        decode: The year's row_decoder, if already looked up
+        parse_amounts: False to leave total_revenue and cleaning_fee as
+            the raw cells, for parse_currency_fields to parse in bulk
 
     Returns:
-        Reservation object, or None if row should be skipped
+        Dictionary of Reservation fields, or None if row should be skipped
     """
-    col = get_column_map(year)
+    if decode is None:
+        decode = row_decoder(year)
+    (
+        platform_raw, check_in_str, check_out_str, nights_str,
+        guest_name, guest_count_str, total_revenue_str, cleaning_fee_str,
+    ) = decode(row)
 
-    # Get raw platform
-    platform_raw = _get_cell(row, col.platform, "").strip()
-    if not platform_raw and col.platform is None:
-        platform_raw = "offline"  # Default for 2017
+    # Get raw platform ("offline" from the decoder when there is no column)
+    platform_raw = platform_raw.strip()
 
     # Skip empty rows
-    guest_name = _get_cell(row, col.guest_name, "").strip()
+    guest_name = guest_name.strip()
     if not guest_name:
         return None
 
     # Skip summary/header rows
-    skip_names = ["name", "total", "grand total", ""]
-    if guest_name.lower() in skip_names:
+    if guest_name.lower() in SKIP_NAMES:
         return None
 
     # Normalize platform
     platform = normalize_platform(platform_raw)
 
     # Parse dates
-    check_in_str = _get_cell(row, col.check_in, "")
-    check_out_str = _get_cell(row, col.check_out, "")
-
     check_in = parse_date(check_in_str, year)
     check_out = parse_date(check_out_str, year)
 
@@ -79,61 +138,88 @@ def transform_reservation(row: list[str], year: int) -> Reservation | None:
         if check_out.month == 1 and check_in.month == 12:
             check_out = check_out.replace(year=check_out.year + 1)
 
-    # Parse nights
-    nights_str = _get_cell(row, col.nights, "0")
-    try:
-        nights = int(nights_str) if nights_str.strip() else 0
-    except ValueError:
-        nights = 0
-
-    # Parse guest count
-    guest_count_str = _get_cell(row, col.guest_count, "0")
-    try:
-        guest_count = int(guest_count_str) if guest_count_str.strip() else 0
-    except ValueError:
-        guest_count = 0
+    # Parse nights and guest count
+    nights = parse_count(nights_str)
+    guest_count = parse_count(guest_count_str)
 
     # Parse revenue
-    total_revenue = parse_currency(_get_cell(row, col.total_revenue, ""))
-    cleaning_fee = parse_currency(_get_cell(row, col.cleaning_fee, ""))
+    if parse_amounts:
+        total_revenue = parse_currency(total_revenue_str)
+        cleaning_fee = parse_currency(cleaning_fee_str)
+    else:
+        total_revenue, cleaning_fee = total_revenue_str, cleaning_fee_str
 
     # Determine if rental
     is_rental = _is_rental(platform, guest_name)
 
-    return Reservation(
-        year=year,
-        platform=platform,
-        platform_raw=platform_raw,
-        check_in=check_in,
-        check_out=check_out,
-        nights=nights,
-        guest_name=guest_name,
-        guest_count=guest_count,
-        total_revenue=total_revenue,
-        cleaning_fee=cleaning_fee,
-        is_rental=is_rental,
-    )
+    return {
+        "year": year,
+        "platform": platform,
+        "platform_raw": platform_raw,
+        "check_in": check_in,
+        "check_out": check_out,
+        "nights": nights,
+        "guest_name": guest_name,
+        "guest_count": guest_count,
+        "total_revenue": total_revenue,
+        "cleaning_fee": cleaning_fee,
+        "is_rental": is_rental,
+    }
+
+
+def transform_reservation(row: list[str], year: int) -> Reservation | None:
+    """Transform a single row into a Reservation.
+
+    Args:
+        row: List of cell values from the spreadsheet
+        year: The year this data is from
+
+    Returns:
+        Reservation object, or None if row should be skipped
+    """
+    fields = _reservation_fields(row, year)
+    if fields is None:
+        return None
+    return Reservation(**fields)
 
 
 def transform_rentals(
-    raw_data: list[list[str]], year: int
+    raw_data: list[list[str]],
+    year: int,
+    validation: str = "strict",
+    engine: str = "python",
+    header: bool = True,
 ) -> list[Reservation]:
     """Transform all rental rows for a year.
 
     Args:
         raw_data: Raw data from spreadsheet (including header row)
         year: The year this data is from
+        validation: "strict" or "fast", see etl.models.bulk.build_models
+        engine: "python" parses row by row; "pandas" parses whole columns
+            at once (see etl.transform.vectorized) with identical results
+        header: False if raw_data is a later chunk of the sheet, with
+            no header rows to skip
 
     Returns:
         List of Reservation objects
     """
-    col = get_column_map(year)
-    data_rows = raw_data[col.data_start_row:]
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown transform engine: {engine}")
+
+    start = get_column_map(year).data_start_row if header else 0
+
+    if engine == "pandas":
+        from etl.transform.vectorized import reservation_records
 
-    reservations = []
-    for row in data_rows:
-        reservation = transform_reservation(row, year)
-        if reservation is not None:
-            reservations.append(reservation)
+        records = reservation_records(raw_data[start:] if start else raw_data, year)
+    else:
+        decode = row_decoder(year)
+        records = []
+        for row in islice(raw_data, start, None):
+            fields = _reservation_fields(row, year, decode, parse_amounts=False)
+            if fields is not None:
+                records.append(fields)
+        parse_currency_fields(records, "total_revenue", "cleaning_fee")
 
-    return reservations
+    return build_models(Reservation, records, validation)
@@ -1,8 +1,11 @@
 """Pytest fixtures."""
 
+import threading
+
 import pytest
 from datetime import date
 
+import etl.cache
 from etl.models.reservation import Reservation
 from etl.models.expense import Expense
 
@@ -64,3 +67,104 @@ def sample_2017_rental_row() -> list[str]:
     row[3] = "Tony Lynn"
     row[11] = "$1,200"
     return row
+
+
+def rental_row(platform: str, check_in: str, check_out: str, name: str, total: str) -> list[str]:
+    """A raw row in the 2024 rentals layout."""
+    row = [""] * 20
+    row[0] = platform
+    row[1] = check_in
+    row[2] = check_out
+    row[3] = "3"
+    row[4] = name
+    row[5] = "2"
+    row[13] = total
+    return row
+
+
+# Worksheets served by FakeClient, by title
+SHEETS = {
+    "Rentals 25": [
+        ["2025", "Check-in", "Check-out", "# nights", "Name"],
+        rental_row("Airbnb", "1-Jun-25", "4-Jun-25", "Ann", "$900"),
+        rental_row("VRBO", "5-Jun-25", "8-Jun-25", "Bob", "$1,000"),
+    ],
+    "Rentals 24": [
+        ["2024", "Check-in", "Check-out", "# nights", "Name"],
+        rental_row("Airbnb", "1-Jul-24", "4-Jul-24", "Cal", "$800"),
+    ],
+    "Rentals 18": [
+        ["", "2018"],
+        ["", "Platform", "Check-in", "Check-out", "# nights", "Name"],
+    ],
+    "Rentals 17": [
+        ["2017"],
+        ["Check-in", "Check-out", "# nights", "Name"],
+    ],
+    "Expenses 2016-2018": [
+        ["year", "date", "category", "description", "amount"],
+        ["2016", "2016-05-01", "repairs", "Deck", "1200"],
+        ["2017", "2017-01-01", "repairs", "Roof", "9000"],
+        ["2018", "2018-03-01", "supplies", "Soap", "40"],
+    ],
+    "Expenses Pivot": [
+        ["Type", "Amount"],
+        ["Cleaning", "$350"],
+        ["Grand Total", "$350"],
+    ],
+}
+
+
+class FakeClient:
+    """Minimal stand-in for gspread.Client recording API usage."""
+
+    def __init__(self):
+        self.calls = []
+        self.modified_times = {}
+        self.http_client = self
+        self._lock = threading.Lock()
+
+    def batch_calls(self):
+        return [call for call in self.calls if call[0] == "values_batch_get"]
+
+    def get_file_drive_metadata(self, spreadsheet_id):
+        with self._lock:
+            self.calls.append(("get_file_drive_metadata", spreadsheet_id))
+        return {"id": spreadsheet_id, "modifiedTime": self.modified_times.get(spreadsheet_id, "2025-01-01T00:00:00.000Z")}
+
+    def fetch_sheet_metadata(self, spreadsheet_id, params=None):
+        with self._lock:
+            self.calls.append(("fetch_sheet_metadata", spreadsheet_id))
+        # Grids run on past the last row with values, as in new sheets
+        return {"sheets": [
+            {"properties": {"title": name, "gridProperties": {"rowCount": len(rows) + 10}}}
+            for name, rows in SHEETS.items()
+        ]}
+
+    def values_batch_get(self, spreadsheet_id, ranges):
+        with self._lock:
+            self.calls.append(("values_batch_get", spreadsheet_id, tuple(ranges)))
+        value_ranges = []
+        for range_name in ranges:
+            quoted, _, window = range_name.rpartition("!") if "!" in range_name else (range_name, "", "")
+            name = quoted[1:-1].replace("''", "'")
+            # The API drops trailing empty cells from each row
+            rows = [list(row) for row in SHEETS[name]]
+            for row in rows:
+                while row and row[-1] == "":
+                    row.pop()
+            if window:
+                start, end = (int(n) for n in window.split(":"))
+                rows = rows[start - 1:end]
+            # ... and trailing empty rows
+            while rows and not rows[-1]:
+                rows.pop()
+            value_ranges.append({"range": range_name, "values": rows})
+        return {"spreadsheetId": spreadsheet_id, "valueRanges": value_ranges}
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache at a fresh temporary directory."""
+    monkeypatch.setattr(etl.cache, "CACHE_DIR", tmp_path)
+    return tmp_path
@@ -0,0 +1,103 @@
+"""Tests for the precomputed metric cube."""
+
+from datetime import date
+
+import pytest
+
+from etl.aggregates import ExpenseTotals, MetricCube, ReservationTotals
+from etl.models import Expense, RecordTable, Reservation
+
+
+def _reservation(year: int, platform: str, nights: int, revenue: float, is_rental: bool = True) -> Reservation:
+    return Reservation(
+        year=year,
+        platform=platform,
+        platform_raw=platform.title(),
+        check_in=date(year, 6, 1),
+        check_out=date(year, 6, 1 + nights),
+        nights=nights,
+        guest_name="Guest",
+        guest_count=2,
+        total_revenue=revenue,
+        cleaning_fee=0.0,
+        is_rental=is_rental,
+    )
+
+
+def _expense(year: int, expense_type: str, amount: float) -> Expense:
+    return Expense(year=year, expense_type=expense_type, expense_type_raw=expense_type, amount=amount)
+
+
+@pytest.fixture
+def reservations():
+    return [
+        _reservation(2024, "airbnb", 3, 900.0),
+        _reservation(2024, "vrbo", 2, 500.0),
+        _reservation(2024, "owner", 7, 0.0, is_rental=False),
+        _reservation(2025, "airbnb", 4, 1200.0),
+        _reservation(2025, "airbnb", 1, 300.0),
+    ]
+
+
+@pytest.fixture
+def expenses():
+    return [
+        _expense(2024, "cleaning", 100.0),
+        _expense(2024, "utilities", 50.0),
+        _expense(2025, "cleaning", 75.0),
+    ]
+
+
+@pytest.fixture
+def cube(reservations, expenses):
+    return MetricCube.from_records(reservations, expenses)
+
+
+class TestMetricCube:
+    """Tests for MetricCube queries."""
+
+    def test_cell(self, cube):
+        assert cube.reservations(2025, "airbnb", True) == ReservationTotals(count=2, nights=5, revenue=1500.0)
+
+    def test_rollups(self, cube):
+        assert cube.reservations(2024, is_rental=True) == ReservationTotals(count=2, nights=5, revenue=1400.0)
+        assert cube.reservations(2024, is_rental=False).nights == 7
+        assert cube.reservations(platform="airbnb") == ReservationTotals(count=3, nights=8, revenue=2400.0)
+        assert cube.reservations() == ReservationTotals(count=5, nights=17, revenue=2900.0)
+
+    def test_expense_rollups(self, cube):
+        assert cube.expenses(2024) == ExpenseTotals(count=2, amount=150.0)
+        assert cube.expenses(expense_type="cleaning") == ExpenseTotals(count=2, amount=175.0)
+        assert cube.expenses() == ExpenseTotals(count=3, amount=225.0)
+
+    def test_missing_cells_are_zero(self, cube):
+        assert cube.reservations(2019) == ReservationTotals()
+        assert cube.expenses(2025, "utilities") == ExpenseTotals()
+
+    def test_dimensions(self, cube):
+        assert cube.reservation_years == (2024, 2025)
+        assert cube.expense_years == (2024, 2025)
+        assert cube.platforms == ("airbnb", "vrbo", "owner")
+        assert cube.expense_types == ("cleaning", "utilities")
+
+    def test_nights_by_platform(self, cube):
+        assert cube.nights_by_platform(2024) == {"airbnb": 3, "vrbo": 2}
+        assert cube.nights_by_platform() == {"airbnb": 8, "vrbo": 2}
+
+    def test_amount_by_type(self, cube):
+        assert cube.amount_by_type(2025) == {"cleaning": 75.0}
+        assert cube.amount_by_type() == {"cleaning": 175.0, "utilities": 50.0}
+
+    def test_empty(self):
+        cube = MetricCube.from_records([], [])
+
+        assert cube.reservations() == ReservationTotals()
+        assert cube.reservation_years == ()
+
+    def test_tables_match_models(self, cube, reservations, expenses):
+        from_tables = MetricCube.from_records(
+            RecordTable.from_models(Reservation, reservations),
+            RecordTable.from_models(Expense, expenses),
+        )
+
+        assert from_tables == cube
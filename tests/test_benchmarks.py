@@ -0,0 +1,84 @@
+"""Tests for the synthetic workbooks and benchmark suite."""
+
+import json
+
+import pytest
+
+from benchmarks import suite
+from benchmarks.synthetic import (
+    expenses_sheet,
+    format_years,
+    layout_years,
+    rentals_sheet,
+    save_workbook,
+    workbook,
+    workbook_records,
+)
+from etl.config.columns import COLUMN_MAPS
+from etl.config.spreadsheets import SPREADSHEETS, first_year_for_sheet
+from etl.pipeline import _cache_entry, _jobs_for, extract_and_transform
+from etl.transform.expense import transform_expenses
+from etl.transform.reservation import transform_rentals
+
+
+class TestSynthetic:
+    """Tests for synthetic spreadsheets."""
+
+    @pytest.mark.parametrize("layout", list(COLUMN_MAPS))
+    def test_rentals_layouts(self, layout):
+        year = layout_years()[layout]
+        rows = rentals_sheet(year, 100)
+
+        python = transform_rentals(rows, year)
+        assert len(python) == 100
+        assert transform_rentals(rows, year, engine="pandas") == python
+
+    def test_expense_formats(self):
+        assert set(format_years()) == {"pivot", "expenses_19", "multi_year"}
+        for year in (2025, 2019):
+            format_type = SPREADSHEETS[year].get("expenses_format", "pivot")
+            assert len(transform_expenses(expenses_sheet(year, 50), year, format_type)) == 50
+
+        # Rows of a shared sheet are spread over the years that share it
+        rows = expenses_sheet(2018, 50)
+        shared = [y for y in SPREADSHEETS if first_year_for_sheet(y, "expenses") == first_year_for_sheet(2018, "expenses")]
+        assert sum(len(transform_expenses(rows, y, "multi_year")) for y in shared) == 50
+
+    def test_workbook_entries(self):
+        book = workbook(10)
+        assert set(book) == {_cache_entry(*job) for job in _jobs_for(list(SPREADSHEETS))}
+
+    def test_records_match_pipeline(self, cache_dir):
+        book = workbook(30)
+        save_workbook(book)
+
+        result = extract_and_transform(use_cache=True)
+        assert workbook_records(book) == (list(result.reservations), list(result.expenses))
+
+    def test_seeded(self):
+        assert rentals_sheet(2024, 20) == rentals_sheet(2024, 20)
+        assert rentals_sheet(2024, 20) != rentals_sheet(2024, 20, seed=1)
+
+
+class TestSuite:
+    """Tests for the benchmark runner."""
+
+    def test_cases_run(self):
+        cases = suite.build_cases(20)
+        assert {"parsers/parse_date", "etl_result/grouping", "views/trends", "pipeline/cached_load"} <= set(cases)
+        for case in cases.values():
+            case.fn()
+
+    def test_compare(self):
+        baseline = {"fast": 1.0, "slow": 1.0}
+        results = {"fast": 1.1, "slow": 1.5, "new": 2.0}
+        assert suite.compare(results, baseline, tolerance=0.25) == ["slow"]
+
+    def test_save_baselines(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(suite, "BASELINES", tmp_path / "baselines.json")
+        suite.save_baselines(100, {"b": 0.2, "a": 0.1})
+        suite.save_baselines(200, {"a": 0.3})
+
+        baselines = json.loads((tmp_path / "baselines.json").read_text())
+        assert list(baselines["100"]["results"]) == ["a", "b"]
+        assert suite.load_baselines()["200"]["results"] == {"a": 0.3}
@@ -0,0 +1,348 @@
+"""Tests for the local raw data cache."""
+
+import errno
+import gzip
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+import etl.cache
+from etl.cache import (
+    CACHE_FORMATS,
+    CacheWriter,
+    cache_digest,
+    get_cache_info,
+    is_stale,
+    iter_cache_chunks,
+    load_from_cache,
+    load_result_cache,
+    migrate_cache,
+    rows_digest,
+    save_result_cache,
+    save_to_cache,
+)
+from etl.config import cache as cache_config
+
+
+def _files(cache_dir):
+    return sorted(p.name for p in cache_dir.iterdir() if p.suffix != ".lock")
+
+
+WIDE_ROWS = [
+    ["2017", "", "", "", ""],
+    ["Check-in", "Check-out", "# nights", "Name", ""],
+    ["9/Jun/17", "12/Jun/17", "3", "Tony Lynn", ""],
+    ["", "", "", "", ""],
+]
+
+
+class TestColumnarFormat:
+    """Tests for the columnar cache encoding."""
+
+    @pytest.mark.parametrize("rows", [
+        WIDE_ROWS,
+        [],
+        [[]],
+        [["a"], ["b", "c"], [], ["", "", "d"]],  # ragged
+        [["x", ""], ["", ""]],
+    ])
+    def test_roundtrip(self, rows):
+        columnar = CACHE_FORMATS["columnar"]
+        assert columnar.decode(columnar.encode(rows)) == rows
+
+    def test_roundtrip_multiple_row_groups(self, monkeypatch):
+        monkeypatch.setattr(cache_config, "ROW_GROUP_SIZE", 3)
+        rows = [[str(i), "", "x" if i % 2 else ""] for i in range(10)]
+        columnar = CACHE_FORMATS["columnar"]
+        assert columnar.decode(columnar.encode(rows)) == rows
+
+    def test_reads_version_1(self):
+        # Version 1 kept one width for all groups, in the header
+        lines = [
+            {"format": "columnar", "version": 1, "ncols": 3},
+            {"nrows": 2, "columns": [["a", "b"], ["", "c"]]},
+            {"nrows": 1, "columns": [], "widths": [1]},
+        ]
+        payload = gzip.compress("\n".join(json.dumps(line) for line in lines).encode())
+        rows = CACHE_FORMATS["columnar"].decode(payload)
+        assert rows == [["a", "", ""], ["b", "c", ""], [""]]
+
+    def test_smaller_than_json(self):
+        rows = [["1-Jan-24", "name"] + [""] * 36 for _ in range(200)]
+        size_json = len(CACHE_FORMATS["json"].encode(rows))
+        size_columnar = len(CACHE_FORMATS["columnar"].encode(rows))
+        assert size_columnar < size_json / 10
+
+
+class TestCacheFiles:
+    """Tests for reading and writing cache files."""
+
+    def test_save_and_load(self, cache_dir):
+        save_to_cache(2017, "rentals", WIDE_ROWS)
+        assert (cache_dir / "rentals_2017.cols.gz").exists()
+        assert load_from_cache(2017, "rentals") == WIDE_ROWS
+
+    def test_reads_legacy_json(self, cache_dir):
+        (cache_dir / "rentals_2017.json").write_text(json.dumps(WIDE_ROWS, indent=2))
+        assert load_from_cache(2017, "rentals") == WIDE_ROWS
+
+    def test_save_replaces_other_format(self, cache_dir, monkeypatch):
+        monkeypatch.setattr(cache_config, "CACHE_FORMAT", "json")
+        save_to_cache(2017, "rentals", WIDE_ROWS)
+        monkeypatch.setattr(cache_config, "CACHE_FORMAT", "columnar")
+        save_to_cache(2017, "rentals", WIDE_ROWS[:2])
+
+        assert _files(cache_dir) == ["rentals_2017.cols.gz", "rentals_2017.meta.json"]
+        assert load_from_cache(2017, "rentals") == WIDE_ROWS[:2]
+
+    def test_migrate(self, cache_dir):
+        (cache_dir / "rentals_2017.json").write_text(json.dumps(WIDE_ROWS, indent=2))
+
+        report = migrate_cache("columnar")
+
+        assert [row["file"] for row in report] == ["rentals_2017.cols.gz"]
+        assert report[0]["new_bytes"] < report[0]["old_bytes"]
+        assert _files(cache_dir) == ["rentals_2017.cols.gz"]
+        assert load_from_cache(2017, "rentals") == WIDE_ROWS
+
+    def test_migrate_shared_worksheet_copies(self, cache_dir):
+        # Legacy per-year copies of the "Expenses 2016-2018" worksheet
+        for year in (2017, 2018):
+            (cache_dir / f"expenses_{year}.json").write_text(json.dumps(WIDE_ROWS))
+
+        report = migrate_cache("columnar")
+
+        assert [row["file"] for row in report] == ["expenses_2016.cols.gz"]
+        assert _files(cache_dir) == ["expenses_2016.cols.gz"]
+        assert load_from_cache(2018, "expenses") == WIDE_ROWS
+        assert get_cache_info()["files"] == 1
+
+    def test_migrate_drops_copies_of_existing_entry(self, cache_dir):
+        save_to_cache(2016, "expenses", WIDE_ROWS[:2])
+        (cache_dir / "expenses_2017.json").write_text(json.dumps(WIDE_ROWS))
+        (cache_dir / "expenses_2017.meta.json").write_text("{}")
+
+        assert migrate_cache("columnar") == []
+        assert _files(cache_dir) == ["expenses_2016.cols.gz", "expenses_2016.meta.json"]
+        assert load_from_cache(2017, "expenses") == WIDE_ROWS[:2]
+
+    def test_digest_recorded_on_save(self, cache_dir):
+        digest = save_to_cache(2017, "rentals", WIDE_ROWS)
+        assert digest == rows_digest(WIDE_ROWS)
+        assert cache_digest(2017, "rentals") == digest
+
+    def test_digest_backfilled_for_legacy_entry(self, cache_dir):
+        (cache_dir / "rentals_2017.json").write_text(json.dumps(WIDE_ROWS))
+        assert cache_digest(2017, "rentals") == rows_digest(WIDE_ROWS)
+        assert (cache_dir / "rentals_2017.meta.json").exists()
+
+    def test_digest_missing_entry(self, cache_dir):
+        assert cache_digest(2017, "rentals") is None
+
+
+class TestCacheWriter:
+    """Tests for writing cache entries a chunk at a time."""
+
+    def test_matches_save_to_cache(self, cache_dir, monkeypatch):
+        monkeypatch.setattr(cache_config, "ROW_GROUP_SIZE", 3)
+        rows = [[str(i), "", "x" if i % 2 else ""] for i in range(10)] + [[], ["é"]]
+
+        writer = CacheWriter(2024, "rentals", modified_time="t1")
+        for start in range(0, len(rows), 4):
+            writer.append(rows[start:start + 4])
+        digest = writer.close()
+
+        assert digest == rows_digest(rows)
+        assert load_from_cache(2024, "rentals") == rows
+        assert cache_digest(2024, "rentals") == digest
+        assert etl.cache.load_cache_meta(2024, "rentals")["modified_time"] == "t1"
+
+    def test_published_on_close(self, cache_dir):
+        save_to_cache(2024, "rentals", WIDE_ROWS)
+        writer = CacheWriter(2024, "rentals")
+        writer.append([["new"]])
+
+        assert load_from_cache(2024, "rentals") == WIDE_ROWS
+        writer.close()
+        assert load_from_cache(2024, "rentals") == [["new"]]
+
+    def test_abort_keeps_entry(self, cache_dir):
+        save_to_cache(2024, "rentals", WIDE_ROWS)
+        writer = CacheWriter(2024, "rentals")
+        writer.append([["new"]])
+        writer.abort()
+
+        assert load_from_cache(2024, "rentals") == WIDE_ROWS
+        assert _files(cache_dir) == ["rentals_2024.cols.gz", "rentals_2024.meta.json"]
+
+    def test_iter_chunks(self, cache_dir, monkeypatch):
+        monkeypatch.setattr(cache_config, "ROW_GROUP_SIZE", 3)
+        rows = [[str(i)] for i in range(7)]
+        save_to_cache(2024, "rentals", rows)
+
+        assert list(iter_cache_chunks(2024, "rentals")) == [rows[:3], rows[3:6], rows[6:]]
+        assert iter_cache_chunks(2023, "rentals") is None
+
+    def test_iter_chunks_corrupt_entry(self, cache_dir):
+        save_to_cache(2024, "rentals", WIDE_ROWS)
+        path = cache_dir / "rentals_2024.cols.gz"
+        path.write_bytes(path.read_bytes()[:-8])
+
+        with pytest.raises(ValueError):
+            list(iter_cache_chunks(2024, "rentals"))
+        assert _files(cache_dir) == []
+
+
+class TestResultCache:
+    """Tests for the transformed-result cache tier."""
+
+    def test_roundtrip(self, cache_dir):
+        save_result_cache("abc", ([1, 2], [3]), "g1")
+        assert load_result_cache("abc", "g1") == ([1, 2], [3])
+
+    def test_other_key_misses(self, cache_dir):
+        save_result_cache("abc", ([1], []), "g1")
+        assert load_result_cache("def", "g1") is None
+        assert load_result_cache("abc", "g2") is None
+
+    def test_save_replaces_older_result_in_group(self, cache_dir):
+        save_result_cache("abc", ([1], []), "g1")
+        save_result_cache("def", ([2], []), "g1")
+        assert load_result_cache("abc", "g1") is None
+        assert [p.name for p in cache_dir.glob("etl_result_*")] == ["etl_result_g1_def.pkl"]
+
+    def test_other_groups_kept(self, cache_dir):
+        save_result_cache("abc", ([1], []), "g1")
+        save_result_cache("def", ([2], []), "g2")
+        assert load_result_cache("abc", "g1") == ([1], [])
+        assert load_result_cache("def", "g2") == ([2], [])
+
+
+class TestCorruptEntries:
+    """Tests for atomic writes and recovery from corrupt files."""
+
+    def test_truncated_entry_discarded(self, cache_dir):
+        save_to_cache(2017, "rentals", WIDE_ROWS)
+        path = cache_dir / "rentals_2017.cols.gz"
+        path.write_bytes(path.read_bytes()[:20])
+
+        assert load_from_cache(2017, "rentals") is None
+        assert _files(cache_dir) == []
+
+    def test_truncated_json_entry_discarded(self, cache_dir):
+        (cache_dir / "rentals_2017.json").write_text('[["2017", "')
+        assert load_from_cache(2017, "rentals") is None
+        assert cache_digest(2017, "rentals") is None
+
+    def test_read_error_keeps_entry(self, cache_dir, monkeypatch):
+        save_to_cache(2017, "rentals", WIDE_ROWS)
+
+        def fail(path):
+            raise OSError(errno.EIO, "Input/output error")
+
+        with monkeypatch.context() as m:
+            m.setattr(Path, "read_bytes", fail)
+            with pytest.raises(OSError):
+                load_from_cache(2017, "rentals")
+
+        assert load_from_cache(2017, "rentals") == WIDE_ROWS
+
+    def test_bad_gzip_discarded(self, cache_dir):
+        save_to_cache(2017, "rentals", WIDE_ROWS)
+        (cache_dir / "rentals_2017.cols.gz").write_bytes(b"not gzip")
+
+        assert load_from_cache(2017, "rentals") is None
+        assert _files(cache_dir) == []
+
+    def test_corrupt_meta_ignored(self, cache_dir):
+        save_to_cache(2017, "rentals", WIDE_ROWS)
+        (cache_dir / "rentals_2017.meta.json").write_text("{")
+
+        assert cache_digest(2017, "rentals") == rows_digest(WIDE_ROWS)
+
+    def test_corrupt_result_cache_discarded(self, cache_dir):
+        save_result_cache("abc", ([1], []), "g1")
+        (cache_dir / "etl_result_g1_abc.pkl").write_bytes(b"\x80\x05garbage")
+
+        assert load_result_cache("abc", "g1") is None
+        assert not (cache_dir / "etl_result_g1_abc.pkl").exists()
+
+    def test_concurrent_writers_leave_complete_file(self, cache_dir):
+        versions = [[[str(i)] * 30 for _ in range(200)] for i in range(8)]
+        threads = [
+            threading.Thread(target=save_to_cache, args=(2017, "rentals", rows))
+            for rows in versions
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        loaded = load_from_cache(2017, "rentals")
+        assert loaded in versions
+        assert cache_digest(2017, "rentals") == rows_digest(loaded)
+        assert not list(cache_dir.glob("*.tmp"))
+
+    def test_backfill_during_publish_keeps_new_meta(self, cache_dir):
+        (cache_dir / "rentals_2017.json").write_text(json.dumps(WIDE_ROWS))
+        new_rows = WIDE_ROWS[:2]
+        meta = etl.cache._cache_meta(2017, rows_digest(new_rows), "t1")
+        in_window, resume = threading.Event(), threading.Event()
+
+        def write(path):
+            # Old metadata is gone but the old data file is still in place
+            in_window.set()
+            resume.wait()
+            etl.cache._atomic_write(path, CACHE_FORMATS["columnar"].encode(new_rows))
+
+        writer = threading.Thread(target=etl.cache._publish, args=(2017, "rentals", write, meta))
+        writer.start()
+        in_window.wait()
+        digests = []
+        reader = threading.Thread(target=lambda: digests.append(cache_digest(2017, "rentals")))
+        reader.start()
+        reader.join(timeout=0.2)
+        resume.set()
+        writer.join()
+        reader.join()
+
+        assert digests == [rows_digest(new_rows)]
+        assert etl.cache.load_cache_meta(2017, "rentals") == meta
+
+
+class TestStaleness:
+    """Tests for cache entry TTLs."""
+
+    def test_fresh_after_save(self, cache_dir):
+        save_to_cache(2017, "rentals", WIDE_ROWS)
+        assert not is_stale(2017, "rentals")
+
+    def test_stale_after_ttl(self, cache_dir):
+        save_to_cache(2017, "rentals", WIDE_ROWS)
+        fetched_at = etl.cache.load_cache_meta(2017, "rentals")["fetched_at"]
+        assert is_stale(2017, "rentals", now=fetched_at + cache_config.CLOSED_YEAR_TTL + 1)
+
+    def test_missing_entry_is_stale(self, cache_dir):
+        assert is_stale(2017, "rentals")
+
+    def test_open_year_has_short_ttl(self):
+        assert cache_config.cache_ttl(2025) == cache_config.OPEN_YEAR_TTL
+        assert cache_config.cache_ttl(2018) == cache_config.CLOSED_YEAR_TTL
+
+    def test_cache_info_counts_stale(self, cache_dir, monkeypatch):
+        save_to_cache(2017, "rentals", WIDE_ROWS)
+        monkeypatch.setattr(cache_config, "OPEN_YEAR_TTL", -1)
+        save_to_cache(2025, "rentals", WIDE_ROWS)
+
+        info = etl.cache.get_cache_info()
+        assert info["files"] == 2
+        assert info["stale"] == 1
+
+    def test_cache_info_unknown_age(self, cache_dir):
+        save_to_cache(2017, "rentals", WIDE_ROWS)
+        (cache_dir / "rentals_2017.meta.json").write_text(json.dumps({"digest": rows_digest(WIDE_ROWS)}))
+
+        info = etl.cache.get_cache_info()
+        assert (info["stale"], info["unknown"], info["oldest"]) == (0, 1, None)
@@ -0,0 +1,57 @@
+"""Tests for the python -m etl command line."""
+
+import pytest
+
+import etl.pipeline
+from etl.__main__ import main
+from etl.pipeline import extract_and_transform
+from tests.conftest import FakeClient
+
+
+@pytest.fixture
+def cache_dir(cache_dir, monkeypatch):
+    # Runs without a client of their own reach the fake Sheets API
+    monkeypatch.setattr(etl.pipeline, "get_client", lambda timeout=None: FakeClient())
+    return cache_dir
+
+
+class TestMain:
+    """Tests for the CLI entry point."""
+
+    def test_live_run_warms_cache(self, cache_dir, capsys, monkeypatch):
+        assert main(["--years", "2025", "2024"]) == 0
+
+        assert "2025: 2 reservations, 1 expenses" in capsys.readouterr().out
+        assert list(cache_dir.glob("etl_result_*.pkl"))
+
+        # The app's cached load is then served from the transformed result
+        monkeypatch.setattr(etl.pipeline, "load_from_cache", pytest.fail)
+        result = extract_and_transform([2025, 2024], use_cache=True)
+        assert [r.guest_name for r in result.reservations] == ["Ann", "Bob", "Cal"]
+
+    def test_cache_only_needs_no_client(self, cache_dir, monkeypatch):
+        main(["--years", "2025"])
+        monkeypatch.setattr(etl.pipeline, "get_client", pytest.fail)
+
+        assert main(["--years", "2025", "--cache-only"]) == 0
+
+    def test_cache_dir_option(self, cache_dir, tmp_path_factory, monkeypatch):
+        other = tmp_path_factory.mktemp("other") / "nested" / "cache"
+        assert main(["--years", "2025", "--cache-dir", str(other)]) == 0
+
+        assert list(other.glob("etl_result_*.pkl"))
+        assert not list(cache_dir.glob("etl_result_*.pkl"))
+
+    def test_missing_cache_fails(self, cache_dir, capsys):
+        assert main(["--years", "2025", "--cache-only"]) == 1
+
+    def test_unknown_year(self, cache_dir, capsys):
+        assert main(["--years", "1999"]) == 2
+        assert "1999" in capsys.readouterr().err
+
+    def test_migrate_report(self, cache_dir, capsys):
+        main(["--years", "2025"])
+        capsys.readouterr()
+
+        assert main(["--migrate", "json"]) == 0
+        assert "rentals_2025" in capsys.readouterr().out
@@ -1,9 +1,13 @@
 """Tests for Pydantic models."""
 
 from datetime import date
+from typing import get_type_hints
 import pytest
 from pydantic import ValidationError
 
+from etl.models.bulk import build_models, check_columns
+from etl.models.records import ExpenseRecord, ReservationRecord, build_records, from_models, to_models
+from etl.models.table import RecordTable
 from etl.models.reservation import Reservation
 from etl.models.expense import Expense
 
@@ -138,3 +142,146 @@ class TestExpenseModel:
             amount=-50.0,
         )
         assert e.amount == -50.0
+
+
+class TestBuildModels:
+    """Tests for bulk model construction."""
+
+    @pytest.fixture
+    def records(self, sample_reservation):
+        first = sample_reservation.model_dump()
+        second = dict(first, guest_name="Jane Doe", platform="vrbo", is_rental=False)
+        return [first, second]
+
+    @pytest.mark.parametrize("validation", ["strict", "fast"])
+    def test_matches_per_row_validation(self, records, validation):
+        result = build_models(Reservation, records, validation)
+        assert result == [Reservation(**r) for r in records]
+
+    def test_fast_models_are_frozen_and_hashable(self, records):
+        result = build_models(Reservation, records, "fast")
+        with pytest.raises(ValidationError):
+            result[0].nights = 1
+        assert hash(result[0]) == hash(Reservation(**records[0]))
+        assert result[0].model_dump() == records[0]
+
+    @pytest.mark.parametrize("change", [
+        {"platform": "invalid"},
+        {"nights": -1},
+        {"year": 2031},
+        {"check_out": date(2024, 5, 1)},
+    ])
+    def test_fast_falls_back_to_validation_errors(self, records, change):
+        records[1].update(change)
+        assert not check_columns(Reservation, records)
+        with pytest.raises(ValidationError):
+            build_models(Reservation, records, "fast")
+
+    def test_fast_rejects_nan_bounds(self, records):
+        # min()/max() of [nan, -50.0] is nan, which compares false either way
+        records[0]["total_revenue"] = float("nan")
+        records[1]["total_revenue"] = -50.0
+        assert not check_columns(Reservation, records)
+        with pytest.raises(ValidationError):
+            build_models(Reservation, records, "fast")
+
+    def test_fast_coerces_like_strict(self, records):
+        # An int revenue fails the exact type check and is coerced by pydantic
+        records[0]["total_revenue"] = 1500
+        result = build_models(Reservation, records, "fast")
+        assert type(result[0].total_revenue) is float
+
+    def test_negative_expense_amounts_pass_checks(self, sample_expense):
+        records = [sample_expense.model_dump() | {"amount": -50.0}]
+        assert check_columns(Expense, records)
+        assert build_models(Expense, records, "fast")[0].amount == -50.0
+
+    def test_unknown_mode(self, records):
+        with pytest.raises(ValueError):
+            build_models(Reservation, records, "lenient")
+
+
+class TestRecordTable:
+    """Tests for columnar record storage."""
+
+    @pytest.fixture
+    def reservations(self, sample_reservation):
+        second = sample_reservation.model_copy(update={"guest_name": "Jane Doe", "platform": "vrbo"})
+        return [sample_reservation, second]
+
+    def test_roundtrip(self, reservations):
+        table = RecordTable.from_models(Reservation, reservations)
+
+        assert len(table) == 2
+        assert table.to_models() == reservations
+        assert list(table) == reservations
+        assert table == reservations
+
+    def test_materialized_values_keep_python_types(self, reservations):
+        model = RecordTable.from_models(Reservation, reservations)[-1]
+
+        assert model == reservations[1]
+        assert type(model.check_in) is date
+        assert type(model.nights) is int
+        assert type(model.is_rental) is bool
+        assert type(model.platform) is str
+
+    def test_columns(self, reservations):
+        table = RecordTable.from_models(Reservation, reservations)
+
+        assert table.columns["check_in"].dtype == "datetime64[D]"
+        assert list(table.columns["platform"].categories) == ["airbnb", "vrbo"]
+        assert table.to_frame()["total_revenue"].sum() == 3000.0
+
+    def test_slice_is_a_table(self, reservations):
+        table = RecordTable.from_models(Reservation, reservations)
+
+        assert isinstance(table[1:], RecordTable)
+        assert table[1:] == reservations[1:]
+
+    def test_index_out_of_range(self, reservations):
+        with pytest.raises(IndexError):
+            RecordTable.from_models(Reservation, reservations)[2]
+
+    def test_empty(self):
+        table = RecordTable.from_models(Expense, [])
+
+        assert len(table) == 0
+        assert list(table) == []
+
+
+class TestRecords:
+    """Tests for lightweight tuple records."""
+
+    @pytest.mark.parametrize("record_type", [ReservationRecord, ExpenseRecord])
+    def test_fields_mirror_model(self, record_type):
+        model_fields = {name: field.annotation for name, field in record_type.model.model_fields.items()}
+        assert get_type_hints(record_type) == model_fields
+        assert record_type._fields == tuple(model_fields)
+
+    def test_model_roundtrip(self, sample_reservation, sample_expense):
+        record = ReservationRecord.from_model(sample_reservation)
+
+        assert record.guest_name == "John Doe"
+        assert record.to_model() == sample_reservation
+        assert to_models([ExpenseRecord.from_model(sample_expense)]) == [sample_expense]
+
+    @pytest.mark.parametrize("validation", ["strict", "fast"])
+    def test_build_records_matches_models(self, sample_reservation, validation):
+        records = [sample_reservation.model_dump()]
+        records[0]["total_revenue"] = 1500  # coerced to float by validation
+
+        result = build_records(ReservationRecord, records, validation)
+
+        assert result == from_models(ReservationRecord, build_models(Reservation, records))
+        assert type(result[0].total_revenue) is float
+
+    def test_build_records_validates(self, sample_reservation):
+        records = [sample_reservation.model_dump() | {"nights": -1}]
+        with pytest.raises(ValidationError):
+            build_records(ReservationRecord, records, "fast")
+
+    def test_records_are_immutable(self, sample_expense):
+        record = ExpenseRecord.from_model(sample_expense)
+        with pytest.raises(AttributeError):
+            record.amount = 1.0
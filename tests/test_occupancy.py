@@ -0,0 +1,106 @@
+"""Tests for the per-night occupancy calendar."""
+
+from datetime import date
+
+import pytest
+
+from etl.models import RecordTable, Reservation
+from etl.occupancy import NightsBreakdown, OccupancyIndex, year_range
+
+
+def _stay(check_in: date, check_out: date, platform: str = "airbnb", is_rental: bool = True) -> Reservation:
+    return Reservation(
+        year=check_in.year,
+        platform=platform,
+        platform_raw=platform.title(),
+        check_in=check_in,
+        check_out=check_out,
+        nights=(check_out - check_in).days,
+        guest_name="Guest",
+        guest_count=2,
+        total_revenue=100.0,
+        cleaning_fee=0.0,
+        is_rental=is_rental,
+    )
+
+
+@pytest.fixture
+def reservations():
+    return [
+        _stay(date(2024, 6, 1), date(2024, 6, 5)),
+        _stay(date(2024, 6, 4), date(2024, 6, 8), platform="vrbo"),  # Overlaps one night
+        _stay(date(2024, 6, 10), date(2024, 6, 12), platform="owner", is_rental=False),
+        _stay(date(2024, 12, 30), date(2025, 1, 2)),  # Year wraparound
+    ]
+
+
+@pytest.fixture
+def index(reservations):
+    return OccupancyIndex.from_reservations(reservations)
+
+
+class TestOccupancyIndex:
+    """Tests for OccupancyIndex queries."""
+
+    def test_overlapping_nights_count_once(self, index):
+        assert index.booked_nights(date(2024, 6, 1), date(2024, 6, 30), is_rental=True) == 7
+        assert index.bookings(date(2024, 6, 3), date(2024, 6, 6)).tolist() == [1, 2, 1]
+
+    def test_filters(self, index):
+        june = (date(2024, 6, 1), date(2024, 7, 1))
+        assert index.booked_nights(*june, platform="vrbo") == 4
+        assert index.booked_nights(*june, is_rental=False) == 2
+        assert index.booked_nights(*june, platform="owner", is_rental=True) == 0
+
+    def test_wraparound_splits_across_years(self, index):
+        assert index.booked_nights(date(2024, 12, 1), date(2025, 1, 1)) == 2
+        assert index.booked_nights(*year_range(2025)) == 1
+
+    def test_ranges_outside_calendar(self, index):
+        assert index.booked_nights(*year_range(2019)) == 0
+        assert index.booked(date(2024, 5, 30), date(2024, 6, 2)).tolist() == [False, False, True]
+
+    def test_occupancy_rate(self, index):
+        assert index.occupancy_rate(date(2024, 6, 1), date(2024, 6, 11)) == pytest.approx(0.8)
+        assert index.occupancy_rate(date(2024, 6, 1), date(2024, 6, 1)) == 0.0
+
+    def test_breakdown(self, index):
+        assert index.breakdown(*year_range(2024)) == NightsBreakdown(rented=9, owner=2, unoccupied=355)
+
+    def test_owner_nights_exclude_rented(self):
+        index = OccupancyIndex.from_reservations([
+            _stay(date(2024, 6, 1), date(2024, 6, 3)),
+            _stay(date(2024, 6, 2), date(2024, 6, 5), platform="owner", is_rental=False),
+        ])
+        assert index.breakdown(date(2024, 6, 1), date(2024, 6, 6)) == NightsBreakdown(2, 2, 1)
+
+    def test_gaps(self, index):
+        june = (date(2024, 6, 1), date(2024, 6, 15))
+        assert index.gaps(*june) == [
+            (date(2024, 6, 8), date(2024, 6, 10)),
+            (date(2024, 6, 12), date(2024, 6, 15)),
+        ]
+        assert index.gaps(*june, min_nights=3) == [(date(2024, 6, 12), date(2024, 6, 15))]
+
+    def test_conflicts(self, index, reservations):
+        assert index.conflicts() == [(reservations[0], reservations[1])]
+        assert index.conflicts(start=date(2024, 6, 5)) == []
+
+    def test_same_day_stays_book_no_nights(self):
+        same_day = _stay(date(2024, 6, 1), date(2024, 6, 1))
+        index = OccupancyIndex.from_reservations([same_day, _stay(date(2024, 6, 1), date(2024, 6, 3))])
+
+        assert index.booked_nights(*year_range(2024)) == 2
+        assert index.conflicts() == []
+
+    def test_record_table_matches_models(self, index, reservations):
+        from_table = OccupancyIndex.from_reservations(RecordTable.from_models(Reservation, reservations))
+
+        assert from_table.booked(*year_range(2024)).tolist() == index.booked(*year_range(2024)).tolist()
+        assert from_table.conflicts() == index.conflicts()
+
+    def test_empty(self):
+        index = OccupancyIndex.from_reservations([])
+
+        assert index.breakdown(*year_range(2024)) == NightsBreakdown(0, 0, 366)
+        assert index.conflicts() == []
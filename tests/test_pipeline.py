@@ -0,0 +1,298 @@
+"""Tests for pipeline orchestration."""
+
+import dataclasses
+import pickle
+
+import pytest
+
+import etl.cache
+import etl.pipeline
+import etl.transform.parallel
+from etl.config import cache as cache_config
+from etl.models import RecordTable, ReservationRecord
+from etl.models.records import to_models
+from etl.pipeline import extract_and_transform, refresh_cache
+from etl.transform import memo
+from tests.conftest import SHEETS, FakeClient
+
+
+class TestExtractAndTransform:
+    """Tests for extract_and_transform orchestration."""
+
+    def test_concurrent_matches_serial(self, cache_dir):
+        serial = extract_and_transform([2025, 2024], client=FakeClient(), max_workers=1)
+        concurrent = extract_and_transform([2025, 2024], client=FakeClient(), max_workers=4)
+
+        assert concurrent.reservations == serial.reservations
+        assert concurrent.expenses == serial.expenses
+
+    def test_output_order_follows_years(self, cache_dir):
+        result = extract_and_transform([2024, 2025], client=FakeClient(), max_workers=4)
+
+        assert [r.guest_name for r in result.reservations] == ["Cal", "Ann", "Bob"]
+        assert [e.year for e in result.expenses] == [2024, 2025]
+
+    def test_live_load_writes_cache(self, cache_dir):
+        extract_and_transform([2025], client=FakeClient())
+
+        cached = extract_and_transform([2025], use_cache=True)
+        assert [r.guest_name for r in cached.reservations] == ["Ann", "Bob"]
+        assert len(cached.expenses) == 1
+
+    def test_missing_rentals_cache_raises(self, cache_dir):
+        with pytest.raises(ValueError):
+            extract_and_transform([2025], use_cache=True)
+
+    def test_shared_worksheet_fetched_once(self, cache_dir):
+        client = FakeClient()
+        result = extract_and_transform([2018, 2017, 2016], client=client)
+
+        assert client.batch_calls() == [
+            (
+                "values_batch_get",
+                "1o1UXQQcG1hvkDKiLoImyOdFWahudg6yRehXzsqtNlVI",
+                ("'Rentals 18'", "'Expenses 2016-2018'", "'Rentals 17'"),
+            ),
+        ]
+        assert [(e.year, e.amount) for e in result.expenses] == [
+            (2018, 40.0), (2017, 9000.0), (2016, 1200.0),
+        ]
+
+    def test_shared_worksheet_cached_once(self, cache_dir):
+        extract_and_transform([2018, 2017, 2016], client=FakeClient())
+
+        assert sorted(p.name for p in cache_dir.glob("expenses_*") if p.suffix != ".lock") == ["expenses_2016.cols.gz", "expenses_2016.meta.json"]
+
+        cached = extract_and_transform([2018, 2017, 2016], use_cache=True)
+        assert [e.year for e in cached.expenses] == [2018, 2017, 2016]
+
+    def test_one_batch_request_per_spreadsheet(self, cache_dir):
+        client = FakeClient()
+        extract_and_transform([2025, 2024], client=client, max_workers=4)
+
+        assert sorted(call[2] for call in client.batch_calls()) == [
+            ("'Rentals 24'", "'Expenses Pivot'"),
+            ("'Rentals 25'", "'Expenses Pivot'"),
+        ]
+
+    def test_batch_rows_padded_to_rectangle(self, cache_dir):
+        extract_and_transform([2025], client=FakeClient())
+
+        rows = etl.cache.load_from_cache(2025, "rentals")
+        assert len({len(row) for row in rows}) == 1
+        assert [row[:5] for row in rows] == [row[:5] for row in SHEETS["Rentals 25"]]
+
+    def test_unchanged_spreadsheets_not_refetched(self, cache_dir):
+        client = FakeClient()
+        first = extract_and_transform([2025, 2024], client=client)
+
+        client.calls.clear()
+        second = extract_and_transform([2025, 2024], client=client)
+
+        assert client.batch_calls() == []
+        assert len(client.calls) == 2  # one metadata call per spreadsheet
+        assert second.reservations == first.reservations
+        assert second.expenses == first.expenses
+
+    def test_changed_spreadsheet_refetched(self, cache_dir):
+        client = FakeClient()
+        extract_and_transform([2025, 2024], client=client)
+
+        client.calls.clear()
+        client.modified_times["1vJTlvAdimR1qniKr53TxCnfCekxlFCDL3pbB4NN31Os"] = "2025-06-01T00:00:00.000Z"
+        extract_and_transform([2025, 2024], client=client)
+
+        assert [call[1] for call in client.batch_calls()] == ["1vJTlvAdimR1qniKr53TxCnfCekxlFCDL3pbB4NN31Os"]
+
+    def test_cache_load_reuses_transformed_result(self, cache_dir, monkeypatch):
+        extract_and_transform([2025, 2024], client=FakeClient())
+        live = extract_and_transform([2025, 2024], use_cache=True)
+
+        # A warm result cache needs neither raw rows nor transforms
+        monkeypatch.setattr(etl.pipeline, "load_from_cache", pytest.fail)
+        monkeypatch.setattr(etl.transform.parallel, "transform_rentals", pytest.fail)
+        cached = extract_and_transform([2025, 2024], use_cache=True)
+
+        assert cached.reservations == live.reservations
+        assert cached.expenses == live.expenses
+
+    def test_partial_load_keeps_full_result(self, cache_dir, monkeypatch):
+        extract_and_transform([2025, 2024], client=FakeClient())
+        extract_and_transform([2024], use_cache=True)
+
+        # The full result is still cached: no rows are read or transformed
+        monkeypatch.setattr(etl.pipeline, "load_from_cache", pytest.fail)
+        monkeypatch.setattr(etl.transform.parallel, "transform_rentals", pytest.fail)
+        result = extract_and_transform([2025, 2024], use_cache=True)
+
+        assert [r.guest_name for r in result.reservations] == ["Ann", "Bob", "Cal"]
+        assert len(list(cache_dir.glob("etl_result_*.pkl"))) == 2
+
+    def test_memo_hits_read_no_rows(self, cache_dir, monkeypatch):
+        full = extract_and_transform([2025, 2024], client=FakeClient())
+
+        # No cached result for [2025], but its memoized transforms match by digest
+        monkeypatch.setattr(etl.pipeline, "load_from_cache", pytest.fail)
+        result = extract_and_transform([2025], use_cache=True)
+
+        assert list(result.reservations) == list(full.reservations_by_year[2025])
+        assert list(result.expenses) == list(full.expenses_by_year[2025])
+
+    def test_result_cache_invalidated_by_config_version(self, cache_dir, monkeypatch):
+        extract_and_transform([2025], client=FakeClient())
+        extract_and_transform([2025], use_cache=True)
+
+        monkeypatch.setattr(memo, "TRANSFORM_VERSION", memo.TRANSFORM_VERSION + 1)
+        calls = []
+        original = etl.transform.parallel.transform_rentals
+        monkeypatch.setattr(etl.transform.parallel, "transform_rentals", lambda *a: calls.append(a) or original(*a))
+        result = extract_and_transform([2025], use_cache=True)
+
+        assert len(calls) == 1
+        assert [r.guest_name for r in result.reservations] == ["Ann", "Bob"]
+
+    def test_corrupt_cache_entry_refetched(self, cache_dir):
+        extract_and_transform([2025], client=FakeClient())
+        (cache_dir / "rentals_2025.cols.gz").write_bytes(b"\x1f\x8b truncated")
+        for path in cache_dir.glob("etl_result_*.pkl"):
+            path.unlink()
+        # Rows are only read, and found corrupt, by a load that transforms them
+        memo.clear_memo()
+
+        client = FakeClient()
+        result = extract_and_transform([2025], use_cache=True, client=client)
+
+        assert [r.guest_name for r in result.reservations] == ["Ann", "Bob"]
+        assert [call[2] for call in client.batch_calls()] == [("'Rentals 25'",)]
+        assert etl.cache.load_from_cache(2025, "rentals") is not None
+
+    def test_revalidate_refreshes_stale_entries_in_background(self, cache_dir, monkeypatch):
+        extract_and_transform([2025], client=FakeClient())
+        monkeypatch.setattr(cache_config, "OPEN_YEAR_TTL", -1)
+        extract_and_transform([2025], client=FakeClient())  # re-stamp with the new TTL
+
+        client = FakeClient()
+        client.modified_times["1vJTlvAdimR1qniKr53TxCnfCekxlFCDL3pbB4NN31Os"] = "2025-06-01T00:00:00.000Z"
+        result = extract_and_transform([2025], use_cache=True, client=client, revalidate=True)
+
+        # Cached data comes back straight away; the refresh runs afterwards
+        assert [r.guest_name for r in result.reservations] == ["Ann", "Bob"]
+        assert etl.pipeline._refresh_lock.acquire(timeout=5)
+        etl.pipeline._refresh_lock.release()
+        assert len(client.batch_calls()) == 1
+        assert etl.cache.load_cache_meta(2025, "rentals")["modified_time"] == "2025-06-01T00:00:00.000Z"
+
+    def test_refresh_status(self, cache_dir, monkeypatch):
+        extract_and_transform([2025], client=FakeClient())
+        monkeypatch.setattr(cache_config, "OPEN_YEAR_TTL", -1)
+        extract_and_transform([2025], client=FakeClient())
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("no credentials")
+
+        refresh = etl.pipeline.refresh_cache
+        monkeypatch.setattr(etl.pipeline, "refresh_cache", fail)
+        extract_and_transform([2025], use_cache=True, client=FakeClient(), revalidate=True)
+        assert etl.pipeline._refresh_lock.acquire(timeout=5)
+        etl.pipeline._refresh_lock.release()
+        assert etl.pipeline.refresh_status() == "failed"
+
+        monkeypatch.setattr(etl.pipeline, "refresh_cache", refresh)
+        extract_and_transform([2025], use_cache=True, client=FakeClient(), revalidate=True)
+        assert etl.pipeline._refresh_lock.acquire(timeout=5)
+        etl.pipeline._refresh_lock.release()
+        assert etl.pipeline.refresh_status() is None
+
+    def test_revalidate_skips_fresh_entries(self, cache_dir):
+        extract_and_transform([2025], client=FakeClient())
+
+        client = FakeClient()
+        extract_and_transform([2025], use_cache=True, client=client, revalidate=True)
+        assert etl.pipeline._refresh_lock.acquire(timeout=5)
+        etl.pipeline._refresh_lock.release()
+
+        assert client.calls == []
+
+    def test_refresh_cache_marks_unchanged_entries_checked(self, cache_dir, monkeypatch):
+        extract_and_transform([2025], client=FakeClient())
+        fetched_at = etl.cache.load_cache_meta(2025, "rentals")["fetched_at"]
+        monkeypatch.setattr(cache_config, "OPEN_YEAR_TTL", -1)
+
+        client = FakeClient()
+        refreshed = refresh_cache([2025], client=client)
+
+        assert refreshed == []
+        assert client.batch_calls() == []
+        assert etl.cache.load_cache_meta(2025, "rentals")["fetched_at"] >= fetched_at
+
+
+class TestETLResult:
+    """Tests for the immutable ETLResult and its group-by indexes."""
+
+    @pytest.fixture
+    def result(self, cache_dir):
+        return extract_and_transform([2025, 2024], client=FakeClient())
+
+    def test_fields_are_tuples(self, result):
+        assert isinstance(result.reservations, tuple)
+        assert isinstance(result.expenses, tuple)
+
+    def test_frozen(self, result):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.reservations = ()
+
+    def test_indexes_group_records(self, result):
+        assert [r.guest_name for r in result.reservations_by_year[2025]] == ["Ann", "Bob"]
+        assert [r.guest_name for r in result.reservations_by_platform["airbnb"]] == ["Ann", "Cal"]
+        assert [r.guest_name for r in result.rentals_by_year[2024]] == ["Cal"]
+        assert result.owner_stays_by_year == {}
+        assert list(result.expenses_by_type) == ["cleaning"]
+
+    def test_indexes_built_once(self, result):
+        assert result.reservations_by_year is result.reservations_by_year
+        assert result.expenses_by_type is result.expenses_by_type
+
+    def test_indexes_read_only(self, result):
+        with pytest.raises(TypeError):
+            result.reservations_by_year[1999] = ()
+        assert isinstance(result.reservations_by_year[2025], tuple)
+
+    def test_pickle_skips_indexes(self, result):
+        result.reservations_by_year
+        restored = pickle.loads(pickle.dumps(result))
+
+        assert restored == result
+        assert "reservations_by_year" not in restored.__dict__
+        assert restored.reservations_by_year.keys() == result.reservations_by_year.keys()
+
+    def test_cube_built_once(self, result):
+        assert result.cube is result.cube
+        assert result.cube.reservations(2025).count == len(result.reservations_by_year[2025])
+
+    def test_columnar_result_matches(self, result, cache_dir):
+        columnar = extract_and_transform([2025, 2024], client=FakeClient(), columnar=True)
+
+        assert isinstance(columnar.reservations, RecordTable)
+        assert columnar == result
+        assert columnar.reservations_by_year[2025] == result.reservations_by_year[2025]
+        assert columnar.cube == result.cube
+
+    def test_tuple_records_match(self, result, cache_dir):
+        tuples = extract_and_transform([2025, 2024], client=FakeClient(), records="tuple")
+
+        assert all(isinstance(r, ReservationRecord) for r in tuples.reservations)
+        assert to_models(list(tuples.reservations)) == list(result.reservations)
+        assert to_models(list(tuples.expenses)) == list(result.expenses)
+        assert [r.guest_name for r in tuples.rentals_by_year[2024]] == ["Cal"]
+        assert tuples.cube == result.cube
+        assert tuples.reservation_table == result.reservation_table
+
+    def test_unknown_record_mode(self, cache_dir):
+        with pytest.raises(ValueError, match="record mode"):
+            extract_and_transform([2025], client=FakeClient(), records="dict")
+
+    def test_process_pool_matches_in_process(self, result, cache_dir):
+        memo.clear_memo()
+        pooled = extract_and_transform([2025, 2024], client=FakeClient(), processes=2)
+
+        assert pooled == result
@@ -0,0 +1,137 @@
+"""Tests for pipeline stage timings and profiling."""
+
+import contextvars
+import pstats
+import sys
+import threading
+import time
+
+import pytest
+
+from etl import profiling
+from etl.pipeline import extract_and_transform
+from etl.profiling import LoadReport, profiled, stage
+from tests.conftest import FakeClient
+
+
+@pytest.fixture
+def cache_dir(cache_dir, monkeypatch):
+    # Loads are timed, not profiled, whatever the environment says
+    monkeypatch.delenv("ETL_PROFILE", raising=False)
+    return cache_dir
+
+
+class TestStage:
+    """Tests for recording stages."""
+
+    def test_no_report_records_nothing(self):
+        with stage("transform", 2024) as details:
+            details["rows"] = 3
+
+    def test_nested_stages_exclusive(self):
+        report = LoadReport()
+        with report.activate():
+            with stage("transform", 2024, "rentals") as details:
+                details["rows"] = 5
+                with stage("models"):
+                    time.sleep(0.02)
+
+        models, transform = report.timings
+        assert (models.stage, models.year, models.data_type) == ("models", 2024, "rentals")
+        assert models.seconds >= 0.02
+        assert transform.seconds < models.seconds
+        assert transform.rows == 5
+        assert report.total_seconds >= models.seconds + transform.seconds
+
+    def test_nested_stages_on_worker_threads(self):
+        report = LoadReport()
+
+        def fetch():
+            for _ in range(200):
+                with stage("fetch"):
+                    pass
+
+        # Switch threads as often as possible, to expose lost updates
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with report.activate():
+                with stage("extract"):
+                    parent = profiling._frame.get()
+                    threads = [threading.Thread(target=contextvars.copy_context().run, args=(fetch,)) for _ in range(8)]
+                    for thread in threads:
+                        thread.start()
+                    for thread in threads:
+                        thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        fetched = [t.seconds for t in report.timings if t.stage == "fetch"]
+        assert len(fetched) == 1600
+        assert parent.nested_seconds == pytest.approx(sum(fetched))
+
+    def test_totals(self):
+        report = LoadReport()
+        with report.activate():
+            for year, hit in [(2024, True), (2025, False)]:
+                with stage("cache_check", year) as details:
+                    details["cache"] = "hit" if hit else "miss"
+
+        totals = report.by_stage()["cache_check"]
+        assert (totals["hits"], totals["misses"]) == (1, 1)
+        assert set(report.by_year()) == {2024, 2025}
+
+
+class TestPipelineReport:
+    """Tests for the report on pipeline results."""
+
+    def test_live_load(self, cache_dir):
+        result = extract_and_transform([2025, 2024, 2018], client=FakeClient(), max_workers=4)
+
+        stages = result.report.by_stage()
+        assert {"metadata", "extract", "cache_write", "transform", "models"} <= set(stages)
+        assert stages["extract"]["rows"] == stages["cache_write"]["rows"] > 0
+        assert stages["extract"]["bytes"] > 0
+        assert stages["result_cache"]["misses"] == 1
+        assert {2025, 2024, 2018} <= set(result.report.by_year())
+
+    def test_cached_result_load(self, cache_dir):
+        extract_and_transform([2025], client=FakeClient())
+        result = extract_and_transform([2025], use_cache=True)
+
+        stages = result.report.by_stage()
+        assert stages["result_cache"]["hits"] == 1
+        assert stages["cache_check"]["hits"] == 2
+        assert "transform" not in stages
+
+    def test_report_not_compared_or_pickled(self, cache_dir):
+        first = extract_and_transform([2025], client=FakeClient())
+        second = extract_and_transform([2025], use_cache=True)
+
+        assert first == second
+        assert "report" not in first.__getstate__()
+
+
+class TestProfiled:
+    """Tests for profiler dumps."""
+
+    def test_disabled_by_default(self, cache_dir):
+        extract_and_transform([2025], client=FakeClient())
+        assert not (cache_dir / "profiles").exists()
+
+    def test_cprofile_dump(self, cache_dir, tmp_path, monkeypatch):
+        monkeypatch.setenv("ETL_PROFILE", "cprofile")
+        monkeypatch.setenv("ETL_PROFILE_DIR", str(tmp_path / "profiles"))
+
+        result = extract_and_transform([2025], client=FakeClient())
+
+        path = result.report.profile_path
+        assert path.parent == tmp_path / "profiles"
+        assert any(name == "save_to_cache" for _, _, name in pstats.Stats(str(path)).stats)
+
+    def test_unknown_profiler_ignored(self, cache_dir, monkeypatch):
+        monkeypatch.setenv("ETL_PROFILE", "perf")
+        report = LoadReport()
+        with profiled("run", report):
+            pass
+        assert report.profile_path is None
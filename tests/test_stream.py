@@ -0,0 +1,123 @@
+"""Tests for the streaming pipeline."""
+
+import csv
+
+import gspread
+import pytest
+
+import etl.stream
+from etl.cache import load_from_cache
+from etl.extract.batch import iter_worksheet_rows
+from etl.pipeline import extract_and_transform
+from etl.stream import AggregateSink, CacheSink, CollectSink, ExportSink, Sink, run_stream
+from tests.conftest import SHEETS, FakeClient, rental_row
+
+YEARS = [2025, 2024, 2018, 2017, 2016]
+
+
+class TestRunStream:
+    """Tests for run_stream and its sinks."""
+
+    @pytest.mark.parametrize("chunk_size", [2, 3, 100])
+    def test_matches_extract_and_transform(self, cache_dir, chunk_size):
+        expected = extract_and_transform(YEARS, client=FakeClient())
+
+        sink = CollectSink()
+        run_stream(YEARS, [sink], client=FakeClient(), chunk_size=chunk_size)
+
+        assert sink.result.reservations == expected.reservations
+        assert sink.result.expenses == expected.expenses
+
+    def test_shared_sheet_read_once(self, cache_dir):
+        client = FakeClient()
+        run_stream([2018, 2017, 2016], [CollectSink()], client=client, chunk_size=100)
+
+        read = [ranges[0] for _, _, ranges in client.batch_calls()]
+        assert sum(r.startswith("'Expenses 2016-2018'") for r in read) == 1
+
+    def test_cache_sink_then_cached_run(self, cache_dir, monkeypatch):
+        cache = CacheSink()
+        run_stream(YEARS, [cache], client=FakeClient(), chunk_size=2)
+        assert load_from_cache(2025, "rentals")[1][4] == "Ann"
+
+        # A cached run reads back what the stream wrote
+        expected = extract_and_transform(YEARS, client=FakeClient())
+        monkeypatch.setattr(etl.stream, "iter_worksheet_rows", pytest.fail)
+        sink = CollectSink()
+        run_stream(YEARS, [sink], use_cache=True, chunk_size=2)
+
+        assert sink.result.reservations == expected.reservations
+        assert sink.result.expenses == expected.expenses
+
+    def test_aggregate_sink(self, cache_dir):
+        expected = extract_and_transform(YEARS, client=FakeClient())
+
+        sink = AggregateSink()
+        run_stream(YEARS, [sink], client=FakeClient(), chunk_size=2)
+
+        # Same totals; first-seen order differs as shared sheets interleave years
+        assert sink.cube.reservation_cells == expected.cube.reservation_cells
+        assert sink.cube.expense_cells == expected.cube.expense_cells
+        assert set(sink.cube.expense_types) == set(expected.cube.expense_types)
+
+    def test_export_sink(self, cache_dir, tmp_path):
+        run_stream([2025, 2017], [ExportSink(tmp_path / "out")], client=FakeClient(), chunk_size=2)
+
+        with open(tmp_path / "out" / "reservations.csv", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["guest_name"] for row in rows] == ["Ann", "Bob"]
+        assert rows[0]["check_in"] == "2025-06-01"
+
+        with open(tmp_path / "out" / "expenses.csv", newline="") as f:
+            assert [row["amount"] for row in csv.DictReader(f)] == ["350.0", "9000.0"]
+
+    def test_failure_aborts_sinks(self, cache_dir, monkeypatch):
+        class Failing(Sink):
+            def records(self, job, batch):
+                if job == (2024, "rentals"):
+                    raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            run_stream([2025, 2024], [CacheSink(), Failing()], client=FakeClient(), chunk_size=2)
+
+        # Entries finished before the failure stay; the one in progress is dropped
+        assert load_from_cache(2025, "rentals") is not None
+        assert load_from_cache(2024, "rentals") is None
+        assert not list(cache_dir.glob("*.tmp"))
+
+    def test_missing_cached_rentals(self, cache_dir):
+        with pytest.raises(ValueError, match="No cached rentals data for 2025"):
+            run_stream([2025], [CollectSink()], use_cache=True)
+
+    def test_chunk_size_too_small(self, cache_dir):
+        with pytest.raises(ValueError):
+            run_stream([2025], [CollectSink()], client=FakeClient(), chunk_size=1)
+
+
+class TestIterWorksheetRows:
+    """Tests for reading a worksheet in row windows."""
+
+    def test_blank_rows_between_windows(self, monkeypatch):
+        rows = [rental_row("Airbnb", "1-Jun-25", "4-Jun-25", "Ann", "$900"), [], [], ["x"]]
+        monkeypatch.setitem(SHEETS, "Long", rows)
+
+        chunks = list(iter_worksheet_rows(FakeClient(), "id", "Long", chunk_size=2))
+
+        # The blank rows that ended the first window are passed on with the second
+        assert [len(chunk) for chunk in chunks] == [1, 3]
+        assert [cell for chunk in chunks for row in chunk for cell in row if cell] == [
+            cell for row in rows for cell in row if cell
+        ]
+
+    def test_long_blank_run(self, monkeypatch):
+        rows = [["a"], *[[] for _ in range(5)], ["b"], ["c"]]
+        monkeypatch.setitem(SHEETS, "Long", rows)
+
+        chunks = list(iter_worksheet_rows(FakeClient(), "id", "Long", chunk_size=2))
+
+        # Whole windows of blank rows do not end the sheet
+        assert [row for chunk in chunks for row in chunk] == [row or [""] for row in rows]
+
+    def test_missing_worksheet(self):
+        with pytest.raises(gspread.WorksheetNotFound):
+            list(iter_worksheet_rows(FakeClient(), "id", "Nope"))
@@ -0,0 +1,65 @@
+"""Tests for transform memoization."""
+
+import pytest
+
+from etl.config import categories
+from etl.transform.expense import transform_expenses
+from etl.cache import rows_digest
+from etl.transform import memo
+from etl.transform.memo import clear_memo, config_version
+
+
+@pytest.fixture(autouse=True)
+def empty_memo():
+    clear_memo()
+    yield
+    clear_memo()
+
+
+PIVOT_ROWS = [["Type", "Amount"], ["Cleaning", "$350"], ["Yard", "$100"]]
+
+
+class TestMemo:
+    """Tests for the per-year transform memo."""
+
+    def _run(self, rows, calls):
+        digest = rows_digest(rows)
+        result = memo.lookup("expenses:pivot", 2024, digest)
+        if result is None:
+            calls.append(1)
+            result = transform_expenses(rows, 2024, "pivot")
+            memo.store("expenses:pivot", 2024, memo.stamp(digest), result)
+        return result
+
+    def test_unchanged_rows_reuse_result(self):
+        calls = []
+        first = self._run(PIVOT_ROWS, calls)
+        second = self._run([list(row) for row in PIVOT_ROWS], calls)
+
+        assert len(calls) == 1
+        assert second == first
+
+    def test_changed_rows_retransform(self):
+        calls = []
+        self._run(PIVOT_ROWS, calls)
+        changed = PIVOT_ROWS + [["Taxes", "$900"]]
+        result = self._run(changed, calls)
+
+        assert len(calls) == 2
+        assert [e.expense_type for e in result] == ["cleaning", "outdoor", "taxes"]
+
+    def test_config_change_retransforms(self, monkeypatch):
+        calls = []
+        self._run(PIVOT_ROWS, calls)
+        monkeypatch.setitem(categories.EXPENSE_MAP, "Yard", "garden")
+        result = self._run(PIVOT_ROWS, calls)
+
+        assert len(calls) == 2
+        assert result[1].expense_type == "garden"
+
+    def test_digest_is_content_based(self):
+        assert rows_digest(PIVOT_ROWS) == rows_digest([list(row) for row in PIVOT_ROWS])
+        assert rows_digest(PIVOT_ROWS) != rows_digest(PIVOT_ROWS[:2])
+
+    def test_config_version_stable(self):
+        assert config_version() == config_version()
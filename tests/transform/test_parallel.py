@@ -0,0 +1,36 @@
+"""Tests for process-pool transforms."""
+
+import pytest
+
+from etl.transform.parallel import TransformTask, run_transform, run_transforms
+
+
+@pytest.fixture
+def tasks(sample_2024_rental_row, sample_2017_rental_row):
+    return [
+        TransformTask("rentals", 2024, [["2024"], sample_2024_rental_row]),
+        TransformTask("expenses:pivot", 2024, [["Type", "Amount"], ["Cleaning", "$350"], ["Yard", "$100"]]),
+        TransformTask("rentals", 2017, [["2017"], ["Check-in"], sample_2017_rental_row] * 3),
+    ]
+
+
+class TestRunTransforms:
+    """Tests for run_transforms."""
+
+    def test_dispatches_by_kind(self, tasks):
+        assert run_transform(tasks[0])[0].guest_name == "Jane Smith"
+        assert [e.expense_type for e in run_transform(tasks[1])] == ["cleaning", "outdoor"]
+
+    def test_processes_match_in_process(self, tasks):
+        serial = run_transforms(tasks, processes=1)
+        parallel = run_transforms(tasks, processes=2)
+
+        assert parallel == serial
+        assert [len(result) for result in parallel] == [1, 2, 3]
+
+    def test_results_keep_task_order(self, tasks):
+        reordered = [tasks[2], tasks[0], tasks[1]]
+        assert run_transforms(reordered, processes=2) == run_transforms(reordered)
+
+    def test_no_tasks(self):
+        assert run_transforms([], processes=4) == []
@@ -1,9 +1,19 @@
 """Tests for parsing utilities."""
 
+import math
 from datetime import date
+
+import numpy as np
 import pytest
+from hypothesis import given, strategies as st
 
-from etl.transform.parsers import parse_currency, parse_date
+from etl.transform.parsers import (
+    parse_currencies,
+    parse_currency,
+    parse_currency_fields,
+    parse_date,
+    parse_dates,
+)
 
 
 class TestParseCurrency:
@@ -39,6 +49,60 @@ class TestParseCurrency:
     def test_large_number(self):
         assert parse_currency("$61,421") == 61421.0
 
+    def test_parentheses_negative(self):
+        assert parse_currency("($500)") == -500.0
+
+    def test_accounting_format(self):
+        assert parse_currency("$ (1,234.56)") == -1234.56
+
+    def test_trailing_minus(self):
+        assert parse_currency("1,234.56-") == -1234.56
+
+
+def format_amount(cents: int, style: str) -> str:
+    """Format an amount the ways the sheets write it."""
+    text = f"${abs(cents) // 100:,}.{abs(cents) % 100:02d}"
+    if cents >= 0:
+        return text
+    return {"minus": f"-{text}", "spaced": f"- {text}", "parens": f"({text})"}[style]
+
+
+class TestParseCurrencyProperties:
+    """Property-based tests for currency parsing."""
+
+    @given(st.integers(-10**11, 10**11), st.sampled_from(["minus", "spaced", "parens"]))
+    def test_roundtrip(self, cents, style):
+        assert parse_currency(format_amount(cents, style)) == pytest.approx(cents / 100)
+
+    @given(st.text())
+    def test_never_raises(self, value):
+        assert isinstance(parse_currency(value), float)
+
+    @given(st.text(alphabet=" $,-()0123456789.abc\t"))
+    def test_sign_ignores_decoration(self, value):
+        result = parse_currency(value)
+        if not math.isnan(result):
+            assert abs(result) == abs(parse_currency(value.replace("-", "").replace("(", "")))
+
+    @given(st.lists(st.text(alphabet=" $,-()0123456789.", max_size=12)))
+    def test_batch_matches_scalar(self, values):
+        result = parse_currencies(values)
+
+        assert result.dtype == np.float64
+        np.testing.assert_array_equal(result, [parse_currency(v) for v in values])
+
+    @given(st.lists(st.sampled_from(["$5", "($5)", "-$1,000", "", "N/A"]), min_size=1))
+    def test_repeated_batch_matches_scalar(self, values):
+        # Few distinct strings: parsed through the lookup table
+        np.testing.assert_array_equal(parse_currencies(values), [parse_currency(v) for v in values])
+
+    def test_fields_parsed_in_place(self):
+        records = [{"total": "$900", "fee": "$50"}, {"total": "($10)", "fee": "$50"}]
+        parse_currency_fields(records, "total", "fee")
+
+        assert records == [{"total": 900.0, "fee": 50.0}, {"total": -10.0, "fee": 50.0}]
+        assert type(records[0]["total"]) is float
+
 
 class TestParseDate:
     """Tests for parse_date function."""
@@ -80,3 +144,34 @@ class TestParseDate:
             result = parse_date(f"15-{month}-24")
             assert result is not None
             assert result.month == i
+
+    def test_mixed_separators(self):
+        assert parse_date("1-Jan/24") is None
+
+    def test_invalid_day(self):
+        assert parse_date("30-Feb-24") is None
+
+    def test_two_digit_century_split(self):
+        assert parse_date("1-Jan-49") == date(2049, 1, 1)
+        assert parse_date("1-Jan-50") == date(1950, 1, 1)
+
+    def test_trailing_text_ignored(self):
+        assert parse_date("3-Dec-2024 (late)") == date(2024, 12, 3)
+
+
+class TestParseDates:
+    """Tests for parse_dates function."""
+
+    def test_matches_parse_date(self):
+        values = ["1-Jan-25", "9/Jun/17", "", "  ", "1-Xyz-24", "30-Feb-24", "1-Jan-25"]
+        result = parse_dates(values, 2025)
+
+        assert result.dtype == np.dtype("datetime64[D]")
+        assert result.astype(object).tolist() == [parse_date(v) for v in values]
+
+    def test_accepts_generators(self):
+        result = parse_dates(f"{day}-Mar-24" for day in range(1, 4))
+        assert result.tolist() == [date(2024, 3, 1), date(2024, 3, 2), date(2024, 3, 3)]
+
+    def test_empty(self):
+        assert len(parse_dates([])) == 0
@@ -3,7 +3,9 @@
 from datetime import date
 import pytest
 
-from etl.transform.reservation import transform_reservation, transform_rentals
+from etl.config.columns import COLUMN_MAPS, YEAR_LAYOUTS, get_column_map
+from etl.config.spreadsheets import SPREADSHEETS
+from etl.transform.reservation import ROW_FIELDS, row_decoder, transform_reservation, transform_rentals
 
 
 class TestTransformReservation:
@@ -83,24 +85,79 @@ class TestTransformReservation:
         assert result is None
 
 
+class TestRowDecoder:
+    """Tests for compiled row decoders and column map lookup."""
+
+    def test_every_rentals_year_has_a_layout(self):
+        for year, config in SPREADSHEETS.items():
+            if config.get("rentals_sheet"):
+                assert get_column_map(year) is COLUMN_MAPS[YEAR_LAYOUTS[year]]
+
+    def test_unknown_year(self):
+        with pytest.raises(ValueError):
+            get_column_map(2031)
+
+    def test_decodes_layout_columns(self, sample_2024_rental_row):
+        decoded = dict(zip(ROW_FIELDS, row_decoder(2024)(sample_2024_rental_row)))
+
+        assert decoded["platform"] == "Airbnb"
+        assert decoded["guest_name"] == "Jane Smith"
+        assert decoded["total_revenue"] == "$1,800"
+        assert decoded["cleaning_fee"] == "$300"
+
+    def test_short_rows_padded(self):
+        decoded = dict(zip(ROW_FIELDS, row_decoder(2024)(["Airbnb", "4-Jun-24"])))
+
+        assert decoded["check_in"] == "4-Jun-24"
+        assert decoded["guest_name"] == ""
+        assert decoded["cleaning_fee"] == ""
+
+    @pytest.mark.parametrize("length", [0, 5, 12, 20])
+    def test_missing_columns(self, length):
+        # 2017 has no platform, guest count or cleaning fee columns
+        row = [str(i) for i in range(length)]
+        decoded = dict(zip(ROW_FIELDS, row_decoder(2017)(row)))
+
+        assert decoded["platform"] == "offline"
+        assert decoded["guest_count"] == ""
+        assert decoded["cleaning_fee"] == ""
+        assert decoded["total_revenue"] == (row[11] if length > 11 else "")
+
+    def test_decoder_shared_by_years_with_same_layout(self):
+        assert row_decoder(2024) is row_decoder(2025)
+
+
+@pytest.fixture(params=["python", "pandas"])
+def engine(request) -> str:
+    """Each transform engine in turn."""
+    return request.param
+
+
 class TestTransformRentals:
     """Tests for transform_rentals function."""
 
-    def test_skips_header_row(self, sample_2024_rental_row):
+    def test_skips_header_row(self, sample_2024_rental_row, engine):
         # Header row followed by data row
         header = ["2024", "Check-in", "Check-out", "# nights", "Name"]
         raw_data = [header, sample_2024_rental_row]
 
-        result = transform_rentals(raw_data, 2024)
+        result = transform_rentals(raw_data, 2024, engine=engine)
 
         assert len(result) == 1
         assert result[0].guest_name == "Jane Smith"
 
-    def test_handles_empty_rows(self, sample_2024_rental_row):
+    def test_handles_empty_rows(self, sample_2024_rental_row, engine):
         header = ["2024", "Check-in", "Check-out", "# nights", "Name"]
         empty_row = [""] * 20
         raw_data = [header, sample_2024_rental_row, empty_row]
 
-        result = transform_rentals(raw_data, 2024)
+        result = transform_rentals(raw_data, 2024, engine=engine)
 
         assert len(result) == 1
+
+    def test_fast_validation_matches_strict(self, sample_2024_rental_row, engine):
+        header = ["2024", "Check-in", "Check-out", "# nights", "Name"]
+        raw_data = [header, sample_2024_rental_row, sample_2024_rental_row]
+
+        fast = transform_rentals(raw_data, 2024, "fast", engine)
+        assert fast == transform_rentals(raw_data, 2024, "strict", engine)
@@ -0,0 +1,148 @@
+"""Tests for the column-at-a-time transforms."""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl.config.columns import get_column_map
+from etl.transform.expense import (
+    _expenses_19_fields,
+    _multi_year_fields,
+    _pivot_fields,
+    transform_expenses,
+)
+from etl.transform.parsers import parse_count, parse_currency, parse_date
+from etl.transform.reservation import _reservation_fields, transform_rentals
+from etl.transform.vectorized import (
+    expense_records,
+    parse_count_column,
+    parse_currency_column,
+    parse_date_column,
+    reservation_records,
+)
+
+DATES = [
+    "1-Jan-24", "31-Dec-24", " 9/Jun/17 ", "9/Jun/2017", "29-Feb-24", "29-Feb-23",
+    "0-Jan-24", "1-Jan/24", "1-Foo-24", "01-jan-99", "3-Dec-2024abc", "123-Jan-24",
+    "1-Jan-245", "١-Jan-24", "", "   ", "Check-in",
+]
+AMOUNTS = [
+    "$1,234.56", "-$500", "- $50", "$-0", "1000", ".5", "5.", "$ 1 000", "(5)",
+    "1e3", "1_000", "inf", "$", "-", "", "  ", "abc", "1.2.3",
+]
+COUNTS = ["4", " 12 ", "0", "+3", "-2", "1_0", "٣", "99999999999999999999", "x", "", " "]
+
+
+def as_series(values: list[str]) -> pd.Series:
+    return pd.Series(values, dtype=object)
+
+
+class TestColumnParsers:
+    """Column parsers agree with the scalar parsers on every input."""
+
+    def test_dates(self):
+        result = parse_date_column(as_series(DATES))
+        expected = [parse_date(v) for v in DATES]
+        assert [None if np.isnat(d) else d.astype(object) for d in result] == expected
+
+    def test_currency(self):
+        result = parse_currency_column(as_series(AMOUNTS))
+        expected = np.array([parse_currency(v) for v in AMOUNTS])
+        np.testing.assert_array_equal(result, expected)
+        assert np.array_equal(np.signbit(result), np.signbit(expected))
+
+    def test_counts(self):
+        result = parse_count_column(as_series(COUNTS))
+        assert result.tolist() == [parse_count(v) for v in COUNTS]
+
+    def test_counts_stay_int64(self):
+        assert parse_count_column(as_series(["1", "2", ""])).dtype == np.int64
+
+
+class TestReservationRecords:
+    """reservation_records matches the row-by-row transform."""
+
+    @pytest.mark.parametrize("year", [2024, 2021, 2018, 2017])
+    def test_matches_scalar_rows(self, year):
+        col = get_column_map(year)
+        rows = []
+        for i, check_in in enumerate(DATES):
+            row = [""] * 16
+            if col.platform is not None:
+                row[col.platform] = ["Airbnb", " VRBO ", "Self", "", "foo"][i % 5]
+            row[col.check_in] = check_in
+            row[col.check_out] = DATES[(i + 3) % len(DATES)]
+            row[col.nights] = COUNTS[i % len(COUNTS)]
+            row[col.guest_name] = ["Jane", "Total", "Blocked", " Bob ", "", "NAME"][i % 6]
+            row[col.total_revenue] = AMOUNTS[i % len(AMOUNTS)]
+            rows.append(row[: 4 + i])  # Ragged, like trimmed sheet rows
+
+        expected = [f for f in (_reservation_fields(row, year) for row in rows) if f]
+        result = reservation_records(rows, year)
+
+        assert result == expected
+        assert [list(map(type, r.values())) for r in result] == [
+            list(map(type, r.values())) for r in expected
+        ]
+
+    def test_year_wraparound(self):
+        row = [""] * 15
+        row[0], row[1], row[2], row[4] = "Airbnb", "28-Dec-24", "2-Jan-24", "Jane"
+
+        result = reservation_records([row], 2024)
+
+        assert result[0]["check_out"] == date(2025, 1, 2)
+
+    def test_empty(self):
+        assert reservation_records([], 2024) == []
+
+
+EXPENSE_CELLS = [
+    "", "Cleaning", " Internet ", "cleaning ", "Total", "TYPE", "Category", "Grand Total",
+    "2017", " 2018 ", "+2017", "year", "Feb 2019", "Mar 20245", "none", "$1,234.56", "-$5", "abc",
+]
+
+
+class TestExpenseRecords:
+    """expense_records matches the row-by-row transforms."""
+
+    @pytest.fixture
+    def rows(self):
+        # Every cell value in every column, with rows of every length
+        n = len(EXPENSE_CELLS)
+        return [[EXPENSE_CELLS[(i * (j + 1) + j) % n] for j in range(i % 7)] for i in range(200)]
+
+    @pytest.mark.parametrize("format_type, year, scalar", [
+        ("pivot", 2019, _pivot_fields),
+        ("expenses_19", 2019, lambda row, year: _expenses_19_fields(row)),
+        ("multi_year", 2017, _multi_year_fields),
+        ("multi_year", 2018, _multi_year_fields),
+        ("unknown", 2020, _pivot_fields),
+    ])
+    def test_matches_scalar_rows(self, rows, format_type, year, scalar):
+        expected = [f for f in (scalar(row, year) for row in rows) if f]
+        result = expense_records(rows, year, format_type)
+
+        assert expected
+        assert result == expected
+        assert [list(map(type, r.values())) for r in result] == [
+            list(map(type, r.values())) for r in expected
+        ]
+
+    def test_expenses_19_year_from_month(self):
+        rows = [["Running cost", "Heating", "Oil", "$340.26", "Feb 2020"],
+                ["Running cost", "Heating", "Oil", "$10", "Feb"]]
+
+        result = transform_expenses([[]] + rows, 2019, "expenses_19", engine="pandas")
+
+        assert [e.year for e in result] == [2020, 2019]
+
+    def test_empty(self):
+        assert expense_records([], 2019, "pivot") == []
+
+
+def test_unknown_engine(sample_2024_rental_row):
+    with pytest.raises(ValueError):
+        transform_rentals([[], sample_2024_rental_row], 2024, engine="spark")
@@ -21,22 +21,16 @@ def render(data: ETLResult, year: int | None):
     title = "Expenses - All Time" if is_all_time else f"Expenses - {year}"
     st.header(title)
 
-    if is_all_time:
-        expenses = data.expenses
-    else:
-        expenses = data.expenses_by_year.get(year, [])
+    # Totals for the selected year, or all years when year is None
+    cube = data.cube
+    totals = cube.expenses(year)
 
-    if not expenses:
+    if not totals.count:
         st.warning(f"No expense data for {year}")
         return
 
-    # Calculate totals
-    total_expenses = sum(e.amount for e in expenses)
-
-    # Aggregate by type
-    by_type = {}
-    for e in expenses:
-        by_type[e.expense_type] = by_type.get(e.expense_type, 0) + e.amount
+    total_expenses = totals.amount
+    by_type = cube.amount_by_type(year)
 
     # Sort by amount
     sorted_expenses = sorted(by_type.items(), key=lambda x: -x[1])
@@ -60,7 +54,7 @@ def render(data: ETLResult, year: int | None):
 
     with chart_col1:
         st.subheader("Expense Breakdown")
-        expense_pie_chart(expenses, top_n=6)
+        expense_pie_chart(by_type, top_n=6)
 
     with chart_col2:
         st.subheader("Top Categories")
@@ -105,12 +99,12 @@ def render(data: ETLResult, year: int | None):
     st.subheader("Category Comparison Across Years")
 
     # Get all years with expense data
-    years_with_expenses = sorted([y for y in data.expenses_by_year.keys() if data.expenses_by_year[y]])
+    years_with_expenses = cube.expense_years
 
     if len(years_with_expenses) > 1:
         # Select categories to compare (multi-select)
-        categories = sorted(set(e.expense_type for e in data.expenses))
-        category_options = [c.title() for c in categories]
+        categories = {c.title(): c for c in sorted(cube.expense_types)}
+        category_options = list(categories)
         selected_categories = st.multiselect(
             "Select Categories",
             category_options,
@@ -122,12 +116,8 @@ def render(data: ETLResult, year: int | None):
             # Get data for selected categories across years
             category_data = []
             for y in years_with_expenses:
-                year_expenses = data.expenses_by_year.get(y, [])
                 for cat in selected_categories:
-                    category_total = sum(
-                        e.amount for e in year_expenses
-                        if e.expense_type.title() == cat
-                    )
+                    category_total = cube.expenses(y, categories[cat]).amount
                     category_data.append({"Year": y, "Amount": category_total, "Category": cat})
 
             if category_data:
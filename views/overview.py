@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import streamlit as st
 
+from etl.occupancy import year_range
 from etl.pipeline import ETLResult
 from components.charts import income_expense_chart, nights_pie_chart, platform_bar_chart
 from components.metrics import metric_card
@@ -20,29 +21,25 @@ def render(data: ETLResult, year: int | None):
     title = "Overview - All Time" if is_all_time else f"Overview - {year}"
     st.header(title)
 
-    # Get data for selected year or all years
-    if is_all_time:
-        reservations = data.reservations
-        expenses = data.expenses
-        num_years = len(data.reservations_by_year)
-    else:
-        reservations = data.reservations_by_year.get(year, [])
-        expenses = data.expenses_by_year.get(year, [])
-        num_years = 1
+    # Totals for the selected year, or all years when year is None
+    cube = data.cube
+    rentals = cube.reservations(year, is_rental=True)
 
     # Calculate metrics
-    rental_reservations = [r for r in reservations if r.is_rental]
-    total_revenue = sum(r.total_revenue for r in rental_reservations)
-    total_expenses = sum(e.amount for e in expenses)
+    total_revenue = rentals.revenue
+    total_expenses = cube.expenses(year).amount
     net_income = total_revenue - total_expenses
 
-    rented_nights = sum(r.nights for r in rental_reservations)
-    owner_nights = sum(r.nights for r in reservations if not r.is_rental)
-    total_nights = rented_nights + owner_nights
-    # For all time, don't show unoccupied (doesn't make sense across years)
-    unoccupied = max(0, 365 - total_nights) if not is_all_time else 0
+    booked_nights = rentals.nights
+    booking_count = rentals.count
 
-    booking_count = len(rental_reservations)
+    # Night usage from the booking calendar, so overlapping stays count once
+    years = cube.reservation_years if is_all_time else [year]
+    breakdowns = [data.occupancy.breakdown(*year_range(y)) for y in years]
+    rented_nights = sum(b.rented for b in breakdowns)
+    owner_nights = sum(b.owner for b in breakdowns)
+    unoccupied = sum(b.unoccupied for b in breakdowns)
+    total_days = rented_nights + owner_nights + unoccupied
 
     # Metrics row
     col1, col2, col3, col4 = st.columns(4)
@@ -80,21 +77,20 @@ def render(data: ETLResult, year: int | None):
 
     with chart_col3:
         st.subheader("Nights by Platform")
-        platform_bar_chart(rental_reservations)
+        platform_bar_chart(cube.nights_by_platform(year))
 
     with chart_col4:
         st.subheader("Quick Stats")
-        if rented_nights > 0:
-            avg_rate = total_revenue / rented_nights
+        if booked_nights > 0:
+            avg_rate = total_revenue / booked_nights
             st.metric("Avg Nightly Rate", f"${avg_rate:.0f}")
 
         if booking_count > 0:
-            avg_stay = rented_nights / booking_count
+            avg_stay = booked_nights / booking_count
             st.metric("Avg Stay Length", f"{avg_stay:.1f} nights")
 
+        occupancy = (rented_nights / total_days) * 100 if total_days else 0
         if is_all_time:
-            avg_occupancy = (rented_nights / (365 * num_years)) * 100
-            st.metric("Avg Occupancy Rate", f"{avg_occupancy:.0f}%")
+            st.metric("Avg Occupancy Rate", f"{occupancy:.0f}%")
         else:
-            occupancy = (rented_nights / 365) * 100
             st.metric("Occupancy Rate", f"{occupancy:.0f}%")
@@ -74,7 +74,10 @@ def render(data: ETLResult, year: int | None):
 
     with chart_col1:
         st.subheader("Nights by Platform")
-        platform_bar_chart(filtered)
+        platform_nights = {}
+        for r in rental_filtered:
+            platform_nights[r.platform] = platform_nights.get(r.platform, 0) + r.nights
+        platform_bar_chart(platform_nights)
 
     with chart_col2:
         st.subheader("Revenue by Platform")
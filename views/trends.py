@@ -7,6 +7,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
+from etl.occupancy import year_range
 from etl.pipeline import ETLResult
 
 
@@ -15,7 +16,8 @@ def render(data: ETLResult):
     st.header("Historical Trends")
 
     # Calculate yearly metrics
-    years = sorted(data.reservations_by_year.keys())
+    cube = data.cube
+    years = list(cube.reservation_years)
 
     revenue_by_year = {}
     expenses_by_year = {}
@@ -24,22 +26,19 @@ def render(data: ETLResult):
     revenue_by_platform_year = {}  # {year: {platform: revenue}}
 
     for year in years:
-        reservations = data.reservations_by_year.get(year, [])
-        expenses = data.expenses_by_year.get(year, [])
+        revenue_by_year[year] = cube.reservations(year, is_rental=True).revenue
+        expenses_by_year[year] = cube.expenses(year).amount
 
-        rentals = [r for r in reservations if r.is_rental]
-        owner_stays = [r for r in reservations if not r.is_rental]
-
-        revenue_by_year[year] = sum(r.total_revenue for r in rentals)
-        expenses_by_year[year] = sum(e.amount for e in expenses)
-        nights_rented_by_year[year] = sum(r.nights for r in rentals)
-        nights_owner_by_year[year] = sum(r.nights for r in owner_stays)
+        # From the booking calendar, so overlapping stays count once
+        nights = data.occupancy.breakdown(*year_range(year))
+        nights_rented_by_year[year] = nights.rented
+        nights_owner_by_year[year] = nights.owner
 
         # Revenue by platform
         platform_revenue = {"airbnb": 0, "vrbo": 0, "offline": 0}
-        for r in rentals:
-            platform = r.platform if r.platform in platform_revenue else "offline"
-            platform_revenue[platform] += r.total_revenue
+        for platform in cube.platforms:
+            key = platform if platform in platform_revenue else "offline"
+            platform_revenue[key] += cube.reservations(year, platform, is_rental=True).revenue
         revenue_by_platform_year[year] = platform_revenue
 
     # Layout: 2 columns for charts